@@ -1,13 +1,30 @@
+from base import search
 from base.models import *
+from base.imagespecs import admin_thumbnail_url
+from base.changelist import CachedAllValuesFieldListFilter, CachedRelatedFieldListFilter, PerformanceModeMixin
 from django.contrib import admin
 from django.utils.html import format_html
 
+class FullTextSearchMixin:
+    """
+    Changelist search through the FTS5 index in base.search, in every
+    language at once, instead of LIKE '%term%' over each of search_fields.
+    search_fields is kept: it turns the search box on, and is the fallback
+    on databases without FTS5.
+    """
+
+    def get_search_results(self, request, queryset, search_term):
+        if not search_term.strip() or not search.available():
+            return super().get_search_results(request, queryset, search_term)
+        return search.matching(queryset, search_term), False
+
 @admin.register(MassSchedule)
-class MassScheduleAdmin(admin.ModelAdmin):
+class MassScheduleAdmin(PerformanceModeMixin, admin.ModelAdmin):
     # Columns shown in the changelist
-    list_display   = ('date', 'start_time', 'end_time', 'mass_type')
-    list_filter    = ('mass_type', 'date')
+    list_display   = ('date', 'start_time', 'end_time', 'mass_type', 'rule', 'cancelled')
+    list_filter    = ('mass_type', 'cancelled', 'date')
     ordering       = ('-date', 'start_time')
+    list_select_related = ('rule',)
     list_per_page  = 20
 
     # Group and label fields for clarity; collapse verbose descriptions by default
@@ -16,10 +33,43 @@ class MassScheduleAdmin(admin.ModelAdmin):
             'fields': ('date', ('start_time', 'end_time'), 'mass_type'),
             'description': 'Pick the date, times and whether it’s a morning or evening Mass.'
         }),
+        ('Recurring Mass', {
+            'fields': ('rule', 'cancelled'),
+            'description': 'To move or cancel one date of a recurring Mass, pick it here; leave empty for a one-off Mass.'
+        }),
+    )
+
+class MassOverrideInline(admin.TabularInline):
+    model = MassSchedule
+    fields = ('date', 'start_time', 'end_time', 'mass_type', 'cancelled')
+    ordering = ('-date',)
+    extra = 0
+    verbose_name = "Change on one date"
+    verbose_name_plural = "Changes on single dates"
+
+@admin.register(MassRule)
+class MassRuleAdmin(PerformanceModeMixin, admin.ModelAdmin):
+    list_display   = ('mass_type', 'start_time', 'end_time', 'days_display', 'starts_on', 'ends_on')
+    list_filter    = ('mass_type',)
+    ordering       = ('start_time',)
+    inlines        = (MassOverrideInline,)
+
+    fieldsets = (
+        ('Recurring Mass', {
+            'fields': ('mass_type', ('start_time', 'end_time')),
+        }),
+        ('Days', {
+            'fields': (('monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday'),),
+            'description': 'The Mass is held every week on the ticked days.'
+        }),
+        ('Period', {
+            'fields': (('starts_on', 'ends_on'),),
+            'description': 'Leave the end empty for a Mass with no planned end.'
+        }),
     )
 
 @admin.register(Homily)
-class HomilyAdmin(admin.ModelAdmin):
+class HomilyAdmin(FullTextSearchMixin, PerformanceModeMixin, admin.ModelAdmin):
     # Columns in the changelist view
     list_display   = ('published_at', 'title_en', 'image_preview')
     list_filter    = ('published_at',)
@@ -58,13 +108,13 @@ class HomilyAdmin(admin.ModelAdmin):
         if obj.image:
             return format_html(
                 '<img src="{}" width="50" style="object-fit: cover; border-radius:4px;" />',
-                obj.image.url
+                admin_thumbnail_url(obj.image)
             )
         return "(No image)"
     image_preview.short_description = 'Preview'
 
 @admin.register(Event)
-class EventAdmin(admin.ModelAdmin):
+class EventAdmin(FullTextSearchMixin, PerformanceModeMixin, admin.ModelAdmin):
     """
     Admin interface for Event:
     - Searchable multilingual fields
@@ -111,13 +161,13 @@ class EventAdmin(admin.ModelAdmin):
         if obj.image:
             return format_html(
                 '<img src="{}" width="30" style="object-fit: cover; border-radius:4px;" />',
-                obj.image.url
+                admin_thumbnail_url(obj.image)
             )
         return "(No image)"
     image_preview.short_description = 'Banner Preview'
 
 @admin.register(Testimony)
-class TestimonyAdmin(admin.ModelAdmin):
+class TestimonyAdmin(PerformanceModeMixin, admin.ModelAdmin):
     """
     Admin interface for Testimony:
     - Display name, email, type, status, and creation date
@@ -166,7 +216,7 @@ class TestimonyAdmin(admin.ModelAdmin):
     file_link.short_description = "Uploaded File"
 
 @admin.register(Advertisement)
-class AdvertisementAdmin(admin.ModelAdmin):
+class AdvertisementAdmin(FullTextSearchMixin, PerformanceModeMixin, admin.ModelAdmin):
     """
     Admin interface for Advertisement:
     - Show publication date, English title, and image preview
@@ -209,7 +259,7 @@ class AdvertisementAdmin(admin.ModelAdmin):
         if obj.image:
             return format_html(
                 '<img src="{}" width="30" style="object-fit: cover; border-radius:4px;" />',
-                obj.image.url
+                admin_thumbnail_url(obj.image)
             )
         return "(No image)"
     image_preview.short_description = "Image Preview"
@@ -234,7 +284,7 @@ class RoomImageInline(admin.TabularInline):
     fields = ('image', 'alt_text', 'image_tag')
 
 @admin.register(Room)
-class RoomAdmin(admin.ModelAdmin):
+class RoomAdmin(PerformanceModeMixin, admin.ModelAdmin):
     """
     Admin interface for Room:
     - Manage title, slug, location, description, price, & amenities
@@ -242,10 +292,14 @@ class RoomAdmin(admin.ModelAdmin):
     - Show thumbnail previews of room images
     """
     list_display   = ('title', 'location', 'price_per_night', 'thumbnail_preview')
-    list_filter    = ('location', 'amenities')
+    list_filter    = (
+        ('location', CachedAllValuesFieldListFilter),
+        ('amenities', CachedRelatedFieldListFilter),
+    )
     search_fields  = ('title', 'location', 'description')
     ordering       = ('title',)
     list_per_page  = 20
+    list_prefetch_related = (cover_images_prefetch(),)
 
     fieldsets = (
         (None, {
@@ -267,20 +321,48 @@ class RoomAdmin(admin.ModelAdmin):
 
     def thumbnail_preview(self, obj):
         """
-        Show the first image as a small preview.
+        Show the cover image (prefetched for the whole page) as a small preview.
         """
-        first_image = obj.images.first()
-        if first_image:
+        cover_image = obj.cover_image
+        if cover_image:
             return format_html(
                 '<img src="{}" width="100" style="object-fit: cover; border-radius:4px;"/>',
-                first_image.image.url
+                admin_thumbnail_url(cover_image.image)
             )
         return "(No image)"
 
     thumbnail_preview.short_description = 'Thumbnail'
 
+@admin.register(Booking)
+class BookingAdmin(PerformanceModeMixin, admin.ModelAdmin):
+    """
+    Admin interface for Booking:
+    - Stays by date, with the room and guest
+    - Confirm or cancel; a cancelled booking frees its nights
+    - Overlapping stays are refused when saved
+    """
+    list_display   = ('check_in', 'check_out', 'room', 'guest_name', 'status', 'total_price')
+    list_filter    = ('status', 'check_in')
+    list_editable  = ('status',)
+    search_fields  = ('guest_name', 'guest_email')
+    ordering       = ('-check_in',)
+    list_select_related = ('room',)
+    autocomplete_fields = ('room',)
+    list_per_page  = 20
+
+    fieldsets = (
+        ('Stay', {
+            'fields': ('room', ('check_in', 'check_out'), 'status', 'total_price'),
+            'description': 'The check-out night is not booked. The price is set from the room’s rate when the booking is made.'
+        }),
+        ('Guest', {
+            'fields': ('guest_name', 'guest_email', 'guest_phone'),
+        }),
+    )
+    readonly_fields = ('total_price',)
+
 @admin.register(Gallery)
-class GalleryAdmin(admin.ModelAdmin):
+class GalleryAdmin(FullTextSearchMixin, PerformanceModeMixin, admin.ModelAdmin):
     """
     Admin interface for Gallery:
     - Show created_at, English caption, and a thumbnail
@@ -314,14 +396,14 @@ class GalleryAdmin(admin.ModelAdmin):
         if obj.image:
             return format_html(
                 '<img src="{}" width="150" style="object-fit: cover; border-radius:4px;" />',
-                obj.image.url,
+                admin_thumbnail_url(obj.image),
             )
         return "(No image)"
 
     image_preview.short_description = "Thumbnail"
 
 @admin.register(Member)
-class MemberAdmin(admin.ModelAdmin):
+class MemberAdmin(PerformanceModeMixin, admin.ModelAdmin):
     """
     Admin interface for Member:
     - Show name, role, and thumbnail
@@ -352,14 +434,14 @@ class MemberAdmin(admin.ModelAdmin):
         if obj.image:
             return format_html(
                 '<img src="{}" width="75" height="75" style="object-fit: cover; border-radius:50%;" />',
-                obj.image.url
+                admin_thumbnail_url(obj.image)
             )
         return "(No image)"
 
     thumbnail.short_description = "Portrait"
 
 @admin.register(HealingPrayer)
-class HealingPrayerAdmin(admin.ModelAdmin):
+class HealingPrayerAdmin(FullTextSearchMixin, PerformanceModeMixin, admin.ModelAdmin):
     list_display = ('title_en', 'created_at', 'image_preview')
     list_filter = ('created_at',)
     search_fields = ('title_en', 'title_fr', 'title_rw', 'title_sw', 'content_en', 'content_fr', 'content_rw', 'content_sw')
@@ -379,7 +461,26 @@ class HealingPrayerAdmin(admin.ModelAdmin):
         if obj.image:
             return format_html(
                 '<img src="{}" width="50" style="object-fit: cover; border-radius:4px;" />',
-                obj.image.url
+                admin_thumbnail_url(obj.image)
             )
         return "(No image)"
-    image_preview.short_description = 'Image Preview'
\ No newline at end of file
+    image_preview.short_description = 'Image Preview'
+
+
+@admin.register(ImageJob)
+class ImageJobAdmin(PerformanceModeMixin, admin.ModelAdmin):
+    """
+    Read-only view of the image processing queue, mainly to spot failed
+    jobs; the process_images worker is the only writer.
+    """
+    list_display  = ('model', 'object_id', 'field_name', 'status', 'attempts', 'run_after')
+    list_filter   = ('status', 'model')
+    ordering      = ('run_after', 'id')
+    list_per_page = 20
+    readonly_fields = [field.name for field in ImageJob._meta.fields]
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
@@ -0,0 +1,303 @@
+import datetime
+import hashlib
+from django.conf import settings
+from django.utils import timezone
+from rest_framework import mixins, routers, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+from base.cache import get_or_build
+from base.models import *
+from base.pagination import CursorPaginator, InvalidCursor
+from base.schedule import occurrences
+from base.serializers import *
+from django.core.exceptions import ValidationError as DjangoValidationError
+# After the star imports, which bring in Django's ValidationError
+from rest_framework.exceptions import APIException, NotFound, ValidationError
+from rest_framework.throttling import ScopedRateThrottle
+
+class Conflict(APIException):
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = "The request conflicts with the current state of the resource."
+    default_code = "conflict"
+
+class KeysetPagination(BasePagination):
+    """
+    base.pagination.CursorPaginator behind DRF's pagination interface:
+    opaque ?cursor= links walk the view's index-backed `ordering` with no
+    COUNT(*) or OFFSET, so the last page costs what the first does.
+    """
+
+    page_size = 20
+    max_page_size = 100
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params.get("page_size", self.page_size))
+        except ValueError:
+            raise ValidationError({"page_size": ["A whole number is required."]})
+        return min(max(size, 1), self.max_page_size)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        paginator = CursorPaginator(queryset, self.get_page_size(request), view.ordering)
+        try:
+            self.page = paginator.page(request.query_params.get("cursor"))
+        except InvalidCursor:
+            raise NotFound("Invalid cursor.")
+        return list(self.page)
+
+    def link(self, cursor):
+        if cursor is None:
+            return None
+        return replace_query_param(self.request.build_absolute_uri(), "cursor", cursor)
+
+    def get_paginated_response(self, data):
+        return Response({
+            "next": self.link(self.page.next_cursor),
+            "previous": self.link(self.page.previous_cursor),
+            "results": data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+class ContentViewSet(viewsets.ReadOnlyModelViewSet):
+    """
+    Read-only endpoint over one public model.  Every endpoint of the API
+    is one of these, except bookings (BookingViewSet), which only accepts
+    new booking requests.
+
+    ?lang=fr returns French text under the plain field names (English by
+    default) and ?fields=id,title a sparse fieldset; only the columns those
+    fields read are SELECTed.  Serialized responses are cached per endpoint
+    and dropped by base.signals when any model in `cache_sources` changes.
+    """
+
+    pagination_class = KeysetPagination
+    # Index-backed keyset order, as on the matching HTML list page
+    ordering = ("-created_at",)
+    # Models whose rows the responses render
+    cache_sources = ()
+
+    @classmethod
+    def namespace(cls):
+        return f"api:{cls.queryset.model._meta.label_lower}"
+
+    def get_lang(self):
+        lang = self.request.query_params.get("lang", LANGUAGE_CODES[0])
+        if lang not in LANGUAGE_CODES:
+            raise ValidationError({"lang": [f"Choose one of {', '.join(LANGUAGE_CODES)}."]})
+        return lang
+
+    def get_fieldset(self):
+        fields = self.request.query_params.get("fields")
+        if not fields:
+            return ()
+        fields = tuple(sorted({name.strip() for name in fields.split(",") if name.strip()}))
+        unknown = set(fields) - set(self.serializer_class.Meta.fields)
+        if unknown:
+            raise ValidationError({"fields": [f"Unknown fields: {', '.join(sorted(unknown))}."]})
+        return fields
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context["lang"] = self.get_lang()
+        context["fields"] = self.get_fieldset()
+        return context
+
+    def get_queryset(self):
+        columns = self.get_serializer().columns()
+        if self.action == "list":
+            columns |= {name.lstrip("-") for name in self.ordering}
+        return super().get_queryset().only(*columns)
+
+    def cached(self, parts, build):
+        """
+        Serialized payload for this request, from the cache when possible.
+        Links and file URLs are absolute, so the host is part of the key.
+        """
+        parts = [
+            self.request.version, self.request.build_absolute_uri("/"),
+            self.get_lang(), ",".join(self.get_fieldset()), *parts,
+        ]
+        digest = hashlib.md5(repr(parts).encode(), usedforsecurity=False).hexdigest()
+        return get_or_build(self.namespace(), [digest], build, timeout=settings.API_CACHE_TIMEOUT)
+
+    def list(self, request, *args, **kwargs):
+        params = request.query_params
+        data = self.cached(
+            ["list", params.get("cursor"), params.get("page_size")],
+            lambda: super(ContentViewSet, self).list(request, *args, **kwargs).data,
+        )
+        return Response(data)
+
+    def retrieve(self, request, *args, **kwargs):
+        data = self.cached(
+            ["detail", kwargs[self.lookup_field]],
+            lambda: super(ContentViewSet, self).retrieve(request, *args, **kwargs).data,
+        )
+        return Response(data)
+
+class MassScheduleViewSet(ContentViewSet):
+    """
+    The list and detail endpoints serve stored rows: one-off Masses and
+    the dates a recurring Mass was moved or cancelled.  /upcoming/ serves
+    the schedule as the site shows it, ?weeks= (at most MAX_WEEKS) of it
+    from ?from=<date>, today by default.
+    """
+    queryset = MassSchedule.objects.all()
+    serializer_class = MassScheduleSerializer
+    ordering = ("-id",)
+    cache_sources = (MassSchedule, MassRule)
+
+    MAX_WEEKS = 8
+
+    def get_window(self):
+        params = self.request.query_params
+        try:
+            start = datetime.date.fromisoformat(params["from"]) if "from" in params else timezone.localdate()
+        except ValueError:
+            raise ValidationError({"from": ["A date in YYYY-MM-DD format is required."]})
+        try:
+            weeks = int(params.get("weeks", settings.MASS_SCHEDULE_WEEKS))
+        except ValueError:
+            raise ValidationError({"weeks": ["A whole number is required."]})
+        if not 1 <= weeks <= self.MAX_WEEKS:
+            raise ValidationError({"weeks": [f"Choose between 1 and {self.MAX_WEEKS} weeks."]})
+        try:
+            return start, start + datetime.timedelta(weeks=weeks)
+        except OverflowError:
+            raise ValidationError({"from": ["The date is out of range."]})
+
+    @action(detail=False)
+    def upcoming(self, request, *args, **kwargs):
+        start, end = self.get_window()
+        data = self.cached(
+            ["upcoming", start.isoformat(), end.isoformat()],
+            lambda: self.get_serializer(occurrences(start, end), many=True).data,
+        )
+        return Response(data)
+
+class HomilyViewSet(ContentViewSet):
+    queryset = Homily.objects.all()
+    serializer_class = HomilySerializer
+    ordering = ("-published_at", "-created_at")
+    cache_sources = (Homily,)
+
+class EventViewSet(ContentViewSet):
+    queryset = Event.objects.all()
+    serializer_class = EventSerializer
+    ordering = ("-event_date", "-created_at")
+    cache_sources = (Event,)
+
+class AdvertisementViewSet(ContentViewSet):
+    queryset = Advertisement.objects.all()
+    serializer_class = AdvertisementSerializer
+    ordering = ("-published_at", "-created_at")
+    cache_sources = (Advertisement,)
+
+class RoomViewSet(ContentViewSet):
+    queryset = Room.objects.all()
+    serializer_class = RoomSerializer
+    cache_sources = (Room, RoomImage, Amenity, Room.amenities.through)
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        fields = self.get_serializer().fields
+        if "images" in fields:
+            queryset = queryset.prefetch_related("images")
+        if "amenities" in fields:
+            queryset = queryset.prefetch_related("amenities")
+        return queryset
+
+    @action(detail=False)
+    def available(self, request, *args, **kwargs):
+        """
+        Rooms free for every night from ?check_in= up to ?check_out=, with
+        all of ?amenities= (names, comma-separated) and a nightly rate of at
+        most ?max_price=, cheapest first.  Bookings change by the minute,
+        so unlike the other lists this one is never cached.
+        """
+        query = AvailabilitySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        stay = query.validated_data
+        self.ordering = ("price_per_night", "id")
+        rooms = self.get_queryset().available(
+            stay["check_in"], stay["check_out"],
+            amenities=stay.get("amenities", ()), max_price=stay.get("max_price"),
+        )
+        page = self.paginate_queryset(rooms)
+        return self.get_paginated_response(self.get_serializer(page, many=True).data)
+
+class GalleryViewSet(ContentViewSet):
+    queryset = Gallery.objects.all()
+    serializer_class = GallerySerializer
+    cache_sources = (Gallery,)
+
+class MemberViewSet(ContentViewSet):
+    queryset = Member.objects.all()
+    serializer_class = MemberSerializer
+    ordering = ("-id",)
+    cache_sources = (Member,)
+
+class HealingPrayerViewSet(ContentViewSet):
+    queryset = HealingPrayer.objects.all()
+    serializer_class = HealingPrayerSerializer
+    cache_sources = (HealingPrayer,)
+
+class TestimonyViewSet(ContentViewSet):
+    queryset = Testimony.objects.filter(status=Testimony.PUBLISHED)
+    serializer_class = TestimonySerializer
+    cache_sources = (Testimony,)
+
+class BookingViewSet(mixins.CreateModelMixin, viewsets.GenericViewSet):
+    """
+    POST a booking request: the one endpoint that writes, and is rate
+    limited per client instead of cached.  A 409 means the room was taken
+    for some of the nights, possibly by a request that arrived a moment
+    earlier.  Booking requests are never read back through the API.
+    """
+    queryset = Booking.objects.all()
+    serializer_class = BookingSerializer
+    throttle_classes = (ScopedRateThrottle,)
+    throttle_scope = "bookings"
+    # Nothing is cached
+    cache_sources = ()
+
+    def perform_create(self, serializer):
+        try:
+            serializer.save()
+        except RoomUnavailable as error:
+            raise Conflict(error.messages[0])
+        except DjangoValidationError as error:
+            raise ValidationError(error.message_dict if hasattr(error, "error_dict") else error.messages)
+        except Room.DoesNotExist:
+            # Deleted between the serializer's lookup and the booking lock
+            raise ValidationError({"room": ["This room no longer exists."]})
+
+router = routers.DefaultRouter()
+router.register("mass-schedules", MassScheduleViewSet, basename="massschedule")
+router.register("homilies", HomilyViewSet, basename="homily")
+router.register("events", EventViewSet, basename="event")
+router.register("advertisements", AdvertisementViewSet, basename="advertisement")
+router.register("rooms", RoomViewSet, basename="room")
+router.register("gallery", GalleryViewSet, basename="gallery")
+router.register("members", MemberViewSet, basename="member")
+router.register("healing-prayers", HealingPrayerViewSet, basename="healingprayer")
+router.register("testimonies", TestimonyViewSet, basename="testimony")
+router.register("bookings", BookingViewSet, basename="booking")
+
+def namespaces_for(model):
+    """
+    Cache namespaces of the endpoints whose responses render `model`.
+    """
+    return [viewset.namespace() for _, viewset, _ in router.registry if model in viewset.cache_sources]
@@ -0,0 +1,36 @@
+from django.db import transaction
+from django.db.models import F
+from base.models import Booking, Room
+
+def lock_room(room_id):
+    """
+    Take `room_id`'s booking lock for the rest of the transaction.
+
+    Bumping booking_version holds the room's row lock on Postgres and
+    MySQL, and the database write lock on SQLite, until the commit: the
+    portable form of SELECT ... FOR UPDATE, which SQLite does not have.
+    It has to be the transaction's first statement, so that on SQLite
+    every read after it sees the bookings committed before it.
+    """
+    if not Room.objects.filter(pk=room_id).update(booking_version=F("booking_version") + 1):
+        raise Room.DoesNotExist(f"Room {room_id} no longer exists.")
+
+def book(room, check_in, check_out, **guest):
+    """
+    Create a pending Booking of `room` for the nights from check_in up to
+    check_out, or raise RoomUnavailable when any of them is taken, or
+    ValidationError for a stay that is not allowed.
+
+    Two requests for the same nights must never both find them free, so
+    the check and the insert run under the room's lock: a concurrent
+    booking of the room waits in lock_room() and then finds this one.
+    """
+    with transaction.atomic():
+        lock_room(room.pk)
+        booking = Booking(room_id=room.pk, check_in=check_in, check_out=check_out, **guest)
+        booking.clean_fields(exclude=["total_price"])
+        # Not full_clean(), which would fold RoomUnavailable into a plain
+        # ValidationError
+        booking.clean()
+        booking.save()
+    return booking
@@ -0,0 +1,55 @@
+import time
+from django.core.cache import cache
+
+def version_key(namespace):
+    return f"{namespace}:version"
+
+def get_version(namespace):
+    """
+    Current version number of a cache namespace.  Missing versions are
+    seeded from the clock so a cache flush never resurrects an old key.
+    """
+    key = version_key(namespace)
+    version = cache.get(key)
+    if version is None:
+        version = int(time.time())
+        cache.add(key, version, None)
+        version = cache.get(key, version)
+    return version
+
+def bump_version(namespace):
+    """
+    Invalidate everything stored under `namespace` by moving its version on.
+    Old entries are never deleted explicitly; they simply become unreachable
+    and age out of the cache.
+    """
+    key = version_key(namespace)
+    try:
+        version = cache.incr(key)
+        # Backends without a native incr (files, database) write the new
+        # value back with the default timeout; versions must not expire.
+        cache.touch(key, None)
+        return version
+    except ValueError:
+        version = int(time.time())
+        cache.set(key, version, None)
+        return version
+
+def versioned_key(namespace, *parts):
+    """
+    e.g. versioned_key("home", "fr") -> "home:v1718000000:fr"
+    """
+    suffix = ":".join(str(part) for part in parts)
+    return f"{namespace}:v{get_version(namespace)}:{suffix}"
+
+def get_or_build(namespace, parts, builder, timeout=None):
+    """
+    Return the cached payload for (namespace, *parts), building and storing
+    it with `builder()` on a miss.
+    """
+    key = versioned_key(namespace, *parts)
+    payload = cache.get(key)
+    if payload is None:
+        payload = builder()
+        cache.set(key, payload, timeout)
+    return payload
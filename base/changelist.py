@@ -0,0 +1,180 @@
+import hashlib
+from functools import partial
+from django.conf import settings
+from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
+from django.core.cache import cache
+from django.core.paginator import EmptyPage, Paginator
+from django.db import DatabaseError, connections
+from django.db.models import Count
+from django.utils.functional import cached_property
+from base.cache import get_or_build, versioned_key
+
+def filters_namespace(model):
+    """
+    Cache namespace of the filter choices built from `model`'s rows; see
+    base.signals for what bumps it.
+    """
+    return f"admin_filters:{model._meta.label_lower}"
+
+def estimated_count(model, using="default"):
+    """
+    The row count the database keeps in its planner statistics, or None
+    when there are none.  Close enough for a changelist total and free,
+    where COUNT(*) reads the whole table.  Postgres and MySQL maintain
+    theirs as they go; SQLite's sqlite_stat1 only moves on when ANALYZE
+    runs, which nothing does on its own, so SQLite gets None.
+    """
+    connection = connections[using]
+    table = model._meta.db_table
+    queries = {
+        "postgresql": ("SELECT reltuples FROM pg_class WHERE oid = %s::regclass", [table]),
+        "mysql": (
+            "SELECT table_rows FROM information_schema.tables "
+            "WHERE table_schema = DATABASE() AND table_name = %s", [table],
+        ),
+    }
+    if connection.vendor not in queries:
+        return None
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(*queries[connection.vendor])
+            row = cursor.fetchone()
+    except DatabaseError:
+        # e.g. sqlite_stat1 does not exist until the first ANALYZE
+        return None
+    if row is None or row[0] is None:
+        return None
+    estimate = int(row[0])
+    return estimate if estimate >= 0 else None
+
+def nulls_last(value):
+    return (value is None, value)
+
+class LargeTablePaginator(Paginator):
+    """
+    A Paginator whose count stays cheap on large tables.  Up to
+    ADMIN_COUNT_THRESHOLD rows the count is exact, from a COUNT(*) over a
+    LIMITed subquery that stops there.  Past it, an unfiltered changelist
+    takes the planner's estimate where the database keeps one, and
+    otherwise an exact count cached for ADMIN_CACHE_TIMEOUT seconds.
+
+    Either may have fallen behind the table.  Rather than send a page past
+    the end of a low total back to the first page, the rows are counted
+    exactly (and the cached count refreshed) before a page is called empty.
+    """
+
+    approximate = False
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list.order_by()
+        threshold = settings.ADMIN_COUNT_THRESHOLD
+        count = queryset[:threshold + 1].count()
+        if count <= threshold:
+            return count
+
+        self.approximate = True
+        if not queryset.query.where:
+            estimate = estimated_count(queryset.model, queryset.db)
+            if estimate is not None:
+                return max(estimate, count)
+        return get_or_build(
+            "admin_counts", self.count_key(queryset), queryset.count,
+            timeout=settings.ADMIN_CACHE_TIMEOUT,
+        )
+
+    def count_key(self, queryset):
+        sql, params = queryset.query.sql_with_params()
+        digest = hashlib.md5(repr((sql, params)).encode()).hexdigest()
+        return [queryset.db, digest]
+
+    def validate_number(self, number):
+        try:
+            return super().validate_number(number)
+        except EmptyPage:
+            if not self.approximate:
+                raise
+        queryset = self.object_list.order_by()
+        count = queryset.count()
+        cache.set(versioned_key("admin_counts", *self.count_key(queryset)), count, settings.ADMIN_CACHE_TIMEOUT)
+        self.approximate = False
+        self.__dict__["count"] = count
+        self.__dict__.pop("num_pages", None)
+        return super().validate_number(number)
+
+class CachedAllValuesFieldListFilter(admin.AllValuesFieldListFilter):
+    """
+    AllValuesFieldListFilter runs SELECT DISTINCT over the whole table on
+    every changelist view; keep the values in the cache instead.  A column
+    with more than ADMIN_FILTER_MAX_CHOICES values offers the most common
+    ones, as thousands of links would cost more to render than to query.
+    """
+
+    def __init__(self, field, request, params, model, model_admin, field_path):
+        super().__init__(field, request, params, model, model_admin, field_path)
+        if settings.ADMIN_PERFORMANCE_MODE:
+            self.lookup_choices = get_or_build(
+                filters_namespace(model), ["values", field_path],
+                partial(self.build_choices, model_admin.get_queryset(request)),
+                timeout=settings.ADMIN_CACHE_TIMEOUT,
+            )
+            if self.lookup_val is not None and self.lookup_val not in self.lookup_choices:
+                self.lookup_choices = sorted([*self.lookup_choices, self.lookup_val], key=nulls_last)
+
+    def build_choices(self, queryset):
+        limit = settings.ADMIN_FILTER_MAX_CHOICES
+        values = list(self.lookup_choices[:limit + 1])
+        if len(values) <= limit:
+            return values
+        common = (
+            queryset.order_by().values(self.field_path)
+            .annotate(rows=Count("pk")).order_by("-rows")
+            .values_list(self.field_path, flat=True)[:limit]
+        )
+        return sorted(common, key=nulls_last)
+
+class CachedRelatedFieldListFilter(admin.RelatedFieldListFilter):
+    """
+    RelatedFieldListFilter with its (pk, label) choices kept in the cache.
+    """
+
+    def field_choices(self, field, request, model_admin):
+        build = partial(super().field_choices, field, request, model_admin)
+        if not settings.ADMIN_PERFORMANCE_MODE:
+            return build()
+        return get_or_build(
+            filters_namespace(field.remote_field.model), ["choices", self.field_path],
+            build, timeout=settings.ADMIN_CACHE_TIMEOUT,
+        )
+
+class PerformanceChangeList(ChangeList):
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        return queryset.prefetch_related(*self.model_admin.list_prefetch_related)
+
+class PerformanceModeMixin:
+    """
+    Changelists that stay fast on tables of hundreds of thousands of rows
+    while settings.ADMIN_PERFORMANCE_MODE is on: counts through
+    LargeTablePaginator, no second COUNT(*) for the "n total" link, and
+    list_prefetch_related (the prefetch_related counterpart of
+    list_select_related) loaded for the page's rows only.
+    """
+
+    list_prefetch_related = ()
+
+    @property
+    def show_full_result_count(self):
+        return not settings.ADMIN_PERFORMANCE_MODE
+
+    def get_paginator(self, request, queryset, per_page, orphans=0, allow_empty_first_page=True):
+        if not settings.ADMIN_PERFORMANCE_MODE:
+            return super().get_paginator(request, queryset, per_page, orphans, allow_empty_first_page)
+        return LargeTablePaginator(queryset, per_page, orphans, allow_empty_first_page)
+
+    def get_changelist(self, request, **kwargs):
+        if not settings.ADMIN_PERFORMANCE_MODE:
+            return super().get_changelist(request, **kwargs)
+        return PerformanceChangeList
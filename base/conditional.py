@@ -0,0 +1,54 @@
+import hashlib
+from django.shortcuts import render
+from django.utils.http import http_date, quote_etag
+from django.utils.cache import get_conditional_response
+
+def page_validators(rows, lang, *extra, timestamp="updated_at"):
+    """
+    ETag and Last-Modified for a page built from `rows`.
+
+    The ETag hashes the language, each row's primary key and timestamp and
+    any `extra` values (e.g. the total count shown in the header), so adding,
+    editing or removing a row on the page all change it.
+
+    Last-Modified is only sent for a single-object page.  On a list the
+    newest timestamp stays put, or moves backwards, when a row is deleted or
+    drops off the page, so a client revalidating with If-Modified-Since
+    alone would get a stale 304; lists rely on the ETag.
+    """
+    stamps = [getattr(row, timestamp) for row in rows]
+    digest = hashlib.md5(usedforsecurity=False)
+    digest.update(lang.encode())
+    for row, stamp in zip(rows, stamps):
+        digest.update(f"|{row.pk}:{stamp.isoformat()}".encode())
+    for value in extra:
+        digest.update(f"|{value}".encode())
+    last_modified = int(stamps[0].timestamp()) if len(rows) == 1 and not extra else None
+    return quote_etag(digest.hexdigest()), last_modified
+
+def render_conditional(request, template_name, context, rows, lang, *extra, timestamp="updated_at"):
+    """
+    render() that answers a matching If-None-Match / If-Modified-Since with
+    a 304 before the template is rendered, and sends the validators on 200s.
+    """
+    etag, last_modified = page_validators(rows, lang, *extra, timestamp=timestamp)
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        response = render(request, template_name, context)
+
+    response.headers.setdefault("ETag", etag)
+    if last_modified is not None:
+        response.headers.setdefault("Last-Modified", http_date(last_modified))
+    return response
+
+def render_page(request, template_name, context, lang):
+    """
+    render_conditional() for a paginated list context from base.pagination.
+    """
+    page_obj = context["page_obj"]
+    paginator = getattr(page_obj, "paginator", None)
+    return render_conditional(
+        request, template_name, context, list(page_obj), lang,
+        paginator.count if paginator else "",
+        page_obj.has_previous(), page_obj.has_next(),
+    )
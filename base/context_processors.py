@@ -0,0 +1,7 @@
+from base.views import get_lang
+
+def language(request):
+    """
+    Expose the active language code to every template as `lang`.
+    """
+    return {"lang": get_lang(request)}
@@ -0,0 +1,60 @@
+import os
+import posixpath
+from imagekit.models import ProcessedImageField
+from imagekit.models.fields.files import ProcessedImageFieldFile
+from imagekit.utils import generate, suggest_extension
+
+# Uploads wait here, as sent, until process_images has run their job
+ORIGINALS_DIR = "originals"
+
+def is_pending(field_file):
+    """
+    Whether `field_file` is an upload still waiting to be processed.
+    """
+    return bool(field_file) and field_file.name.startswith(f"{ORIGINALS_DIR}/")
+
+class QueuedImageFieldFile(ProcessedImageFieldFile):
+
+    def save(self, name, content, save=True):
+        """
+        Store the upload untouched under originals/<upload_to path>; the
+        resize and re-encode happen later, in process().
+        """
+        name = posixpath.join(ORIGINALS_DIR, self.field.generate_filename(self.instance, name))
+        self.name = self.storage.save(name, content, max_length=self.field.max_length)
+        setattr(self.instance, self.field.attname, self.name)
+        self._committed = True
+        if save:
+            self.instance.save()
+
+    save.alters_data = True
+
+    def process(self):
+        """
+        Run the field's processors on a pending upload and store the result
+        where a synchronous ProcessedImageField would have put it.  Points
+        this file at the result; the original is left for the caller to
+        delete once the row has been updated.
+        """
+        spec = self.field.get_spec(source=self)
+        filename = os.path.basename(self.name)
+        filename = os.path.splitext(filename)[0] + suggest_extension(filename, spec.format)
+        name = self.field.generate_filename(self.instance, filename)
+        content = generate(spec)
+        # Drop the handle on the original so later reads see the result
+        self.close()
+        del self.file
+        self.name = self.storage.save(name, content, max_length=self.field.max_length)
+        return self.name
+
+    process.alters_data = True
+
+class QueuedImageField(ProcessedImageField):
+    """
+    A ProcessedImageField that does not process during the request.  The
+    upload is saved as it came and an ImageJob is queued for it (see
+    base.signals); until the worker is done, is_pending() is true and the
+    templates show a placeholder.
+    """
+
+    attr_class = QueuedImageFieldFile
@@ -0,0 +1,125 @@
+"""
+iCalendar (RFC 5545) feeds of the mass schedule and the events.
+
+Calendar apps poll a subscribed feed every few hours, so each response
+is validated before any row is read: the ETag comes from one aggregate
+query per source (MAX(updated_at) and COUNT(*) over the feed's dates)
+and a matching If-None-Match gets a 304.  Otherwise the body is streamed
+while the rows are read in chunks, so a long feed is never built whole.
+"""
+import hashlib
+from datetime import timezone as dt_timezone
+from django.conf import settings
+from django.db.models import Count, Max
+from django.http import StreamingHttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+
+PRODID = "-//SM Ruhango//Calendar//EN"
+
+# Events sent per chunk of the streamed body
+CHUNK_EVENTS = 100
+
+def escape(text):
+    """
+    TEXT value escaping: backslash, semicolon, comma and newlines.
+    """
+    return (
+        str(text).replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,")
+        .replace("\r\n", "\\n").replace("\n", "\\n").replace("\r", "\\n")
+    )
+
+def fold(line):
+    """
+    Split a content line into lines of at most 75 octets, continuation
+    lines starting with a space, without cutting a UTF-8 sequence.
+    """
+    encoded = line.encode()
+    if len(encoded) <= 75:
+        return line + "\r\n"
+    parts, start, limit = [], 0, 75
+    while start < len(encoded):
+        end = min(start + limit, len(encoded))
+        # Back off to the start of a character
+        while end < len(encoded) and encoded[end] & 0xC0 == 0x80:
+            end -= 1
+        parts.append(encoded[start:end].decode())
+        start, limit = end, 74
+    return "\r\n ".join(parts) + "\r\n"
+
+def utc_stamp(value):
+    return value.astimezone(dt_timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+def vevent(uid, updated_at, date, start_time=None, end_time=None, summary="", description="", url=""):
+    """
+    One VEVENT.  Times are floating local times, as they are entered in
+    the admin; an event without a start time is an all-day event.
+    """
+    lines = ["BEGIN:VEVENT", f"UID:{uid}", f"DTSTAMP:{utc_stamp(updated_at)}"]
+    if start_time is None:
+        lines.append(f"DTSTART;VALUE=DATE:{date:%Y%m%d}")
+    else:
+        lines.append(f"DTSTART:{date:%Y%m%d}T{start_time:%H%M%S}")
+        if end_time is not None and end_time > start_time:
+            lines.append(f"DTEND:{date:%Y%m%d}T{end_time:%H%M%S}")
+    lines.append(f"SUMMARY:{escape(summary)}")
+    if description:
+        lines.append(f"DESCRIPTION:{escape(description)}")
+    if url:
+        lines.append(f"URL:{url}")
+    lines.append(f"LAST-MODIFIED:{utc_stamp(updated_at)}")
+    lines.append("END:VEVENT")
+    return "".join(fold(line) for line in lines)
+
+def stream(name, events):
+    """
+    The VCALENDAR around `events` (VEVENT strings), as encoded chunks of
+    CHUNK_EVENTS events.
+    """
+    header = [
+        "BEGIN:VCALENDAR", "VERSION:2.0", f"PRODID:{PRODID}",
+        "CALSCALE:GREGORIAN", "METHOD:PUBLISH",
+        f"X-WR-CALNAME:{escape(name)}", f"X-PUBLISHED-TTL:PT{settings.CALENDAR_MAX_AGE // 60}M",
+    ]
+    yield "".join(fold(line) for line in header).encode()
+    chunk = []
+    for event in events:
+        chunk.append(event)
+        if len(chunk) == CHUNK_EVENTS:
+            yield "".join(chunk).encode()
+            chunk = []
+    chunk.append(fold("END:VCALENDAR"))
+    yield "".join(chunk).encode()
+
+def feed_validators(lang, start, *querysets):
+    """
+    ETag and Last-Modified for a feed of `querysets`' rows from `start`
+    on.  MAX(updated_at) moves on every edit and COUNT(*) on deletes; the
+    start date is part of the tag because the feed's window moves daily.
+    """
+    digest = hashlib.md5(f"{lang}|{start.isoformat()}".encode(), usedforsecurity=False)
+    stamps = []
+    for queryset in querysets:
+        stats = queryset.order_by().aggregate(updated=Max("updated_at"), rows=Count("pk"))
+        digest.update(f"|{stats['rows']}:{stats['updated'] and stats['updated'].isoformat()}".encode())
+        if stats["updated"] is not None:
+            stamps.append(stats["updated"])
+    last_modified = int(max(stamps).timestamp()) if stamps else None
+    return quote_etag(digest.hexdigest()), last_modified
+
+def calendar_response(request, filename, name, lang, start, events, *querysets):
+    """
+    A 304 when the client's copy is current, else the streamed feed of
+    `events`, a generator that is only run once the response is sent.
+    """
+    etag, last_modified = feed_validators(lang, start, *querysets)
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        response = StreamingHttpResponse(stream(name, events), content_type="text/calendar; charset=utf-8")
+        response["Content-Disposition"] = f'inline; filename="{filename}"'
+
+    response.headers.setdefault("ETag", etag)
+    if last_modified is not None:
+        response.headers.setdefault("Last-Modified", http_date(last_modified))
+    patch_cache_control(response, public=True, max_age=settings.CALENDAR_MAX_AGE)
+    return response
@@ -0,0 +1,160 @@
+import hashlib
+from functools import lru_cache
+from django.core.files import File
+from django.templatetags.static import static
+from imagekit import ImageSpec, hashers
+from imagekit.cachefiles import ImageCacheFile
+from imagekit.processors import ResizeToFit
+from base.fields import is_pending
+
+# (name, PIL format, MIME type), best first: browsers take the first
+# <source> whose type they support, and the <img> falls back to the last.
+FORMATS = (
+    ("webp", "WEBP", "image/webp"),
+    ("jpeg", "JPEG", "image/jpeg"),
+)
+
+# (app_label.Model, field name) -> ResponsiveSpec
+SPECS = {}
+
+# Admin previews are shown at 30–150px; this covers them on 2x screens
+THUMBNAIL_WIDTH = 300
+
+# Shown instead of an upload still waiting for process_images
+PLACEHOLDER = "img/placeholder.png"
+
+class Derivative(ImageSpec):
+    """
+    An ImageSpec whose cache file hash is the source name plus a digest of
+    the spec taken once per class.  imagekit's default pickles the
+    processors for every file name, which costs more than the rest of a
+    page render once a card has eight of them.
+    """
+
+    spec_digest = ""
+
+    def get_hash(self):
+        return hashlib.md5(f"{self.source.name}:{self.spec_digest}".encode()).hexdigest()
+
+class ResponsiveSpec:
+    """
+    The widths and formats derived from one ProcessedImageField.
+
+    Every (format, width) pair is an imagekit ImageSpec resized with
+    ResizeToFit, so the source's crop is kept and nothing is upscaled.  The
+    derivatives live under CACHE/images/<source name>/ in the media
+    storage, named after a hash of the source name and the spec, so a new
+    upload never serves stale files.
+    """
+
+    def __init__(self, widths, sizes, quality=80):
+        self.widths = tuple(sorted(widths))
+        self.sizes = sizes
+        self.quality = quality
+        self.generators = {
+            (fmt, width): self.derivative(width, pil_format)
+            for fmt, pil_format, _ in FORMATS
+            for width in self.widths
+        }
+
+    def derivative(self, width, pil_format):
+        processors = [ResizeToFit(width=width, upscale=False)]
+        options = {"quality": self.quality}
+        return type(f"{pil_format.title()}{width}", (Derivative,), {
+            "processors": processors,
+            "format": pil_format,
+            "options": options,
+            "spec_digest": hashers.pickle([processors, pil_format, options]),
+        })
+
+    def file(self, source, fmt, width):
+        return ImageCacheFile(self.generators[fmt, width](source=source))
+
+    def files(self, source):
+        """
+        Every derivative of `source`, the largest of the last format last.
+        """
+        return [
+            self.file(source, fmt, width)
+            for fmt, _, _ in FORMATS for width in self.widths
+        ]
+
+    def srcset(self, source, fmt):
+        return self._srcset(source.name, fmt)
+
+    @lru_cache(maxsize=4096)
+    def _srcset(self, name, fmt):
+        # Derivative names and URLs depend on nothing but the source name,
+        # and a list page asks for the same few dozen on every request.
+        source = File(None, name)
+        return ", ".join(
+            f"{self.file(source, fmt, width).url} {width}w" for width in self.widths
+        )
+
+    def ready(self, source):
+        """
+        Whether the derivatives of `source` are on disk.  generate() writes
+        the files in order, so the last one stands in for the set; imagekit
+        keeps the answer in the cache, so this is one cache read per image.
+        """
+        fmt, _, _ = FORMATS[-1]
+        last = self.file(source, fmt, self.widths[-1])
+        return last.cachefile_backend.exists(last)
+
+    def generate(self, source, force=False):
+        for file in self.files(source):
+            file.generate(force=force)
+
+class AdminThumbnail(Derivative):
+    """
+    The small JPEG the admin shows instead of the full-size image.
+    """
+
+    processors = [ResizeToFit(width=THUMBNAIL_WIDTH, upscale=False)]
+    format = "JPEG"
+    options = {"quality": 75}
+    spec_digest = hashers.pickle([processors, format, options])
+
+def admin_thumbnail(image):
+    return ImageCacheFile(AdminThumbnail(source=image))
+
+def admin_thumbnail_url(image):
+    """
+    URL of `image`'s admin thumbnail, found through imagekit's cached
+    existence check.  Thumbnails are only written by process_images and
+    generate_derivatives, never during an admin request: a pending upload
+    shows the placeholder, and an image without a thumbnail yet (e.g.
+    seeded, or its file is missing) is shown itself.
+    """
+    if is_pending(image):
+        return static(PLACEHOLDER)
+    thumbnail = admin_thumbnail(image)
+    if thumbnail.cachefile_backend.exists(thumbnail):
+        return thumbnail.url
+    return image.url
+
+def register(label, field_name, widths, sizes, quality=80):
+    SPECS[label, field_name] = spec = ResponsiveSpec(widths, sizes, quality)
+    return spec
+
+def image_fields(model):
+    """
+    Names of `model`'s fields that have a ResponsiveSpec.
+    """
+    return [name for label, name in SPECS if label == model._meta.label]
+
+def spec_for(field_file):
+    """
+    The ResponsiveSpec for a model's image, or None if it has none.
+    """
+    return SPECS.get((field_file.instance._meta.label, field_file.field.name))
+
+# Widths stop at the size each field is cropped to on upload; `sizes` is
+# the default slot the image fills, overridable per template.
+register("base.Homily", "image", (320, 640, 960, 1270), "(min-width: 992px) 33vw, 100vw", quality=82)
+register("base.HealingPrayer", "image", (320, 640, 960, 1270), "(min-width: 992px) 33vw, 100vw", quality=82)
+register("base.Event", "image", (320, 600, 900, 1200), "(min-width: 992px) 33vw, 100vw")
+register("base.Gallery", "image", (320, 600, 900, 1200), "(min-width: 992px) 25vw, 50vw")
+register("base.Advertisement", "image", (320, 600, 900, 1200), "(min-width: 992px) 50vw, 100vw")
+register("base.RoomImage", "image", (320, 480, 800), "(min-width: 992px) 33vw, 100vw")
+register("base.Member", "image", (160, 240, 400), "(min-width: 768px) 200px, 40vw")
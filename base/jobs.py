@@ -0,0 +1,97 @@
+import datetime
+from django.apps import apps
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+from base.models import ImageJob
+from base.fields import is_pending
+from base.imagespecs import admin_thumbnail, spec_for
+
+# A running job whose worker has been silent this long is handed out again
+STALE_AFTER = datetime.timedelta(minutes=10)
+
+# Delay before retry n is 2**n times this
+RETRY_DELAY = datetime.timedelta(seconds=30)
+
+def enqueue(instance, field_name):
+    """
+    Queue `instance`'s image in `field_name` for processing, unless a job
+    for it is already waiting.
+    """
+    target = {
+        "model": instance._meta.label,
+        "object_id": instance.pk,
+        "field_name": field_name,
+    }
+    if not ImageJob.objects.filter(status=ImageJob.PENDING, **target).exists():
+        ImageJob.objects.create(**target)
+
+def claim():
+    """
+    Take the next due job and mark it running, or return None.
+
+    SQLite has no SELECT ... FOR UPDATE SKIP LOCKED, so a job is taken
+    with an UPDATE that only matches while it is still claimable; when
+    two workers race for the same row, one of them updates nothing and
+    moves on to the next.
+    """
+    now = timezone.now()
+    claimable = (
+        Q(status=ImageJob.PENDING, run_after__lte=now)
+        | Q(status=ImageJob.RUNNING, locked_at__lt=now - STALE_AFTER)
+    )
+    for job_id in ImageJob.objects.filter(claimable).values_list("pk", flat=True)[:10]:
+        taken = ImageJob.objects.filter(claimable, pk=job_id).update(
+            status=ImageJob.RUNNING, locked_at=now, attempts=F("attempts") + 1,
+        )
+        if taken:
+            return ImageJob.objects.get(pk=job_id)
+    return None
+
+def fail(job, error, max_attempts):
+    """
+    Put `job` back with a growing delay, or mark it failed for good.
+    """
+    job.last_error = error
+    if job.attempts >= max_attempts:
+        job.status = ImageJob.FAILED
+    else:
+        job.status = ImageJob.PENDING
+        job.run_after = timezone.now() + RETRY_DELAY * 2 ** job.attempts
+    job.save(update_fields=["status", "run_after", "last_error", "updated_at"])
+
+def process(job):
+    """
+    Resize a pending upload the way its field specifies, write its
+    responsive derivatives and admin thumbnail, then point the row at the
+    result and delete the original.  Rows deleted, or re-uploaded, since
+    the job was queued are left alone.
+    """
+    model = apps.get_model(job.model)
+    obj = model.objects.filter(pk=job.object_id).first()
+    image = obj and getattr(obj, job.field_name)
+    if not image:
+        return
+
+    original = image.name
+    if is_pending(image):
+        image.process()
+    spec = spec_for(image)
+    if spec is not None:
+        spec.generate(image)
+    admin_thumbnail(image).generate()
+    if image.name == original:
+        return
+
+    with transaction.atomic():
+        current = model.objects.select_for_update().filter(pk=obj.pk).values_list(job.field_name, flat=True).first()
+        if current != original:
+            image.storage.delete(image.name)
+            return
+        # save() rather than update(): the usual post_save receivers move
+        # updated_at on and drop the cached pages that showed a placeholder.
+        update_fields = [job.field_name]
+        if any(field.name == "updated_at" for field in model._meta.fields):
+            update_fields.append("updated_at")
+        obj.save(update_fields=update_fields)
+    image.storage.delete(original)
@@ -0,0 +1,50 @@
+from django.db import transaction
+from django.core.management.base import BaseCommand
+from base import api
+from base.cache import bump_version
+from base.models import (
+    Homily, Event, Advertisement, HealingPrayer, LANGUAGE_CODES, update_excerpts,
+)
+
+class Command(BaseCommand):
+    help = "Recompute the plain-text excerpt_<lang> columns from each model's rich-text body."
+
+    MODELS = (Homily, Event, Advertisement, HealingPrayer)
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size", type=int, default=500,
+            help="Rows written per bulk_update (default: 500)",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        excerpt_fields = [f"excerpt_{code}" for code in LANGUAGE_CODES]
+
+        for model in self.MODELS:
+            # Load only the bodies; the excerpts are rewritten without save()
+            # so updated_at and the home page cache stay untouched per row.
+            sources = [f"{model.EXCERPT_SOURCE}_{code}" for code in LANGUAGE_CODES]
+            queryset = model.objects.only("pk", *sources).order_by("pk")
+
+            batch, updated = [], 0
+            with transaction.atomic():
+                for obj in queryset.iterator(chunk_size=batch_size):
+                    update_excerpts(obj)
+                    batch.append(obj)
+                    if len(batch) >= batch_size:
+                        model.objects.bulk_update(batch, excerpt_fields)
+                        updated += len(batch)
+                        batch = []
+                if batch:
+                    model.objects.bulk_update(batch, excerpt_fields)
+                    updated += len(batch)
+
+            self.stdout.write(self.style.SUCCESS(
+                f"✔ {updated} {model._meta.verbose_name_plural} excerpts refreshed."
+            ))
+
+        # The cache is shared with the web server, so its pages pick the new
+        # excerpts up at once
+        for namespace in {"home", "pages"}.union(*(api.namespaces_for(model) for model in self.MODELS)):
+            bump_version(namespace)
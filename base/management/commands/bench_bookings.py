@@ -0,0 +1,179 @@
+import io
+import os
+import json
+import random
+import tempfile
+from datetime import timedelta
+from time import perf_counter
+from django.db import connection
+from django.test import Client
+from django.conf import settings
+from django.utils import timezone
+from django.core.management import call_command
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.core.management.base import BaseCommand, CommandError
+from base.models import *
+from base.bookings import book
+from base.management.commands.bench_views import percentile
+
+class Command(BaseCommand):
+    help = (
+        "Seed a throwaway database with --rooms rooms and --bookings bookings, "
+        "then time random availability searches through the API and booking "
+        "attempts, and print the search's query plan."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rooms", type=int, default=1000,
+            help="Rooms to seed (default: 1000)",
+        )
+        parser.add_argument(
+            "--bookings", type=int, default=50000,
+            help="Bookings to seed (default: 50000)",
+        )
+        parser.add_argument(
+            "--iterations", type=int, default=200,
+            help="Timed searches and booking attempts (default: 200)",
+        )
+        parser.add_argument(
+            "--seed", type=int, default=0,
+            help="Random seed for the data and the searches (default: 0)",
+        )
+        parser.add_argument(
+            "--keepdb", action="store_true",
+            help="Keep the seeded database and reuse it on the next run",
+        )
+        parser.add_argument(
+            "--output",
+            help="Also write the results as JSON to this file",
+        )
+
+    def handle(self, *args, **options):
+        if options["iterations"] < 1:
+            raise CommandError("--iterations must be at least 1")
+
+        # Never seed the real database; see bench_views
+        test_settings = connection.settings_dict.setdefault("TEST", {})
+        if connection.vendor == "sqlite" and not test_settings.get("NAME"):
+            test_settings["NAME"] = os.path.join(
+                tempfile.gettempdir(), f"smr_bench_bookings_{options['rooms']}_{options['bookings']}.sqlite3"
+            )
+        old_name = connection.settings_dict["NAME"]
+        connection.creation.create_test_db(
+            verbosity=0, autoclobber=True, keepdb=options["keepdb"], serialize=False
+        )
+        try:
+            if not Booking.objects.exists():
+                started = perf_counter()
+                self.seed(options)
+                self.stdout.write(self.style.SUCCESS(
+                    f"✔ Seeded {options['rooms']} rooms and {options['bookings']} bookings "
+                    f"in {perf_counter() - started:.1f}s."
+                ))
+            if connection.vendor == "sqlite":
+                # Planner statistics, as a long-running database would have
+                with connection.cursor() as cursor:
+                    cursor.execute("ANALYZE")
+            results = self.run(options)
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0, keepdb=options["keepdb"])
+
+        if options["output"]:
+            with open(options["output"], "w") as fh:
+                json.dump(results, fh, indent=2)
+            self.stdout.write(self.style.SUCCESS(f"✅ Wrote the results to {options['output']}."))
+
+    def seed(self, options):
+        quiet = io.StringIO()
+        with tempfile.TemporaryDirectory(prefix="smr_bench_media_") as media_root:
+            with override_settings(MEDIA_ROOT=media_root):
+                call_command("generate_amenities", stdout=quiet)
+                call_command("generate_rooms", count=options["rooms"], seed=options["seed"],
+                             no_images=True, stdout=quiet)
+                call_command("generate_bookings", count=options["bookings"], seed=options["seed"],
+                             stdout=quiet)
+
+    def stays(self, rng):
+        """
+        Random stays of 1-7 nights over the seeded bookings' dates.
+        """
+        first = Booking.objects.order_by("check_in").values_list("check_in", flat=True).first()
+        last = Booking.objects.order_by("-check_in").values_list("check_in", flat=True).first()
+        span = max((last - first).days, 1)
+        while True:
+            check_in = first + timedelta(days=rng.randrange(span))
+            yield check_in, check_in + timedelta(days=rng.randint(1, 7))
+
+    def run(self, options):
+        rng = random.Random(options["seed"])
+        stays = self.stays(rng)
+        names = list(Amenity.objects.values_list("name", flat=True))
+        client = Client()
+
+        searches = []
+        for _ in range(options["iterations"]):
+            check_in, check_out = next(stays)
+            params = {"check_in": check_in.isoformat(), "check_out": check_out.isoformat()}
+            if rng.random() < 0.5:
+                params["amenities"] = ",".join(rng.sample(names, min(2, len(names))))
+            if rng.random() < 0.5:
+                params["max_price"] = rng.randint(80, 300)
+            searches.append(params)
+
+        timings, queries = [], []
+        for params in searches:
+            with CaptureQueriesContext(connection) as ctx:
+                started = perf_counter()
+                response = client.get("/api/v1/rooms/available/", params)
+                timings.append((perf_counter() - started) * 1000)
+            if response.status_code != 200:
+                raise CommandError(f"Search {params} failed: {response.status_code} {response.content[:200]}")
+            queries.append(len(ctx.captured_queries))
+        search = {
+            "p50_ms": round(percentile(timings, 50), 3),
+            "p95_ms": round(percentile(timings, 95), 3),
+            "queries_max": max(queries),
+        }
+
+        room_ids = list(Room.objects.values_list("id", flat=True))
+        timings, booked = [], 0
+        for _ in range(options["iterations"]):
+            check_in, check_out = next(stays)
+            started = perf_counter()
+            try:
+                book(Room(pk=rng.choice(room_ids)), check_in, check_out,
+                     guest_name="Bench", guest_email="bench@example.com")
+                booked += 1
+            except RoomUnavailable:
+                pass
+            timings.append((perf_counter() - started) * 1000)
+        booking = {
+            "p50_ms": round(percentile(timings, 50), 3),
+            "p95_ms": round(percentile(timings, 95), 3),
+            "booked": booked,
+            "refused": options["iterations"] - booked,
+        }
+
+        check_in, check_out = next(stays)
+        sql, params = Room.objects.available(check_in, check_out, max_price=200).order_by(
+            "price_per_night", "id")[:21].query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN QUERY PLAN {sql}" if connection.vendor == "sqlite" else f"EXPLAIN {sql}", params)
+            plan = [str(row[-1]) for row in cursor.fetchall()]
+
+        self.stdout.write(f"{'':<8} {'p50 ms':>8} {'p95 ms':>8}")
+        self.stdout.write(f"{'search':<8} {search['p50_ms']:>8.2f} {search['p95_ms']:>8.2f}  ({search['queries_max']} queries at most)")
+        self.stdout.write(f"{'book':<8} {booking['p50_ms']:>8.2f} {booking['p95_ms']:>8.2f}  "
+                          f"({booking['booked']} booked, {booking['refused']} refused)")
+        self.stdout.write("Search plan:\n  " + "\n  ".join(plan))
+        return {
+            "rooms": Room.objects.count(),
+            "bookings": Booking.objects.count(),
+            "created_at": timezone.now().isoformat(),
+            "database": connection.vendor,
+            "debug": settings.DEBUG,
+            "search": search,
+            "book": booking,
+            "search_plan": plan,
+        }
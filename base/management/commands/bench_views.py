@@ -0,0 +1,254 @@
+import os
+import io
+import json
+import math
+import random
+import platform
+import tempfile
+from time import perf_counter
+import django
+from faker import Faker
+from django.db import connection
+from django.urls import URLPattern, reverse
+from django.test import Client
+from django.conf import settings
+from django.utils import timezone
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.core.management.base import BaseCommand, CommandError
+from base import urls as base_urls
+from base.models import *
+from base.views import SUPPORTED_LANGS
+
+SCALES = {"1k": 1_000, "10k": 10_000, "100k": 100_000}
+
+# Views that take a primary key, and the model it belongs to
+DETAIL_VIEWS = {"eventDetails": Event, "roomDetails": Room}
+
+# Not pages: change_language only sets a cookie and redirects
+SKIP_VIEWS = {"change_language"}
+
+# Seeders run at the requested scale, without drawing an image per row
+GENERATORS = (
+    "generate_mass_schedules", "generate_homilies", "generate_events",
+    "generate_adverts", "generate_healing_prayers", "generate_gallery",
+    "generate_members", "generate_rooms",
+)
+
+# The benchmark's own cache: the shared cache serves the live site, and
+# pages rendered from the throwaway database must never end up there.
+BENCH_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+def percentile(values, pct):
+    """
+    Nearest-rank percentile of a non-empty list.
+    """
+    ordered = sorted(values)
+    rank = math.ceil(pct / 100 * len(ordered))
+    return ordered[max(rank, 1) - 1]
+
+class Command(BaseCommand):
+    help = (
+        "Seed a throwaway database at 1k/10k/100k rows per model, request every "
+        "page in base.urls in each language and report p50/p95 latency, query "
+        "count and response size per view as JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--scale", choices=SCALES, default="1k",
+            help="Rows per model (default: 1k)",
+        )
+        parser.add_argument(
+            "--iterations", type=int, default=20,
+            help="Timed requests per view and language (default: 20)",
+        )
+        parser.add_argument(
+            "--warmup", type=int, default=2,
+            help="Untimed requests per view and language first (default: 2)",
+        )
+        parser.add_argument(
+            "--lang", action="append", choices=SUPPORTED_LANGS, dest="langs",
+            help="Language to benchmark; repeat for several (default: all)",
+        )
+        parser.add_argument(
+            "--cold", action="store_true",
+            help="Clear the cache before every request",
+        )
+        parser.add_argument(
+            "--seed", type=int, default=0,
+            help="Random seed for the data and the detail pages picked (default: 0)",
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=1000,
+            help="Rows per bulk_create while seeding (default: 1000)",
+        )
+        parser.add_argument(
+            "--keepdb", action="store_true",
+            help="Keep the seeded database and reuse it on the next run",
+        )
+        parser.add_argument(
+            "--output",
+            help="Where to write the JSON report (default: bench_views_<scale>_<timestamp>.json)",
+        )
+
+    def handle(self, *args, **options):
+        if options["iterations"] < 1:
+            raise CommandError("--iterations must be at least 1")
+
+        rows = SCALES[options["scale"]]
+        langs = options["langs"] or list(SUPPORTED_LANGS)
+        output = options["output"] or "bench_views_{}_{}.json".format(
+            options["scale"], timezone.now().strftime("%Y%m%d-%H%M%S")
+        )
+
+        # Never seed the real database: run against a test database, kept in
+        # a file per scale for SQLite so --keepdb can skip reseeding.
+        test_settings = connection.settings_dict.setdefault("TEST", {})
+        if connection.vendor == "sqlite" and not test_settings.get("NAME"):
+            test_settings["NAME"] = os.path.join(
+                tempfile.gettempdir(), f"smr_bench_{options['scale']}.sqlite3"
+            )
+        old_name = connection.settings_dict["NAME"]
+        connection.creation.create_test_db(
+            verbosity=0, autoclobber=True, keepdb=options["keepdb"], serialize=False
+        )
+        try:
+            # override_settings swaps django.core.cache.caches for the block
+            with override_settings(CACHES=BENCH_CACHES):
+                if not Homily.objects.exists():
+                    started = perf_counter()
+                    self.seed(rows, options["seed"], options["batch_size"])
+                    self.stdout.write(self.style.SUCCESS(
+                        f"✔ Seeded {rows} rows per model in {perf_counter() - started:.1f}s."
+                    ))
+                results = self.run(langs, options)
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0, keepdb=options["keepdb"])
+
+        report = {
+            "scale": options["scale"],
+            "rows_per_model": rows,
+            "iterations": options["iterations"],
+            "warmup": options["warmup"],
+            "cold_cache": options["cold"],
+            "seed": options["seed"],
+            "created_at": timezone.now().isoformat(),
+            "python": platform.python_version(),
+            "django": django.get_version(),
+            "database": connection.vendor,
+            "debug": settings.DEBUG,
+            "results": results,
+        }
+        with open(output, "w") as fh:
+            json.dump(report, fh, indent=2)
+        self.stdout.write(self.style.SUCCESS(f"✅ Wrote {len(results)} results to {output}."))
+
+    def seed(self, rows, seed, batch_size):
+        """
+        Fill every model the public views read with `rows` rows through the
+        generate_* commands.  Their --no-images placeholders go to a
+        temporary MEDIA_ROOT; the pages only need the paths.
+        """
+        quiet = io.StringIO()
+        with tempfile.TemporaryDirectory(prefix="smr_bench_media_") as media_root:
+            with override_settings(MEDIA_ROOT=media_root):
+                call_command("generate_amenities", stdout=quiet)
+                for name in GENERATORS:
+                    call_command(
+                        name, count=rows, seed=seed, batch_size=batch_size,
+                        no_images=True, index=False, stdout=quiet,
+                    )
+        # Indexed once for every seeder rather than once per seeder
+        call_command("rebuild_search_index", stdout=quiet)
+
+        # There is no generate_testimonies; the testimonies list still
+        # needs rows, a quarter of them drafts.
+        fake = Faker()
+        fake.seed_instance(seed)
+        Testimony.objects.bulk_create(
+            (
+                Testimony(
+                    name=fake.name(), email=f"bench{i}@example.com",
+                    content_text=fake.paragraph(nb_sentences=4),
+                    status=Testimony.PUBLISHED if i % 4 else Testimony.DRAFT,
+                )
+                for i in range(rows)
+            ),
+            batch_size=batch_size,
+        )
+
+    def views(self, rng):
+        """
+        (url name, callable taking the language and returning the next URL
+        to request) for every page in base.urls.  Detail pages cycle through
+        random rows; the calendar feeds take the language in their URL.
+        """
+        views = []
+        for pattern in base_urls.urlpatterns:
+            if not isinstance(pattern, URLPattern) or not pattern.name or pattern.name in SKIP_VIEWS:
+                continue
+            name = f"{base_urls.app_name}:{pattern.name}"
+            params = list(pattern.pattern.converters)
+            if not params:
+                views.append((pattern.name, lambda lang, name=name: reverse(name)))
+            elif params == ["lang"]:
+                views.append((pattern.name, lambda lang, name=name: reverse(name, kwargs={"lang": lang})))
+            elif pattern.name in DETAIL_VIEWS:
+                ids = list(DETAIL_VIEWS[pattern.name].objects.values_list("id", flat=True))
+                if not ids:
+                    continue
+                sample = rng.sample(ids, min(len(ids), 50))
+                views.append((pattern.name, lambda lang, name=name, sample=sample, param=params[0]:
+                              reverse(name, kwargs={param: rng.choice(sample)})))
+            else:
+                self.stderr.write(f"Skipping {pattern.name}: don't know how to fill {params}")
+        return views
+
+    def run(self, langs, options):
+        rng = random.Random(options["seed"])
+        views = self.views(rng)
+        results = []
+
+        self.stdout.write(f"{'view':<16} {'lang':<4} {'p50 ms':>8} {'p95 ms':>8} {'queries':>7} {'bytes':>9}")
+        for lang in langs:
+            client = Client()
+            client.get(reverse("base:change_language", args=[lang]))
+
+            for view_name, next_url in views:
+                cache.clear()
+                for _ in range(options["warmup"]):
+                    client.get(next_url(lang))
+
+                timings, queries, sizes, statuses = [], [], [], set()
+                for _ in range(options["iterations"]):
+                    url = next_url(lang)
+                    if options["cold"]:
+                        cache.clear()
+                    with CaptureQueriesContext(connection) as ctx:
+                        started = perf_counter()
+                        response = client.get(url)
+                        content = b"".join(response.streaming_content) if response.streaming else response.content
+                        timings.append((perf_counter() - started) * 1000)
+                    queries.append(len(ctx.captured_queries))
+                    sizes.append(len(content))
+                    statuses.add(response.status_code)
+
+                result = {
+                    "view": view_name,
+                    "lang": lang,
+                    "p50_ms": round(percentile(timings, 50), 3),
+                    "p95_ms": round(percentile(timings, 95), 3),
+                    "mean_ms": round(sum(timings) / len(timings), 3),
+                    "queries_p50": percentile(queries, 50),
+                    "queries_max": max(queries),
+                    "bytes_p50": percentile(sizes, 50),
+                    "status": sorted(statuses),
+                }
+                results.append(result)
+                self.stdout.write(
+                    f"{view_name:<16} {lang:<4} {result['p50_ms']:>8.2f} {result['p95_ms']:>8.2f} "
+                    f"{result['queries_p50']:>7} {result['bytes_p50']:>9}"
+                )
+        return results
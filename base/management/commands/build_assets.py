@@ -0,0 +1,65 @@
+import os
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from whitenoise.compress import Compressor, brotli_installed
+
+class Command(BaseCommand):
+    help = (
+        "Build STATIC_ROOT for production: collectstatic through base.storage "
+        "(content-hashed names, staticfiles.json manifest, .br and .gz copies), "
+        "then report what was written."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--no-clear", action="store_false", dest="clear",
+            help="Keep files already in STATIC_ROOT instead of starting afresh",
+        )
+        parser.add_argument(
+            "--require-brotli", action="store_true",
+            help="Fail instead of building gzip copies only when Brotli is not installed",
+        )
+
+    def handle(self, *args, **options):
+        if not hasattr(staticfiles_storage, "hashed_files"):
+            raise CommandError(
+                f"STATICFILES_STORAGE is {settings.STATICFILES_STORAGE}, which does not "
+                "fingerprint files; use base.storage.StaticFilesStorage."
+            )
+        if not brotli_installed:
+            if options["require_brotli"]:
+                raise CommandError("Brotli is not installed (pip install Brotli).")
+            self.stderr.write(self.style.WARNING(
+                "⚠ Brotli is not installed (pip install Brotli): writing .gz copies only."
+            ))
+
+        call_command("collectstatic", interactive=False, clear=options["clear"], verbosity=0)
+
+        for name, url in sorted(getattr(staticfiles_storage, "missing_references", ())):
+            self.stderr.write(self.style.WARNING(f"⚠ {name} refers to {url}, which does not exist; left as is."))
+
+        compressor = Compressor(quiet=True)
+        totals = {"": 0, ".br": 0, ".gz": 0}
+        hashed = staticfiles_storage.hashed_files.values()
+        compressible = [name for name in hashed if compressor.should_compress(name)]
+        for name in compressible:
+            path = staticfiles_storage.path(name)
+            size = os.path.getsize(path)
+            totals[""] += size
+            for suffix in (".br", ".gz"):
+                # Files that do not shrink get no copy and are sent as they are
+                totals[suffix] += os.path.getsize(path + suffix) if os.path.exists(path + suffix) else size
+
+        def mb(size):
+            return f"{size / 1024 / 1024:.1f} MB"
+
+        self.stdout.write(
+            f"{len(compressible)} of {len(hashed)} fingerprinted files are compressible: "
+            f"{mb(totals[''])} as is, {mb(totals['.gz'])} gzipped"
+            + (f", {mb(totals['.br'])} with Brotli" if brotli_installed else "")
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ Built {settings.STATIC_ROOT} with manifest {staticfiles_storage.manifest_name}."
+        ))
@@ -0,0 +1,48 @@
+from datetime import timedelta
+from faker import Faker
+from django.core.management.base import CommandError
+from django.utils import timezone
+from base.models import Booking, Room
+from base.seeding import SeedCommand
+
+# Every room's bookings start this many days before today
+HISTORY_DAYS = 365
+
+class Command(SeedCommand):
+    help = (
+        "Generate fake bookings (1000 by default) spread over the existing rooms: "
+        "back-to-back stays of 1-7 nights from a year ago on, one in ten cancelled"
+    )
+    default_count = 1000
+
+    def seed(self, count):
+        rooms = list(Room.objects.values_list("id", "price_per_night"))
+        if not rooms:
+            raise CommandError("There are no rooms to book; run generate_rooms first.")
+
+        fake = Faker()
+        names = self.pool(fake.name)
+        start = timezone.localdate() - timedelta(days=HISTORY_DAYS)
+        # Next free night per room, so the stays never overlap
+        free_from = dict.fromkeys((room_id for room_id, _ in rooms), start)
+
+        def bookings():
+            for i in range(count):
+                room_id, rate = rooms[i % len(rooms)]
+                check_in = free_from[room_id] + timedelta(days=self.random.randint(0, 5))
+                nights = self.random.randint(1, 7)
+                check_out = check_in + timedelta(days=nights)
+                free_from[room_id] = check_out
+                name = names()
+                yield Booking(
+                    room_id=room_id,
+                    check_in=check_in,
+                    check_out=check_out,
+                    guest_name=name,
+                    guest_email=f"guest{i}@example.com",
+                    status=self.random.choice([Booking.CONFIRMED] * 6 + [Booking.PENDING] * 3 + [Booking.CANCELLED]),
+                    total_price=rate * nights,
+                )
+
+        created = self.bulk_create(Booking, bookings())
+        return f"🛏️ Successfully generated {created} bookings over {len(rooms)} rooms."
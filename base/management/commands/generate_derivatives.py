@@ -0,0 +1,57 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from base.cache import bump_version
+from base.imagespecs import SPECS, admin_thumbnail
+
+class Command(BaseCommand):
+    help = (
+        "Write the responsive WebP/JPEG widths and the admin thumbnail of every "
+        "image that has a spec in base.imagespecs, e.g. after seeding or after "
+        "changing a spec."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--model", action="append", dest="models",
+            help="Only this model, e.g. base.Gallery; repeat for several (default: all)",
+        )
+        parser.add_argument(
+            "--force", action="store_true",
+            help="Rewrite derivatives that already exist",
+        )
+
+    def handle(self, *args, **options):
+        labels = options["models"] or sorted({label for label, _ in SPECS})
+        unknown = set(labels) - {label for label, _ in SPECS}
+        if unknown:
+            raise CommandError(f"No image specs for {', '.join(sorted(unknown))}")
+
+        for (label, field_name), spec in SPECS.items():
+            if label not in labels:
+                continue
+            model = apps.get_model(label)
+            queryset = (
+                model.objects.exclude(**{f"{field_name}__isnull": True})
+                .exclude(**{field_name: ""})
+                .only("pk", field_name).order_by("pk")
+            )
+
+            generated = missing = 0
+            for obj in queryset.iterator():
+                image = getattr(obj, field_name)
+                if not image.storage.exists(image.name):
+                    missing += 1
+                    continue
+                spec.generate(image, force=options["force"])
+                admin_thumbnail(image).generate(force=options["force"])
+                generated += 1
+
+            self.stdout.write(self.style.SUCCESS(
+                f"✔ Derivatives ready for {generated} {label}.{field_name} images."
+            ))
+            if missing:
+                self.stderr.write(f"  {missing} source files are missing and were skipped.")
+
+        # Cached pages still hold plain <img> tags for these images
+        bump_version("home")
+        bump_version("pages")
@@ -1,19 +1,15 @@
 # base/management/commands/generate_events.py
 
-import os
-import random
-from datetime import timedelta, date, time as dtime
-from django.core.management.base import BaseCommand
-from django.conf import settings
+from datetime import time as dtime
 from faker import Faker
-from PIL import Image, ImageDraw
-from django.utils.text import slugify
 from base.models import Event
+from base.seeding import SeedCommand, UniqueSlugs, set_excerpts
 
-class Command(BaseCommand):
-    help = "Generate 30 multilingual fake Event entries with images"
+class Command(SeedCommand):
+    help = "Generate multilingual fake Event entries (30 by default) with images"
+    default_count = 30
 
-    def handle(self, *args, **options):
+    def seed(self, count):
         # Initialize Faker for each locale (fallback to default when unsupported)
         fake_en = Faker()
         try:
@@ -29,22 +25,15 @@ class Command(BaseCommand):
         except Exception:
             fake_sw = fake_en
 
-        output_dir = os.path.join(settings.MEDIA_ROOT, "events")
-        os.makedirs(output_dir, exist_ok=True)
-
-        def create_random_color():
-            return tuple(random.randint(0, 255) for _ in range(3))
-
-        def create_color_mosaic(width, height):
-            img = Image.new("RGB", (width, height))
-            draw = ImageDraw.Draw(img)
-            w2, h2 = width // 2, height // 2
-            quads = [(0,0,w2,h2), (w2,0,width,h2), (0,h2,w2,height), (w2,h2,width,height)]
-            for quad in quads:
-                draw.rectangle(quad, fill=create_random_color())
-            return img
+        def generate_filler(fake_inst):
+            paras = fake_inst.paragraphs(nb=2)
+            words = " ".join(paras).split()
+            # Guarantee at least 100 words
+            while len(words) < 100:
+                words += fake_inst.paragraph(nb_sentences=3).split()
+            return " ".join(words)
 
-        def generate_description(fake_inst, title, edate, lang):
+        def generate_description(title, edate, lang, filler):
             # Handcrafted intros per language
             if lang == 'en':
                 intro = (
@@ -71,13 +60,7 @@ class Command(BaseCommand):
                     "likitoa lishe ya kiroho na ibada yenye kukuinua."
                 )
 
-            paras = fake_inst.paragraphs(nb=2)
-            text = intro + " " + " ".join(paras)
-            words = text.split()
-            # Guarantee at least 100 words
-            while len(words) < 100:
-                words += fake_inst.paragraph(nb_sentences=3).split()
-            return " ".join(words)
+            return intro + " " + filler
 
         BIBLE_TOPICS = [
             "the Good Samaritan", "the Prodigal Son", "the Beatitudes",
@@ -96,56 +79,57 @@ class Command(BaseCommand):
             "Healing Service and Prayers"
         ]
 
-        for i in range(30):
-            # Pick a date within the next year
-            event_date = fake_en.date_between(start_date="today", end_date="+1y")
-
-            # Build English title (with occasional Bible topic)
-            tmpl = random.choice(EVENT_TEMPLATES)
-            if "{}" in tmpl:
-                title_en = tmpl.format(random.choice(BIBLE_TOPICS))
-            else:
-                title_en = tmpl
-
-            # Generate localized titles
-            title_fr = fake_fr.sentence(nb_words=6).rstrip('.')
-            title_rw = fake_rw.sentence(nb_words=6).rstrip('.')
-            title_sw = fake_sw.sentence(nb_words=6).rstrip('.')
-
-            # Random time slot
-            hour = random.randint(8, 18)
-            start = dtime(hour, random.choice([0,15,30,45]))
-            end   = dtime(min(hour+1,23), random.choice([0,15,30,45]))
-
-            # Generate rich descriptions
-            desc_en = generate_description(fake_en, title_en, event_date, 'en')
-            desc_fr = generate_description(fake_fr, title_fr, event_date, 'fr')
-            desc_rw = generate_description(fake_rw, title_rw, event_date, 'rw')
-            desc_sw = generate_description(fake_sw, title_sw, event_date, 'sw')
-
-            # Create and save the Event instance (slug generated in model.save)
-            event = Event(
-                event_date=event_date,
-                start_time=start,
-                end_time=end,
-                title_en=title_en,
-                title_fr=title_fr,
-                title_rw=title_rw,
-                title_sw=title_sw,
-                description_en=desc_en,
-                description_fr=desc_fr,
-                description_rw=desc_rw,
-                description_sw=desc_sw,
-            )
-            event.save()
+        # Localized titles and the filler after each intro come from pools
+        # so big runs stay fast; the intro itself is written per event.
+        fakes = {'en': fake_en, 'fr': fake_fr, 'rw': fake_rw, 'sw': fake_sw}
+        titles = {
+            code: self.pool(lambda fake=fake: fake.sentence(nb_words=6).rstrip('.'))
+            for code, fake in fakes.items() if code != 'en'
+        }
+        fillers = {
+            code: self.pool(lambda fake=fake: generate_filler(fake))
+            for code, fake in fakes.items()
+        }
+        slugs = UniqueSlugs(Event)
+
+        def events():
+            for _ in range(count):
+                # Pick a date within the next year
+                event_date = fake_en.date_between(start_date="today", end_date="+1y")
+
+                # Build English title (with occasional Bible topic)
+                tmpl = self.random.choice(EVENT_TEMPLATES)
+                if "{}" in tmpl:
+                    title_en = tmpl.format(self.random.choice(BIBLE_TOPICS))
+                else:
+                    title_en = tmpl
+
+                # Random time slot
+                hour = self.random.randint(8, 18)
+                start = dtime(hour, self.random.choice([0,15,30,45]))
+                end   = dtime(min(hour+1,23), self.random.choice([0,15,30,45]))
+
+                event = Event(
+                    event_date=event_date,
+                    start_time=start,
+                    end_time=end,
+                    slug=slugs(f"{title_en} {event_date.isoformat()}"),
+                    title_en=title_en,
+                    title_fr=titles['fr'](),
+                    title_rw=titles['rw'](),
+                    title_sw=titles['sw'](),
+                )
 
-            # Generate and attach mosaic image
-            img = create_color_mosaic(1200, 800)
-            fn  = f"event_{slugify(title_en)}_{event_date.isoformat()}.jpg"
-            path = os.path.join(output_dir, fn)
-            img.save(path, quality=85)
-            event.image = f"events/{fn}"
-            event.save()
+                # Generate rich descriptions
+                for code in ('en', 'fr', 'rw', 'sw'):
+                    title = getattr(event, f"title_{code}")
+                    setattr(event, f"description_{code}",
+                            generate_description(title, event_date, code, fillers[code]()))
 
-        self.stdout.write(self.style.SUCCESS("✅ Generated 30 multilingual Event entries."))
+                # Mosaic image named after the (unique) slug
+                event.image = self.image("events", f"event_{event.slug}.jpg", 1200, 800)
+                set_excerpts(event)
+                yield event
 
+        created = self.bulk_create(Event, events())
+        return f"✅ Generated {created} multilingual Event entries."
@@ -1,41 +1,18 @@
-import os
-import random
-from django.core.management.base import BaseCommand
-from django.conf import settings
 from faker import Faker
-from PIL import Image, ImageDraw
 from base.models import Homily
+from base.seeding import SeedCommand, set_excerpts
 
-class Command(BaseCommand):
-    help = "Generate 50 fake Homily entries with images and multilingual content"
+class Command(SeedCommand):
+    help = "Generate fake Homily entries (50 by default) with images and multilingual content"
+    default_count = 50
 
-    def handle(self, *args, **options):
+    def seed(self, count):
         # Separate Faker instances for different locales
         fake_en = Faker('en_US')
         fake_fr = Faker('fr_FR')
         fake_rw = Faker()   # fallback for Kinyarwanda
         fake_sw = Faker()   # fallback for Kiswahili
 
-        output_dir = os.path.join(settings.MEDIA_ROOT, "homilies")
-        os.makedirs(output_dir, exist_ok=True)
-
-        def create_random_color():
-            return tuple(random.randint(0, 255) for _ in range(3))
-
-        def create_random_color_image(width, height):
-            img = Image.new("RGB", (width, height))
-            draw = ImageDraw.Draw(img)
-            w2, h2 = width // 2, height // 2
-            coords = [
-                (0, 0, w2, h2),
-                (w2, 0, width, h2),
-                (0, h2, w2, height),
-                (w2, h2, width, height),
-            ]
-            for coord in coords:
-                draw.rectangle(coord, fill=create_random_color())
-            return img
-
         def ensure_word_count(text, min_words=500):
             words = text.split()
             while len(words) < min_words:
@@ -83,41 +60,36 @@ class Command(BaseCommand):
             paras = fake_sw.paragraphs(nb=4)
             return " ".join([intro] + paras)
 
-        for i in range(1, 51):
-            published_at = fake_en.date_between(start_date='-1y', end_date='today')
-
-            # Titles in each language
-            title_en = fake_en.sentence(nb_words=6)
-            title_fr = fake_fr.sentence(nb_words=6)
-            title_rw = fake_rw.sentence(nb_words=6)
-            title_sw = fake_sw.sentence(nb_words=6)
-
-            # Content in each language, ensured ≥500 words
-            content_en = ensure_word_count(generate_christian_content_en())
-            content_fr = ensure_word_count(generate_christian_content_fr())
-            content_rw = ensure_word_count(generate_christian_content_rw())
-            content_sw = ensure_word_count(generate_christian_content_sw())
-
-            # Instantiate and assign
-            homily = Homily(
-                published_at=published_at,
-                title_en=title_en,
-                title_fr=title_fr,
-                title_rw=title_rw,
-                title_sw=title_sw,
-                content_en=content_en,
-                content_fr=content_fr,
-                content_rw=content_rw,
-                content_sw=content_sw,
-            )
-
-            # Generate and save a random color-block image
-            img = create_random_color_image(1200, 800)
-            filename = f"homily_{i}.jpg"
-            path = os.path.join(output_dir, filename)
-            img.save(path, quality=85)
-            homily.image = f"homilies/{filename}"
-
-            homily.save()
-
-        self.stdout.write(self.style.SUCCESS("✅ Generated 50 multilingual Homily entries with images."))
+        # Titles and ≥500-word bodies are drawn from pools so big runs stay fast
+        titles = {
+            code: self.pool(lambda fake=fake: fake.sentence(nb_words=6))
+            for code, fake in (('en', fake_en), ('fr', fake_fr), ('rw', fake_rw), ('sw', fake_sw))
+        }
+        contents = {
+            'en': self.pool(lambda: ensure_word_count(generate_christian_content_en())),
+            'fr': self.pool(lambda: ensure_word_count(generate_christian_content_fr())),
+            'rw': self.pool(lambda: ensure_word_count(generate_christian_content_rw())),
+            'sw': self.pool(lambda: ensure_word_count(generate_christian_content_sw())),
+        }
+        first_id = self.next_id(Homily)
+
+        def homilies():
+            for i in range(count):
+                homily = Homily(
+                    published_at=fake_en.date_between(start_date='-1y', end_date='today'),
+                    title_en=titles['en'](),
+                    title_fr=titles['fr'](),
+                    title_rw=titles['rw'](),
+                    title_sw=titles['sw'](),
+                    content_en=contents['en'](),
+                    content_fr=contents['fr'](),
+                    content_rw=contents['rw'](),
+                    content_sw=contents['sw'](),
+                )
+                # Random color-block image
+                homily.image = self.image("homilies", f"homily_{first_id + i}.jpg", 1200, 800)
+                set_excerpts(homily)
+                yield homily
+
+        created = self.bulk_create(Homily, homilies())
+        return f"✅ Generated {created} multilingual Homily entries with images."
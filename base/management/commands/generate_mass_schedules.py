@@ -1,44 +1,83 @@
-from django.core.management.base import BaseCommand
-from datetime import date, time, timedelta
-from base.models import MassSchedule
+from datetime import date, datetime, time, timedelta
+from base.models import MassRule, MassSchedule
+from base.seeding import SeedCommand
 
-class Command(BaseCommand):
+START_DATE = date(2025, 1, 1)
+
+WEEKDAYS = dict.fromkeys(MassRule.WEEKDAYS[:5], True)
+
+# The parish's week: (mass_type, start, end, days)
+RULES = (
+    (MassSchedule.MORNING, time(6, 30),  time(7, 30),  {**WEEKDAYS, "saturday": True}),
+    (MassSchedule.EVENING, time(18, 0),  time(19, 0),  WEEKDAYS),
+    (MassSchedule.MORNING, time(7, 0),   time(8, 30),  {"sunday": True}),
+    (MassSchedule.MORNING, time(10, 0),  time(11, 30), {"sunday": True}),
+    (MassSchedule.EVENING, time(18, 0),  time(19, 30), {"sunday": True}),
+)
+
+def half_an_hour_later(value):
+    return (datetime.combine(START_DATE, value) + timedelta(minutes=30)).time()
+
+class Command(SeedCommand):
     help = (
-        "Generate daily morning and evening MassSchedule entries "
-        "from January 1, 2025 through June 30, 2025."
+        "Create the recurring Masses (weekdays 06:30 and 18:00, Saturdays "
+        "06:30, Sundays 07:00, 10:00 and 18:00) from January 1, 2025 unless "
+        "there already are some, then --count dated MassSchedule rows from "
+        "that day on: recurring Masses moved or cancelled, and one-off Masses."
     )
+    default_count = 362
+
+    def seed(self, count):
+        rules = list(MassRule.objects.all())
+        created_rules = 0
+        if not rules:
+            rules = [
+                MassRule(
+                    mass_type=mass_type, start_time=start, end_time=end,
+                    starts_on=START_DATE, **days,
+                )
+                for mass_type, start, end, days in RULES
+            ]
+            created_rules = self.bulk_create(MassRule, rules)
+
+        def first_rule_on(day):
+            matching = [rule for rule in rules if day.weekday() in rule.weekdays() and rule.applies_on(day)]
+            return min(matching, key=lambda rule: rule.start_time, default=None)
+
+        def schedules():
+            # Even rows change the day's first recurring Mass, moving it half
+            # an hour later or, every other time, cancelling it; odd rows add
+            # a one-off evening Mass.
+            for i in range(count):
+                current = START_DATE + timedelta(days=i // 2)
+                rule = first_rule_on(current) if i % 2 == 0 else None
+                if rule is None:
+                    yield MassSchedule(
+                        date=current,
+                        start_time=time(20, 0),
+                        end_time=  time(21, 0),
+                        mass_type=MassSchedule.EVENING,
+                    )
+                elif i % 4 == 0:
+                    yield MassSchedule(
+                        date=current,
+                        start_time=rule.start_time,
+                        end_time=rule.end_time,
+                        mass_type=rule.mass_type,
+                        rule=rule,
+                        cancelled=True,
+                    )
+                else:
+                    yield MassSchedule(
+                        date=current,
+                        start_time=half_an_hour_later(rule.start_time),
+                        end_time=half_an_hour_later(rule.end_time),
+                        mass_type=rule.mass_type,
+                        rule=rule,
+                    )
 
-    def handle(self, *args, **options):
-        start_date = date(2025, 1, 1)
-        end_date   = date(2025, 6, 30)
-        one_day    = timedelta(days=1)
-        current    = start_date
-        created    = 0
-
-        while current <= end_date:
-            # Morning Mass
-            ms_morning = MassSchedule(
-                date=current,
-                start_time=time(8,  0),
-                end_time=  time(9,  0),
-                mass_type=MassSchedule.MORNING,
-            )
-            ms_morning.save()
-            created += 1
-
-            # Evening Mass
-            ms_evening = MassSchedule(
-                date=current,
-                start_time=time(18, 0),
-                end_time=  time(19, 0),
-                mass_type=MassSchedule.EVENING,
-            )
-            ms_evening.save()
-            created += 1
-
-            current += one_day
-
-        self.stdout.write(self.style.SUCCESS(
-            f"✅ Generated {created} MassSchedule entries "
-            f"({(created//2)} days × 2 masses)"
-        ))
+        created = self.bulk_create(MassSchedule, schedules())
+        return (
+            f"✅ Generated {created_rules} recurring Masses and {created} MassSchedule "
+            f"entries over {(created + 1) // 2} days (changes and one-off Masses)"
+        )
@@ -1,17 +1,12 @@
-import os
-import random
-from datetime import datetime
-from django.core.management.base import BaseCommand
-from django.conf import settings
 from faker import Faker
-from PIL import Image, ImageDraw
-from django.utils.text import slugify
 from base.models import Amenity, Room, RoomImage
+from base.seeding import SeedCommand, UniqueSlugs, batched
 
-class Command(BaseCommand):
-    help = "Generate 20 fake rooms, each with at least 4 images and random amenities"
+class Command(SeedCommand):
+    help = "Generate fake rooms (20 by default), each with 4 images and random amenities"
+    default_count = 20
 
-    def handle(self, *args, **options):
+    def seed(self, count):
         fake = Faker()
 
         # Ensure default amenities exist
@@ -19,68 +14,49 @@ class Command(BaseCommand):
             "Free WiFi", "Air Conditioning", "Breakfast Included", "Parking", "Pool Access", "Gym Access", "Pet Friendly", "Room Service"
         ]
         if Amenity.objects.count() == 0:
-            for amen_name in default_amenities:
-                Amenity.objects.create(name=amen_name)
+            Amenity.objects.bulk_create(Amenity(name=amen_name) for amen_name in default_amenities)
+            self.seeded.add(Amenity)
             self.stdout.write(self.style.SUCCESS("✔ Default amenities created."))
 
-        amenities_qs = list(Amenity.objects.all())
-
-        def create_random_image(width, height, dest_path):
-            # Create a simple color mosaic image
-            img = Image.new("RGB", (width, height))
-            draw = ImageDraw.Draw(img)
-            w2, h2 = width // 2, height // 2
-            quads = [
-                (0, 0, w2, h2),
-                (w2, 0, width, h2),
-                (0, h2, w2, height),
-                (w2, h2, width, height),
-            ]
-            for quad in quads:
-                color = tuple(random.randint(0, 255) for _ in range(3))
-                draw.rectangle(quad, fill=color)
-            img.save(dest_path, format='JPEG', quality=85)
-
-        # Generate 20 rooms
-        for i in range(1, 21):
-            title = f"{fake.word().capitalize()} {random.choice(['Room','Suite','Deluxe','Studio'])}"
-            location = fake.city()
-            description = "\n\n".join(fake.paragraphs(nb=3))
-            price = round(random.uniform(50, 300), 2)
-
-            room = Room(
-                title=title,
-                location=location,
-                description=description,
-                price_per_night=price,
-            )
-            room.save()  # slug is now set
-
-            # Assign random 3-5 amenities
-            num_amen = random.randint(3, 5)
-            chosen = random.sample(amenities_qs, num_amen)
-            room.amenities.set(chosen)
-
-            # Create directory for images: MEDIA_ROOT/rooms/room_<slug>
-            slug = slugify(room.title)
-            img_dir = os.path.join(settings.MEDIA_ROOT, f"rooms/room_{slug}")
-            os.makedirs(img_dir, exist_ok=True)
+        amenities_qs = list(Amenity.objects.values_list("id", flat=True))
+        descriptions = self.pool(lambda: "\n\n".join(fake.paragraphs(nb=3)))
+        slugs = UniqueSlugs(Room)
+        Through = Room.amenities.through
+
+        def rooms():
+            for _ in range(count):
+                title = f"{fake.word().capitalize()} {self.random.choice(['Room','Suite','Deluxe','Studio'])}"
+                yield Room(
+                    title=title,
+                    slug=slugs(title),
+                    location=fake.city(),
+                    description=descriptions(),
+                    price_per_night=round(self.random.uniform(50, 300), 2),
+                )
 
-            # Generate 4 images per room
-            for idx in range(1, 5):
-                filename = f"image_{idx}.jpg"
-                file_path = os.path.join(img_dir, filename)
-                create_random_image(800, 600, file_path)
+        # Inserted batch by batch below rather than through self.bulk_create
+        self.seeded.update((Room, RoomImage, Through))
+        created = 0
+        for batch in batched(rooms(), self.batch_size):
+            Room.objects.bulk_create(batch)  # rooms come back with their ids
 
-                # Save RoomImage pointing to relative path
-                rel_path = f"rooms/room_{slug}/{filename}"
-                room_image = RoomImage(
+            # 4 images per room under MEDIA_ROOT/rooms/room_<slug>/
+            RoomImage.objects.bulk_create(
+                RoomImage(
                     room=room,
-                    image=rel_path,
-                    alt_text=f"{room.title} image {idx}"
+                    image=self.image("rooms", f"room_{room.slug}/image_{idx}.jpg", 800, 600),
+                    alt_text=f"{room.title} image {idx}",
                 )
-                room_image.save()
+                for room in batch
+                for idx in range(1, 5)
+            )
 
-            self.stdout.write(self.style.SUCCESS(f"✔ Created room '{room.title}' with 4 images and amenities."))
+            # Random 3-5 amenities per room, in one insert per batch
+            Through.objects.bulk_create(
+                Through(room_id=room.id, amenity_id=amenity_id)
+                for room in batch
+                for amenity_id in self.random.sample(amenities_qs, min(self.random.randint(3, 5), len(amenities_qs)))
+            )
+            created += len(batch)
 
-        self.stdout.write(self.style.SUCCESS("🎉 Successfully generated 20 rooms with images and amenities."))
+        return f"🎉 Successfully generated {created} rooms with images and amenities."
@@ -0,0 +1,55 @@
+import time
+import traceback
+from django.core.management.base import BaseCommand
+from base import jobs
+
+class Command(BaseCommand):
+    help = (
+        "Work through the ImageJob queue: resize uploaded images and write their "
+        "responsive derivatives.  Runs until stopped, or until the queue is empty "
+        "with --once."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once", action="store_true",
+            help="Exit when no job is due instead of waiting for more",
+        )
+        parser.add_argument(
+            "--poll", type=float, default=2.0,
+            help="Seconds to sleep when the queue is empty (default: 2)",
+        )
+        parser.add_argument(
+            "--max-attempts", type=int, default=5,
+            help="Tries before a job is marked failed (default: 5)",
+        )
+
+    def handle(self, *args, **options):
+        processed = failed = 0
+        try:
+            while True:
+                job = jobs.claim()
+                if job is None:
+                    if options["once"]:
+                        break
+                    time.sleep(options["poll"])
+                    continue
+
+                try:
+                    jobs.process(job)
+                except Exception:
+                    jobs.fail(job, traceback.format_exc(), options["max_attempts"])
+                    failed += 1
+                    self.stderr.write(f"✘ {job}: attempt {job.attempts} failed")
+                else:
+                    job.delete()
+                    processed += 1
+                    if options["verbosity"] > 1:
+                        self.stdout.write(f"✔ {job}")
+        except KeyboardInterrupt:
+            # A job cut short stays running and is picked up again once stale
+            pass
+
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ Processed {processed} images ({failed} failed attempts)."
+        ))
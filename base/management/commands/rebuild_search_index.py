@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand, CommandError
+from base import search
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the full-text search index from Homily, Event, Advertisement, "
+        "HealingPrayer and Gallery, e.g. after seeding with the generate_* commands."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size", type=int, default=500,
+            help="Index rows inserted per statement batch (default: 500)",
+        )
+
+    def handle(self, *args, **options):
+        if not search.available():
+            raise CommandError("Full-text search needs SQLite with FTS5.")
+        counts = search.rebuild(batch_size=options["batch_size"])
+        for kind, count in counts.items():
+            self.stdout.write(f"  {kind}: {count}")
+        self.stdout.write(self.style.SUCCESS(f"✔ Indexed {sum(counts.values())} rows in four languages."))
@@ -0,0 +1,132 @@
+import os
+import re
+import mimetypes
+import posixpath
+from urllib.parse import quote
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import FileResponse, Http404, HttpResponse, StreamingHttpResponse
+from django.utils._os import safe_join
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, parse_http_date_safe, quote_etag
+from django.views.decorators.http import require_safe
+
+# Bytes read from disk per chunk of a streamed range
+CHUNK_SIZE = 64 * 1024
+
+RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+def parse_range(header, size):
+    """
+    (start, end) inclusive for a single-range `Range: bytes=...` header, or
+    None when the header should be ignored and the whole file sent (absent,
+    malformed or asking for several ranges).  Raises ValueError when the
+    range lies entirely past the end of the file.
+    """
+    match = RANGE_RE.match(header.strip()) if header else None
+    if not match or match.group(1) == match.group(2) == "":
+        return None
+    first, last = match.groups()
+    if first == "":
+        # bytes=-500: the last 500 bytes
+        length = int(last)
+        if length == 0:
+            raise ValueError(header)
+        return max(size - length, 0), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start > end:
+        if start >= size:
+            raise ValueError(header)
+        return None
+    return start, end
+
+def read_range(path, start, length, chunk_size=CHUNK_SIZE):
+    with open(path, "rb") as fh:
+        fh.seek(start)
+        while length > 0:
+            chunk = fh.read(min(chunk_size, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+
+def file_validators(stat):
+    """
+    ETag and Last-Modified from the file's size and mtime; a replaced file
+    under the same name gets a new ETag.
+    """
+    etag = quote_etag(f"{stat.st_size:x}-{stat.st_mtime_ns:x}")
+    return etag, int(stat.st_mtime)
+
+def sendfile_response(path, name):
+    """
+    An empty response telling the front proxy to send the file itself,
+    per settings.MEDIA_SENDFILE; Range and the transfer are then its job.
+    """
+    response = HttpResponse()
+    if settings.MEDIA_SENDFILE == "x-accel-redirect":
+        response["X-Accel-Redirect"] = quote(posixpath.join(settings.MEDIA_ACCEL_PREFIX, name))
+    else:
+        response["X-Sendfile"] = path
+    return response
+
+@require_safe
+def serve_media(request, path):
+    """
+    Serve a file from MEDIA_ROOT with long-lived caching, ETag and
+    Last-Modified revalidation and single byte-range requests, so audio
+    and video testimonies can be seeked without downloading them whole.
+    Whole files go through FileResponse (and so the server's sendfile
+    where available); ranges are streamed from disk in chunks.
+    """
+    try:
+        full_path = safe_join(settings.MEDIA_ROOT, path)
+        stat = os.stat(full_path)
+    except (SuspiciousFileOperation, OSError):
+        raise Http404("No such media file")
+    if not os.path.isfile(full_path):
+        raise Http404("No such media file")
+
+    etag, last_modified = file_validators(stat)
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        response = build_media_response(request, full_path, path, stat.st_size, etag, last_modified)
+
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(last_modified)
+    patch_cache_control(response, public=True, max_age=settings.MEDIA_CACHE_MAX_AGE)
+    return response
+
+def build_media_response(request, full_path, path, size, etag, last_modified):
+    content_type, encoding = mimetypes.guess_type(full_path)
+    content_type = content_type or "application/octet-stream"
+
+    if settings.MEDIA_SENDFILE:
+        response = sendfile_response(full_path, path)
+        response["Content-Type"] = content_type
+        return response
+
+    byte_range = None
+    if_range = request.META.get("HTTP_IF_RANGE")
+    if not if_range or if_range == etag or parse_http_date_safe(if_range) == last_modified:
+        try:
+            byte_range = parse_range(request.META.get("HTTP_RANGE"), size)
+        except ValueError:
+            response = HttpResponse(status=416)
+            response["Content-Range"] = f"bytes */{size}"
+            return response
+
+    if byte_range is None:
+        response = FileResponse(open(full_path, "rb"), content_type=content_type)
+    else:
+        start, end = byte_range
+        length = end - start + 1
+        body = read_range(full_path, start, length) if request.method == "GET" else ()
+        response = StreamingHttpResponse(body, status=206, content_type=content_type)
+        response["Content-Length"] = str(length)
+        response["Content-Range"] = f"bytes {start}-{end}/{size}"
+    if encoding:
+        response["Content-Encoding"] = encoding
+    response["Accept-Ranges"] = "bytes"
+    return response
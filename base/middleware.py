@@ -1,8 +1,156 @@
+import re
+import hashlib
+from django.conf import settings
+from django.core.cache import cache
+from django.urls import get_script_prefix, set_script_prefix
+from django.utils.http import parse_http_date_safe, urlencode
+from django.utils.translation.trans_real import parse_accept_lang_header
+from django.utils.cache import (
+    get_conditional_response, has_vary_header, patch_cache_control,
+    patch_response_headers, patch_vary_headers,
+)
+from base.cache import versioned_key
+from base.translations import active_lang
+from base.views import SUPPORTED_LANGS, LANG_COOKIE_NAME, LANG_COOKIE_SALT
+
 class DefaultLanguageMiddleware:
+    """
+    Resolve the visitor's language into `request.lang` without writing to
+    the session: URL prefix, then the signed `lang` cookie set by
+    change_language, then "lang" in an already existing session, then the
+    Accept-Language header, then English.
+
+    The session is only read when the browser already sent a session
+    cookie, so first-time visitors and bots never create a django_session
+    row or trigger a write on a read-only request.
+
+    The language is also published as base.translations.active_lang for
+    the duration of the request, which is what the `translate` template
+    library reads.
+
+    Media files are the same in every language, the API takes its
+    language from ?lang= and the calendar feeds from their URL: all of
+    them skip this, so they never read the session or get a Vary: Cookie
+    that would stop shared caches from keeping them.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if request.path_info.startswith((settings.MEDIA_URL, settings.API_URL, settings.CALENDAR_URL)):
+            return self.get_response(request)
+
+        url_lang = getattr(request, "url_lang", None)
+        request.lang = url_lang or self.resolve(request)
+        token = active_lang.set(request.lang)
+        try:
+            response = self.get_response(request)
+        finally:
+            active_lang.reset(token)
+        if not url_lang:
+            patch_vary_headers(response, ("Cookie", "Accept-Language"))
+        return response
+
+    def resolve(self, request):
+        lang = request.get_signed_cookie(LANG_COOKIE_NAME, default=None, salt=LANG_COOKIE_SALT)
+        if lang in SUPPORTED_LANGS:
+            return lang
+
+        if settings.SESSION_COOKIE_NAME in request.COOKIES:
+            lang = request.session.get("lang")
+            if lang in SUPPORTED_LANGS:
+                return lang
+
+        for code, _ in parse_accept_lang_header(request.META.get("HTTP_ACCEPT_LANGUAGE", "")):
+            code = code.split("-")[0].lower()
+            if code in SUPPORTED_LANGS:
+                return code
+        return "en"
+
+class LanguagePrefixMiddleware:
+    """
+    Opt-in language-prefixed URLs: /fr/homilies/ serves the homilies page in
+    French without reading or writing the session.
+
+    The prefix is stripped from path_info before URL resolution and pushed
+    onto the script prefix, so {% url %} keeps generating /fr/... links.
+    Because such pages depend on the URL alone, GET responses for anonymous
+    visitors are cached per URL until any content model changes.
+
+    The cache key is the path plus the pagination parameters only, so other
+    Host headers or made-up query strings cannot fill the cache with copies
+    of the same page and push real pages out.  Requests carrying any other
+    query parameter (e.g. a search) are served uncached.
+    """
+
+    # Query parameters that select a different page of the same view
+    cache_query_params = ("page", "cursor")
+
     def __init__(self, get_response):
         self.get_response = get_response
+        langs = "|".join(re.escape(code) for code in SUPPORTED_LANGS)
+        self.prefix_re = re.compile(rf"^/({langs})(/.*)$")
 
     def __call__(self, request):
-        if "lang" not in request.session:
-            request.session["lang"] = "en"
-        return self.get_response(request)
+        match = self.prefix_re.match(request.path_info)
+        if not match:
+            return self.get_response(request)
+
+        request.url_lang = match.group(1)
+        request.path_info = match.group(2)
+
+        script_prefix = get_script_prefix()
+        set_script_prefix(f"{script_prefix}{request.url_lang}/")
+        try:
+            if not self.is_cacheable_request(request):
+                return self.get_response(request)
+            return self.cached_response(request)
+        finally:
+            set_script_prefix(script_prefix)
+
+    def is_cacheable_request(self, request):
+        # Anonymous visitors only: anyone with a session may be logged in
+        return (
+            request.method in ("GET", "HEAD")
+            and settings.SESSION_COOKIE_NAME not in request.COOKIES
+            and all(name in self.cache_query_params for name in request.GET)
+        )
+
+    def is_cacheable_response(self, response):
+        return (
+            response.status_code == 200
+            and not response.streaming
+            and not response.cookies
+            and not has_vary_header(response, "Cookie")
+            and "private" not in response.get("Cache-Control", "")
+            and "no-cache" not in response.get("Cache-Control", "")
+        )
+
+    def cache_key(self, request):
+        # request.path still carries the language prefix
+        query = urlencode(sorted(
+            (name, request.GET[name]) for name in self.cache_query_params if name in request.GET
+        ))
+        digest = hashlib.md5(f"{request.path}?{query}".encode(), usedforsecurity=False)
+        return versioned_key("pages", digest.hexdigest())
+
+    def cached_response(self, request):
+        key = self.cache_key(request)
+
+        response = cache.get(key)
+        if response is None:
+            response = self.get_response(request)
+            if self.is_cacheable_response(response):
+                patch_response_headers(response, settings.PAGE_CACHE_TIMEOUT)
+                patch_cache_control(response, public=True)
+                cache.set(key, response, settings.PAGE_CACHE_TIMEOUT)
+            return response
+
+        not_modified = get_conditional_response(
+            request,
+            etag=response.get("ETag"),
+            last_modified=parse_http_date_safe(response.get("Last-Modified", "")),
+            response=response,
+        )
+        return not_modified or response
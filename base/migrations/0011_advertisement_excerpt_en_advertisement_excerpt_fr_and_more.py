@@ -0,0 +1,93 @@
+# Generated by Django 4.2.21 on 2026-10-18 15:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0010_healingprayer'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='advertisement',
+            name='excerpt_en',
+            field=models.TextField(blank=True, editable=False, help_text='English excerpt of the content'),
+        ),
+        migrations.AddField(
+            model_name='advertisement',
+            name='excerpt_fr',
+            field=models.TextField(blank=True, editable=False, help_text='French excerpt of the content'),
+        ),
+        migrations.AddField(
+            model_name='advertisement',
+            name='excerpt_rw',
+            field=models.TextField(blank=True, editable=False, help_text='Kinyarwanda excerpt of the content'),
+        ),
+        migrations.AddField(
+            model_name='advertisement',
+            name='excerpt_sw',
+            field=models.TextField(blank=True, editable=False, help_text='Kiswahili excerpt of the content'),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='excerpt_en',
+            field=models.TextField(blank=True, editable=False, help_text='English excerpt of the description'),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='excerpt_fr',
+            field=models.TextField(blank=True, editable=False, help_text='French excerpt of the description'),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='excerpt_rw',
+            field=models.TextField(blank=True, editable=False, help_text='Kinyarwanda excerpt of the description'),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='excerpt_sw',
+            field=models.TextField(blank=True, editable=False, help_text='Kiswahili excerpt of the description'),
+        ),
+        migrations.AddField(
+            model_name='healingprayer',
+            name='excerpt_en',
+            field=models.TextField(blank=True, editable=False, help_text='English excerpt of the content'),
+        ),
+        migrations.AddField(
+            model_name='healingprayer',
+            name='excerpt_fr',
+            field=models.TextField(blank=True, editable=False, help_text='French excerpt of the content'),
+        ),
+        migrations.AddField(
+            model_name='healingprayer',
+            name='excerpt_rw',
+            field=models.TextField(blank=True, editable=False, help_text='Kinyarwanda excerpt of the content'),
+        ),
+        migrations.AddField(
+            model_name='healingprayer',
+            name='excerpt_sw',
+            field=models.TextField(blank=True, editable=False, help_text='Kiswahili excerpt of the content'),
+        ),
+        migrations.AddField(
+            model_name='homily',
+            name='excerpt_en',
+            field=models.TextField(blank=True, editable=False, help_text='English excerpt of the content'),
+        ),
+        migrations.AddField(
+            model_name='homily',
+            name='excerpt_fr',
+            field=models.TextField(blank=True, editable=False, help_text='French excerpt of the content'),
+        ),
+        migrations.AddField(
+            model_name='homily',
+            name='excerpt_rw',
+            field=models.TextField(blank=True, editable=False, help_text='Kinyarwanda excerpt of the content'),
+        ),
+        migrations.AddField(
+            model_name='homily',
+            name='excerpt_sw',
+            field=models.TextField(blank=True, editable=False, help_text='Kiswahili excerpt of the content'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 4.2.21 on 2026-10-18 15:40
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0011_advertisement_excerpt_en_advertisement_excerpt_fr_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='gallery',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 4.2.21 on 2026-10-18 15:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0012_gallery_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='advertisement',
+            index=models.Index(fields=['published_at', 'created_at'], name='advert_published_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['event_date', 'created_at'], name='event_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='gallery',
+            index=models.Index(fields=['created_at'], name='gallery_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='healingprayer',
+            index=models.Index(fields=['created_at'], name='healingprayer_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='homily',
+            index=models.Index(fields=['published_at', 'created_at'], name='homily_published_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='member',
+            index=models.Index(fields=['role'], name='member_role_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='member',
+            index=models.Index(fields=['role', 'name'], name='member_role_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='room',
+            index=models.Index(fields=['created_at'], name='room_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='roomimage',
+            index=models.Index(fields=['room', 'uploaded_at'], name='roomimage_room_uploaded_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='testimony',
+            index=models.Index(fields=['status', 'created_at'], name='testimony_status_idx'),
+        ),
+    ]
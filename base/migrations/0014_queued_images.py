@@ -0,0 +1,73 @@
+# Generated by Django 4.2.21 on 2026-10-18 15:46
+
+import base.fields
+import base.models
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0013_list_view_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='advertisement',
+            name='image',
+            field=base.fields.QueuedImageField(blank=True, help_text='Main banner image; auto-resized/cropped to 1200×600.', null=True, upload_to=base.models.advertisement_image_path),
+        ),
+        migrations.AlterField(
+            model_name='event',
+            name='image',
+            field=base.fields.QueuedImageField(blank=True, help_text='Main banner image for the event; auto-cropped and resized.', null=True, upload_to=base.models.event_image_path),
+        ),
+        migrations.AlterField(
+            model_name='gallery',
+            name='image',
+            field=base.fields.QueuedImageField(help_text='Main gallery image resized to 1200×800', upload_to=base.models.gallery_image_path),
+        ),
+        migrations.AlterField(
+            model_name='healingprayer',
+            name='image',
+            field=base.fields.QueuedImageField(blank=True, null=True, upload_to=base.models.healing_prayer_image_path),
+        ),
+        migrations.AlterField(
+            model_name='homily',
+            name='image',
+            field=base.fields.QueuedImageField(blank=True, null=True, upload_to=base.models.homily_image_path),
+        ),
+        migrations.AlterField(
+            model_name='member',
+            name='image',
+            field=base.fields.QueuedImageField(blank=True, help_text='Portrait image; will be cropped/downsized to a 400×400 square', null=True, upload_to=base.models.member_image_path),
+        ),
+        migrations.AlterField(
+            model_name='roomimage',
+            name='image',
+            field=base.fields.QueuedImageField(help_text='Upload room image; resized to 800×600.', upload_to=base.models.room_image_upload_path),
+        ),
+        migrations.CreateModel(
+            name='ImageJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('model', models.CharField(help_text='e.g. base.Gallery', max_length=100)),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('field_name', models.CharField(max_length=50)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('running', 'Running'), ('failed', 'Failed')], default='pending', max_length=10)),
+                ('attempts', models.PositiveSmallIntegerField(default=0)),
+                ('run_after', models.DateTimeField(default=django.utils.timezone.now, help_text='Not picked up before this time')),
+                ('locked_at', models.DateTimeField(blank=True, help_text='When a worker took the job', null=True)),
+                ('last_error', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Image Job',
+                'verbose_name_plural': 'Image Jobs',
+                'ordering': ['run_after', 'id'],
+                'indexes': [models.Index(fields=['status', 'run_after'], name='imagejob_status_idx'), models.Index(fields=['model', 'object_id'], name='imagejob_target_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+from django.db import migrations
+from base import search
+
+def create_index(apps, schema_editor):
+    # FTS5 is SQLite-only; elsewhere the admin keeps its LIKE search
+    if not search.available(schema_editor.connection):
+        return
+    schema_editor.execute(search.CREATE_TABLE)
+    search.rebuild(using=schema_editor.connection, get_model=apps.get_model)
+
+def drop_index(apps, schema_editor):
+    if search.available(schema_editor.connection):
+        schema_editor.execute(f"DROP TABLE IF EXISTS {search.TABLE}")
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0014_queued_images'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_index, drop_index),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.21 on 2026-10-18 15:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0015_search_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='room',
+            index=models.Index(fields=['location'], name='room_location_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='room',
+            index=models.Index(fields=['title'], name='room_title_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='testimony',
+            index=models.Index(fields=['created_at'], name='testimony_created_idx'),
+        ),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 4.2.21 on 2026-10-18 16:10
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0016_admin_changelist_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MassRule',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('mass_type', models.CharField(choices=[('morning', 'Morning Mass'), ('evening', 'Evening Mass')], default='morning', help_text='Morning or Evening', max_length=10)),
+                ('start_time', models.TimeField(help_text='Start time (HH:MM)')),
+                ('end_time', models.TimeField(help_text='End time (HH:MM)')),
+                ('monday', models.BooleanField(default=False)),
+                ('tuesday', models.BooleanField(default=False)),
+                ('wednesday', models.BooleanField(default=False)),
+                ('thursday', models.BooleanField(default=False)),
+                ('friday', models.BooleanField(default=False)),
+                ('saturday', models.BooleanField(default=False)),
+                ('sunday', models.BooleanField(default=False)),
+                ('starts_on', models.DateField(default=django.utils.timezone.localdate, help_text='First date the rule applies')),
+                ('ends_on', models.DateField(blank=True, help_text='Last date the rule applies; leave empty for no end', null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Recurring Mass',
+                'verbose_name_plural': 'Recurring Masses',
+                'ordering': ['start_time'],
+            },
+        ),
+        migrations.AddField(
+            model_name='massschedule',
+            name='cancelled',
+            field=models.BooleanField(default=False, help_text='Tick to cancel the recurring Mass on this date.'),
+        ),
+        migrations.AddIndex(
+            model_name='massschedule',
+            index=models.Index(fields=['date', 'start_time'], name='massschedule_date_idx'),
+        ),
+        migrations.AddField(
+            model_name='massschedule',
+            name='rule',
+            field=models.ForeignKey(blank=True, help_text='The recurring Mass this row replaces on its date; leave empty for a one-off Mass.', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='overrides', to='base.massrule'),
+        ),
+    ]
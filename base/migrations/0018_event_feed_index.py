@@ -0,0 +1,17 @@
+# Generated by Django 4.2.21 on 2026-10-18 16:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0017_mass_rules'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['event_date', 'updated_at'], name='event_feed_idx'),
+        ),
+    ]
@@ -0,0 +1,60 @@
+# Generated by Django 4.2.21 on 2026-10-18 16:16
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0018_event_feed_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Booking',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('check_in', models.DateField(help_text='Arrival date (YYYY-MM-DD)')),
+                ('check_out', models.DateField(help_text='Departure date (YYYY-MM-DD); its night is not booked')),
+                ('guest_name', models.CharField(max_length=150)),
+                ('guest_email', models.EmailField(max_length=254)),
+                ('guest_phone', models.CharField(blank=True, max_length=30)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('confirmed', 'Confirmed'), ('cancelled', 'Cancelled')], default='pending', max_length=10)),
+                ('total_price', models.DecimalField(decimal_places=2, editable=False, help_text='Nightly rate at booking time times the nights, in USD.', max_digits=10)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Booking',
+                'verbose_name_plural': 'Bookings',
+                'ordering': ['-check_in'],
+            },
+        ),
+        migrations.AddField(
+            model_name='room',
+            name='booking_version',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name='room',
+            index=models.Index(fields=['price_per_night', 'id'], name='room_price_idx'),
+        ),
+        migrations.AddField(
+            model_name='booking',
+            name='room',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='bookings', to='base.room'),
+        ),
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['room', 'check_in', 'check_out', 'status'], name='booking_room_stay_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['check_in'], name='booking_check_in_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='booking',
+            constraint=models.CheckConstraint(check=models.Q(('check_out__gt', models.F('check_in'))), name='booking_stay_not_empty'),
+        ),
+    ]
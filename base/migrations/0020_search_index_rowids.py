@@ -0,0 +1,18 @@
+from django.db import migrations
+from base import search
+
+def reindex(apps, schema_editor):
+    # Rows indexed before rowids were derived from (kind, object_id, lang)
+    # would never be found again by index() and unindex()
+    if search.available(schema_editor.connection):
+        search.rebuild(using=schema_editor.connection, get_model=apps.get_model)
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0019_room_bookings'),
+    ]
+
+    operations = [
+        migrations.RunPython(reindex, migrations.RunPython.noop),
+    ]
@@ -1,13 +1,71 @@
 import os
+import html
+import datetime
+from django.conf import settings
 from django.db import models
-from django.utils.text import slugify
+from django.core.exceptions import ValidationError
+from django.utils import timezone
+from django.utils.text import slugify, Truncator
+from django.utils.html import strip_tags
 from django.utils.html import mark_safe
 from imagekit.processors import ResizeToFill
-from imagekit.models import ProcessedImageField
+from base.fields import QueuedImageField
+from base.imagespecs import admin_thumbnail_url
 from django.core.validators import FileExtensionValidator
 from ckeditor_uploader.fields import RichTextUploadingField
 
+# Suffixes of the per-language columns (title_en, content_fr, ...)
+LANGUAGE_CODES = ('en', 'fr', 'rw', 'sw')
+
+# Longest card excerpt the templates show (the homilies list)
+EXCERPT_WORDS = 150
+
+def make_excerpt(rich_text, words=EXCERPT_WORDS):
+    """
+    Plain-text teaser of a CKEditor body: tags stripped, entities decoded,
+    whitespace collapsed and cut to `words` words.
+    """
+    text = " ".join(html.unescape(strip_tags(rich_text or "")).split())
+    return Truncator(text).words(words)
+
+def update_excerpts(instance):
+    """
+    Refresh excerpt_<lang> from the model's EXCERPT_SOURCE rich-text field.
+    """
+    for code in LANGUAGE_CODES:
+        body = getattr(instance, f"{instance.EXCERPT_SOURCE}_{code}")
+        setattr(instance, f"excerpt_{code}", make_excerpt(body))
+
+class TranslatedQuerySet(models.QuerySet):
+    def for_lang(self, lang):
+        """
+        Defer the other languages' columns listed in the model's
+        TRANSLATED_FIELDS, so only `lang`'s title and body are read.
+        """
+        if lang not in LANGUAGE_CODES:
+            lang = 'en'
+        return self.defer(*[
+            f"{field}_{code}"
+            for field in self.model.TRANSLATED_FIELDS
+            for code in LANGUAGE_CODES
+            if code != lang
+        ])
+
+    def for_cards(self, lang):
+        """
+        for_lang() for listing cards, which render the excerpt: every
+        language's full rich-text body is deferred as well.
+        """
+        return self.for_lang(lang).defer(*[
+            f"{self.model.EXCERPT_SOURCE}_{code}" for code in LANGUAGE_CODES
+        ])
+
 class MassSchedule(models.Model):
+    """
+    One stored Mass.  Regular Masses come from MassRule and are not stored;
+    a row is either a one-off Mass (no rule) or overrides its rule's Mass
+    on that date: moved to its own times, or cancelled.
+    """
     MORNING = 'morning'
     EVENING = 'evening'
     MASS_TYPE_CHOICES = [
@@ -24,12 +82,27 @@ class MassSchedule(models.Model):
         default=MORNING,
         help_text="Morning or Evening"
     )
+    rule = models.ForeignKey(
+        'MassRule',
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='overrides',
+        help_text="The recurring Mass this row replaces on its date; leave empty for a one-off Mass."
+    )
+    cancelled = models.BooleanField(
+        default=False,
+        help_text="Tick to cancel the recurring Mass on this date."
+    )
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ['date', 'start_time']
+        indexes = [
+            models.Index(fields=['date', 'start_time'], name='massschedule_date_idx'),
+        ]
         verbose_name = "Mass Schedule"
         verbose_name_plural = "Mass Schedules"
 
@@ -37,6 +110,79 @@ class MassSchedule(models.Model):
         # e.g. "Morning Mass on 2025-05-28 at 08:00"
         return f"{self.get_mass_type_display()} on {self.date.isoformat()} at {self.start_time.strftime('%H:%M')}"
 
+    def clean(self):
+        if self.cancelled and self.rule_id is None:
+            raise ValidationError({'cancelled': "Only a recurring Mass can be cancelled; delete a one-off Mass instead."})
+
+class MassRule(models.Model):
+    """
+    A Mass held every week on the ticked days, e.g. weekdays at 06:30 or
+    Sundays at 10:00, from starts_on until ends_on.  Its occurrences are
+    never stored: base.schedule expands them for whatever dates are asked
+    for, and a MassSchedule row pointing at the rule moves or cancels one.
+    """
+    WEEKDAYS = ('monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday')
+
+    mass_type = models.CharField(
+        max_length=10,
+        choices=MassSchedule.MASS_TYPE_CHOICES,
+        default=MassSchedule.MORNING,
+        help_text="Morning or Evening"
+    )
+    start_time = models.TimeField(help_text="Start time (HH:MM)")
+    end_time = models.TimeField(help_text="End time (HH:MM)")
+
+    monday = models.BooleanField(default=False)
+    tuesday = models.BooleanField(default=False)
+    wednesday = models.BooleanField(default=False)
+    thursday = models.BooleanField(default=False)
+    friday = models.BooleanField(default=False)
+    saturday = models.BooleanField(default=False)
+    sunday = models.BooleanField(default=False)
+
+    starts_on = models.DateField(default=timezone.localdate, help_text="First date the rule applies")
+    ends_on = models.DateField(null=True, blank=True, help_text="Last date the rule applies; leave empty for no end")
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['start_time']
+        verbose_name = "Recurring Mass"
+        verbose_name_plural = "Recurring Masses"
+
+    def __str__(self):
+        # e.g. "Morning Mass on Mon, Tue, Wed, Thu, Fri at 06:30"
+        return f"{self.get_mass_type_display()} on {self.days_display()} at {self.start_time.strftime('%H:%M')}"
+
+    def clean(self):
+        if not self.weekdays():
+            raise ValidationError("Tick at least one day of the week.")
+        if self.ends_on and self.ends_on < self.starts_on:
+            raise ValidationError({'ends_on': "The rule cannot end before it starts."})
+
+    def weekdays(self):
+        """
+        The ticked days as date.weekday() numbers (Monday is 0).
+        """
+        return {number for number, day in enumerate(self.WEEKDAYS) if getattr(self, day)}
+
+    def days_display(self):
+        return ", ".join(day[:3].title() for day in self.WEEKDAYS if getattr(self, day))
+    days_display.short_description = 'Days'
+
+    def applies_on(self, day):
+        return self.starts_on <= day and (self.ends_on is None or day <= self.ends_on)
+
+    def occurrence(self, day):
+        """
+        The rule's Mass on `day` as an unsaved MassSchedule.
+        """
+        return MassSchedule(
+            date=day, start_time=self.start_time, end_time=self.end_time,
+            mass_type=self.mass_type, rule=self, updated_at=self.updated_at,
+        )
+
 def homily_image_path(instance, filename):
     base_filename, file_extension = os.path.splitext(filename)
     return f'homilies/homily_{slugify(instance.title_en)}_{file_extension}'
@@ -64,7 +210,13 @@ class Homily(models.Model):
     content_fr = RichTextUploadingField(blank=True, help_text="Contenu en Français")
     content_rw = RichTextUploadingField(blank=True, help_text="Content mu Kinyarwanda")
     content_sw = RichTextUploadingField(blank=True, help_text="Content kwa Kiswahili")
-    image = ProcessedImageField(
+
+    # Plain-text excerpts for listing cards, derived from the rich text on save
+    excerpt_en = models.TextField(blank=True, editable=False, help_text="English excerpt of the content")
+    excerpt_fr = models.TextField(blank=True, editable=False, help_text="French excerpt of the content")
+    excerpt_rw = models.TextField(blank=True, editable=False, help_text="Kinyarwanda excerpt of the content")
+    excerpt_sw = models.TextField(blank=True, editable=False, help_text="Kiswahili excerpt of the content")
+    image = QueuedImageField(
         upload_to=homily_image_path,
         processors=[ResizeToFill(1270, 1270)],
         format='JPEG',
@@ -75,11 +227,28 @@ class Homily(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    TRANSLATED_FIELDS = ('title', 'content', 'excerpt')
+    EXCERPT_SOURCE = 'content'
+    objects = TranslatedQuerySet.as_manager()
+
     class Meta:
         ordering = ['-published_at', '-created_at']
+        indexes = [
+            # Ascending on purpose: SQLite walks it backwards for the DESC
+            # listing, and the implicit trailing rowid then also covers the
+            # cursor paginator's "-pk" tie-breaker.
+            models.Index(fields=['published_at', 'created_at'], name='homily_published_idx'),
+        ]
         verbose_name = "Homily"
         verbose_name_plural = "Homilies"
 
+    def save(self, *args, **kwargs):
+        """
+        Refresh the plain-text excerpts from the rich-text content.
+        """
+        update_excerpts(self)
+        super().save(*args, **kwargs)
+
     def __str__(self):
         # Display with English title and date for quick reference
         date_str = self.published_at.isoformat() if self.published_at else "No date"
@@ -130,8 +299,14 @@ class Event(models.Model):
     description_rw = RichTextUploadingField(blank=True, help_text="Description mu Kinyarwanda")
     description_sw = RichTextUploadingField(blank=True, help_text="Description kwa Kiswahili")
 
+    # Plain-text excerpts for listing cards, derived from the rich text on save
+    excerpt_en = models.TextField(blank=True, editable=False, help_text="English excerpt of the description")
+    excerpt_fr = models.TextField(blank=True, editable=False, help_text="French excerpt of the description")
+    excerpt_rw = models.TextField(blank=True, editable=False, help_text="Kinyarwanda excerpt of the description")
+    excerpt_sw = models.TextField(blank=True, editable=False, help_text="Kiswahili excerpt of the description")
+
     # Image with automatic resizing & cropping
-    image = ProcessedImageField(
+    image = QueuedImageField(
         upload_to=event_image_path,
         processors=[ResizeToFill(1200, 800)],
         format='JPEG',
@@ -145,15 +320,25 @@ class Event(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    TRANSLATED_FIELDS = ('title', 'description', 'excerpt')
+    EXCERPT_SOURCE = 'description'
+    objects = TranslatedQuerySet.as_manager()
+
     class Meta:
         ordering = ['-event_date', 'start_time']
+        indexes = [
+            models.Index(fields=['event_date', 'created_at'], name='event_date_idx'),
+            # Covers the MAX(updated_at) behind the calendar feed's ETag
+            models.Index(fields=['event_date', 'updated_at'], name='event_feed_idx'),
+        ]
         verbose_name = "Event"
         verbose_name_plural = "Events"
 
     def save(self, *args, **kwargs):
         """
-        Auto-generate slug on first save.
+        Auto-generate slug on first save and refresh the plain-text excerpts.
         """
+        update_excerpts(self)
         if not self.slug:
             base_slug = slugify(self.title_en)
             date_str = self.event_date.isoformat()
@@ -244,6 +429,10 @@ class Testimony(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', 'created_at'], name='testimony_status_idx'),
+            models.Index(fields=['created_at'], name='testimony_created_idx'),
+        ]
         verbose_name = "Testimony"
         verbose_name_plural = "Testimonies"
 
@@ -287,8 +476,14 @@ class Advertisement(models.Model):
     content_rw = RichTextUploadingField(blank=True, help_text="Content mu Kinyarwanda")
     content_sw = RichTextUploadingField(blank=True, help_text="Content kwa Kiswahili")
 
+    # Plain-text excerpts for listing cards, derived from the rich text on save
+    excerpt_en = models.TextField(blank=True, editable=False, help_text="English excerpt of the content")
+    excerpt_fr = models.TextField(blank=True, editable=False, help_text="French excerpt of the content")
+    excerpt_rw = models.TextField(blank=True, editable=False, help_text="Kinyarwanda excerpt of the content")
+    excerpt_sw = models.TextField(blank=True, editable=False, help_text="Kiswahili excerpt of the content")
+
     # Banner image with automatic resize & crop
-    image = ProcessedImageField(
+    image = QueuedImageField(
         upload_to=advertisement_image_path,
         processors=[ResizeToFill(1200, 600)],
         format='JPEG',
@@ -302,11 +497,25 @@ class Advertisement(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    TRANSLATED_FIELDS = ('title', 'content', 'excerpt')
+    EXCERPT_SOURCE = 'content'
+    objects = TranslatedQuerySet.as_manager()
+
     class Meta:
         ordering = ['-published_at', '-created_at']
+        indexes = [
+            models.Index(fields=['published_at', 'created_at'], name='advert_published_idx'),
+        ]
         verbose_name = "Advertisement"
         verbose_name_plural = "Advertisements"
 
+    def save(self, *args, **kwargs):
+        """
+        Refresh the plain-text excerpts from the rich-text content.
+        """
+        update_excerpts(self)
+        super().save(*args, **kwargs)
+
     def __str__(self):
         date_str = self.published_at.isoformat() if self.published_at else "No date"
         return f"{self.title_en} ({date_str})"
@@ -338,6 +547,45 @@ class Amenity(models.Model):
     def __str__(self):
         return self.name
 
+def cover_images_prefetch():
+    """
+    Each room's newest image, one row per room via a correlated subquery,
+    as Room.cover_images; Room.cover_image reads it.
+    """
+    cover_ids = RoomImage.objects.filter(
+        room=models.OuterRef('room')
+    ).order_by('-uploaded_at', '-id').values('id')[:1]
+    return models.Prefetch(
+        'images',
+        queryset=RoomImage.objects.filter(id=models.Subquery(cover_ids)),
+        to_attr='cover_images',
+    )
+
+class RoomQuerySet(models.QuerySet):
+    def with_listing_data(self):
+        """
+        Load what a room card renders in bulk: each room's cover image and
+        its amenities.  Listing N rooms then costs a constant 3 queries.
+        """
+        return self.prefetch_related(cover_images_prefetch(), 'amenities')
+
+    def available(self, check_in, check_out, amenities=(), max_price=None):
+        """
+        Rooms with none of the nights from check_in up to check_out booked,
+        every one of `amenities` (Amenity ids) and, given max_price, a
+        nightly rate no higher.  Each room costs one seek into the booking
+        and amenity indexes, not a scan, however many bookings there are.
+        """
+        rooms = self
+        if max_price is not None:
+            rooms = rooms.filter(price_per_night__lte=max_price)
+        for amenity in amenities:
+            rooms = rooms.filter(models.Exists(
+                Room.amenities.through.objects.filter(room=models.OuterRef('pk'), amenity=amenity)
+            ))
+        booked = Booking.objects.overlapping(check_in, check_out).filter(room=models.OuterRef('pk'))
+        return rooms.filter(~models.Exists(booked))
+
 class Room(models.Model):
     """
     Represents a bookable room in the system.
@@ -370,11 +618,22 @@ class Room(models.Model):
         related_name='rooms',
         help_text="Select all amenities available for this room."
     )
+    # Bumped by every booking; see base.bookings.book()
+    booking_version = models.PositiveIntegerField(default=0, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = RoomQuerySet.as_manager()
+
     class Meta:
         ordering = ['title']
+        indexes = [
+            models.Index(fields=['created_at'], name='room_created_idx'),
+            models.Index(fields=['location'], name='room_location_idx'),
+            models.Index(fields=['title'], name='room_title_idx'),
+            # Availability search: price range walked in keyset order
+            models.Index(fields=['price_per_night', 'id'], name='room_price_idx'),
+        ]
         verbose_name = "Room"
         verbose_name_plural = "Rooms"
 
@@ -389,6 +648,15 @@ class Room(models.Model):
     def __str__(self):
         return self.title
 
+    @property
+    def cover_image(self):
+        """
+        The newest RoomImage, taken from with_listing_data() when it was used.
+        """
+        if hasattr(self, 'cover_images'):
+            return self.cover_images[0] if self.cover_images else None
+        return self.images.order_by('-uploaded_at', '-id').first()
+
 class RoomImage(models.Model):
     """
     Stores images for a Room; multiple RoomImage per Room.
@@ -398,7 +666,7 @@ class RoomImage(models.Model):
         on_delete=models.CASCADE,
         related_name='images'
     )
-    image = ProcessedImageField(
+    image = QueuedImageField(
         upload_to=room_image_upload_path,
         processors=[ResizeToFill(800, 600)],
         format='JPEG',
@@ -414,6 +682,9 @@ class RoomImage(models.Model):
 
     class Meta:
         ordering = ['-uploaded_at']
+        indexes = [
+            models.Index(fields=['room', 'uploaded_at'], name='roomimage_room_uploaded_idx'),
+        ]
         verbose_name = "Room Image"
         verbose_name_plural = "Room Images"
 
@@ -424,9 +695,117 @@ class RoomImage(models.Model):
         """
         Display a small thumbnail in admin.
         """
-        return mark_safe(f'<img src="{self.image.url}" width="100" style="object-fit: cover;"/>')
+        return mark_safe(f'<img src="{admin_thumbnail_url(self.image)}" width="100" style="object-fit: cover;"/>')
     image_tag.short_description = 'Thumbnail'
 
+class BookingQuerySet(models.QuerySet):
+    def active(self):
+        return self.exclude(status=Booking.CANCELLED)
+
+    def overlapping(self, check_in, check_out):
+        """
+        Active bookings holding any night from check_in up to check_out.
+
+        Two stays overlap when each starts before the other ends.  No
+        stay is longer than BOOKING_MAX_NIGHTS, so one that ends after
+        check_in started at most that many nights before it: the extra
+        bound turns "check_out > check_in" into a short range on the
+        (room, check_in) index instead of every earlier booking.
+        """
+        earliest = check_in - datetime.timedelta(days=settings.BOOKING_MAX_NIGHTS)
+        return self.active().filter(
+            check_in__gt=earliest,
+            check_in__lt=check_out,
+            check_out__gt=check_in,
+        )
+
+class RoomUnavailable(ValidationError):
+    """
+    The room is already booked for some of the nights asked for.
+    """
+
+class Booking(models.Model):
+    """
+    A guest's stay in a Room: the nights from check_in up to, not
+    including, check_out.  Cancelled bookings free their nights.
+    """
+    PENDING = 'pending'
+    CONFIRMED = 'confirmed'
+    CANCELLED = 'cancelled'
+    STATUS_CHOICES = [
+        (PENDING, 'Pending'),
+        (CONFIRMED, 'Confirmed'),
+        (CANCELLED, 'Cancelled'),
+    ]
+
+    room = models.ForeignKey(
+        Room,
+        on_delete=models.CASCADE,
+        related_name='bookings'
+    )
+    check_in = models.DateField(help_text="Arrival date (YYYY-MM-DD)")
+    check_out = models.DateField(help_text="Departure date (YYYY-MM-DD); its night is not booked")
+    guest_name = models.CharField(max_length=150)
+    guest_email = models.EmailField()
+    guest_phone = models.CharField(max_length=30, blank=True)
+    status = models.CharField(
+        max_length=10,
+        choices=STATUS_CHOICES,
+        default=PENDING
+    )
+    total_price = models.DecimalField(
+        max_digits=10,
+        decimal_places=2,
+        editable=False,
+        help_text="Nightly rate at booking time times the nights, in USD."
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = BookingQuerySet.as_manager()
+
+    class Meta:
+        ordering = ['-check_in']
+        indexes = [
+            # Covers overlapping(): seek on room, range on check_in, the
+            # rest read from the index
+            models.Index(fields=['room', 'check_in', 'check_out', 'status'], name='booking_room_stay_idx'),
+            models.Index(fields=['check_in'], name='booking_check_in_idx'),
+        ]
+        constraints = [
+            models.CheckConstraint(check=models.Q(check_out__gt=models.F('check_in')), name='booking_stay_not_empty'),
+        ]
+        verbose_name = "Booking"
+        verbose_name_plural = "Bookings"
+
+    def __str__(self):
+        return f"{self.room} from {self.check_in.isoformat()} to {self.check_out.isoformat()} ({self.guest_name})"
+
+    @property
+    def nights(self):
+        return (self.check_out - self.check_in).days
+
+    def save(self, *args, **kwargs):
+        """
+        Price a new booking at the room's current nightly rate.
+        """
+        if self.total_price is None:
+            rate = Room.objects.values_list('price_per_night', flat=True).get(pk=self.room_id)
+            self.total_price = rate * self.nights
+        super().save(*args, **kwargs)
+
+    def clean(self):
+        if self.check_in is None or self.check_out is None:
+            return
+        if self.check_out <= self.check_in:
+            raise ValidationError({'check_out': "Check-out must be after check-in."})
+        if self.nights > settings.BOOKING_MAX_NIGHTS:
+            raise ValidationError({'check_out': f"A stay can be at most {settings.BOOKING_MAX_NIGHTS} nights."})
+        if self.room_id is not None and self.status != self.CANCELLED:
+            taken = Booking.objects.overlapping(self.check_in, self.check_out).filter(room_id=self.room_id)
+            if taken.exclude(pk=self.pk).exists():
+                raise RoomUnavailable("The room is already booked for some of these nights.")
+
 def gallery_image_path(instance, filename):
     """
     Store gallery images under MEDIA_ROOT/gallery/<slugified_caption>/<id><ext>
@@ -452,7 +831,7 @@ class Gallery(models.Model):
     caption_sw = models.CharField(
         max_length=200, blank=True, help_text="Maelezo kwa Kiswahili"
     )
-    image = ProcessedImageField(
+    image = QueuedImageField(
         upload_to=gallery_image_path,
         processors=[ResizeToFill(1200, 800)],
         format="JPEG",
@@ -460,9 +839,13 @@ class Gallery(models.Model):
         help_text="Main gallery image resized to 1200×800",
     )
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["created_at"], name="gallery_created_idx"),
+        ]
         verbose_name = "Gallery Item"
         verbose_name_plural = "Gallery"
 
@@ -496,7 +879,7 @@ class Member(models.Model):
         choices=ROLE_CHOICES,
         help_text="Select the member’s role within the church"
     )
-    image = ProcessedImageField(
+    image = QueuedImageField(
         upload_to=member_image_path,
         processors=[ResizeToFill(400, 400)],  # always crop/resize to 400×400
         format='JPEG',
@@ -510,6 +893,12 @@ class Member(models.Model):
 
     class Meta:
         ordering = ['name']
+        indexes = [
+            # The rowid rides along in every SQLite index, so (role) also
+            # serves the list view's ORDER BY id; (role, name) the home page.
+            models.Index(fields=['role'], name='member_role_idx'),
+            models.Index(fields=['role', 'name'], name='member_role_name_idx'),
+        ]
         verbose_name = "Member"
         verbose_name_plural = "Members"
 
@@ -536,7 +925,13 @@ class HealingPrayer(models.Model):
     content_rw = RichTextUploadingField(blank=True, help_text="Content mu Kinyarwanda")
     content_sw = RichTextUploadingField(blank=True, help_text="Content kwa Kiswahili")
 
-    image = ProcessedImageField(
+    # Plain-text excerpts for listing cards, derived from the rich text on save
+    excerpt_en = models.TextField(blank=True, editable=False, help_text="English excerpt of the content")
+    excerpt_fr = models.TextField(blank=True, editable=False, help_text="French excerpt of the content")
+    excerpt_rw = models.TextField(blank=True, editable=False, help_text="Kinyarwanda excerpt of the content")
+    excerpt_sw = models.TextField(blank=True, editable=False, help_text="Kiswahili excerpt of the content")
+
+    image = QueuedImageField(
         upload_to=healing_prayer_image_path,
         processors=[ResizeToFill(1270, 1270)],
         format='JPEG',
@@ -548,10 +943,64 @@ class HealingPrayer(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    TRANSLATED_FIELDS = ('title', 'content', 'excerpt')
+    EXCERPT_SOURCE = 'content'
+    objects = TranslatedQuerySet.as_manager()
+
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['created_at'], name='healingprayer_created_idx'),
+        ]
         verbose_name = "Healing Prayer"
         verbose_name_plural = "Healing Prayers"
 
+    def save(self, *args, **kwargs):
+        """
+        Refresh the plain-text excerpts from the rich-text content.
+        """
+        update_excerpts(self)
+        super().save(*args, **kwargs)
+
+    def __str__(self):
+        return f"Prayer: {self.title_en}"
+
+
+class ImageJob(models.Model):
+    """
+    An uploaded image waiting for the process_images worker: the
+    QueuedImageField `field_name` of row `object_id` of `model`.  Jobs are
+    deleted once done; failed ones stay, with the error, after their last
+    attempt.
+    """
+    PENDING = 'pending'
+    RUNNING = 'running'
+    FAILED  = 'failed'
+    STATUS_CHOICES = [
+        (PENDING, 'Pending'),
+        (RUNNING, 'Running'),
+        (FAILED,  'Failed'),
+    ]
+
+    model      = models.CharField(max_length=100, help_text="e.g. base.Gallery")
+    object_id  = models.PositiveBigIntegerField()
+    field_name = models.CharField(max_length=50)
+    status     = models.CharField(max_length=10, choices=STATUS_CHOICES, default=PENDING)
+    attempts   = models.PositiveSmallIntegerField(default=0)
+    run_after  = models.DateTimeField(default=timezone.now, help_text="Not picked up before this time")
+    locked_at  = models.DateTimeField(null=True, blank=True, help_text="When a worker took the job")
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['run_after', 'id']
+        indexes = [
+            models.Index(fields=['status', 'run_after'], name='imagejob_status_idx'),
+            models.Index(fields=['model', 'object_id'], name='imagejob_target_idx'),
+        ]
+        verbose_name = "Image Job"
+        verbose_name_plural = "Image Jobs"
+
     def __str__(self):
-        return f"Prayer: {self.title_en}"
\ No newline at end of file
+        return f"{self.model}#{self.object_id}.{self.field_name} ({self.status})"
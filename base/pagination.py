@@ -0,0 +1,229 @@
+import json
+import base64
+import datetime
+from django.conf import settings
+from django.db.models import F, Q
+from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
+
+NUMBERED = "numbered"
+CURSOR = "cursor"
+
+class InvalidCursor(Exception):
+    pass
+
+class CursorEncoder(DjangoJSONEncoder):
+    """
+    DjangoJSONEncoder rounds datetimes to milliseconds, which would make a
+    cursor land between rows sharing the same second; keep full precision.
+    """
+
+    def default(self, o):
+        if isinstance(o, (datetime.datetime, datetime.time)):
+            return o.isoformat()
+        return super().default(o)
+
+class CursorPage:
+    """
+    One page of a keyset-paginated queryset.  Quacks enough like
+    django.core.paginator.Page for the list templates to iterate over it;
+    there is no page number or total count, which is the point.
+    """
+
+    def __init__(self, object_list, next_cursor=None, previous_cursor=None):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+class CursorPaginator:
+    """
+    Keyset pagination over `ordering`, e.g. ("-event_date", "-created_at").
+    The primary key is appended as a tie-breaker, and each page is fetched
+    with a WHERE on the boundary row's sort values instead of an OFFSET,
+    so page 500 costs the same as page 1 and no COUNT(*) is issued.
+    """
+
+    def __init__(self, queryset, per_page, ordering):
+        self.queryset = queryset
+        self.per_page = per_page
+        fields = [name.lstrip("-") for name in ordering]
+        if "pk" not in fields and "id" not in fields:
+            ordering = tuple(ordering) + ("-pk",)
+        self.ordering = [
+            (name.lstrip("-"), name.startswith("-")) for name in ordering
+        ]
+
+    def _field(self, name):
+        meta = self.queryset.model._meta
+        return meta.pk if name == "pk" else meta.get_field(name)
+
+    def _order_by(self, reverse):
+        # NULLs in a nullable column always sort after every value in the
+        # forward direction, whatever the database does by default.
+        expressions = []
+        for name, descending in self.ordering:
+            expression = F(name).desc if descending != reverse else F(name).asc
+            if self._field(name).null:
+                expressions.append(expression(nulls_last=not reverse or None, nulls_first=reverse or None))
+            else:
+                expressions.append(expression())
+        return expressions
+
+    def _after(self, name, descending, value, reverse):
+        """
+        Rows strictly after `value` on one column, in walking direction.
+        """
+        nullable = self._field(name).null
+        if value is None:
+            # NULLs are last going forward: nothing follows them, and
+            # walking backwards every non-NULL value comes before them.
+            return Q(**{f"{name}__isnull": False}) if reverse else Q(pk__in=[])
+        lookup = "lt" if descending != reverse else "gt"
+        condition = Q(**{f"{name}__{lookup}": value})
+        if nullable and not reverse:
+            condition |= Q(**{f"{name}__isnull": True})
+        return condition
+
+    def _equal(self, name, value):
+        if value is None:
+            return Q(**{f"{name}__isnull": True})
+        return Q(**{name: value})
+
+    def _seek(self, values, reverse):
+        """
+        (a, b, c) > (x, y, z) expanded into
+        a >= x AND (a > x OR (a = x AND b > y) OR (a = x AND b = y AND c > z)).
+
+        The leading a >= x is redundant but gives SQLite one index range to
+        walk in order, instead of OR-ing several index seeks and sorting
+        the union.  It also keeps the walk on the cursor's side of a
+        nullable leading column; _fetch crosses over to the other side.
+        """
+        (name, descending), value = self.ordering[0], values[0]
+        if value is None:
+            bound, condition = Q(**{f"{name}__isnull": True}), Q(pk__in=[])
+        else:
+            inclusive, strict = ("lte", "lt") if descending != reverse else ("gte", "gt")
+            bound = Q(**{f"{name}__{inclusive}": value})
+            condition = Q(**{f"{name}__{strict}": value})
+
+        prefix = self._equal(name, value)
+        for (name, descending), value in zip(self.ordering[1:], values[1:]):
+            condition |= prefix & self._after(name, descending, value, reverse)
+            prefix &= self._equal(name, value)
+        return bound & condition
+
+    def _fetch(self, values, reverse):
+        limit = self.per_page + 1
+        queryset = self.queryset.order_by(*self._order_by(reverse))
+        if values is None:
+            return list(queryset[:limit])
+
+        rows = list(queryset.filter(self._seek(values, reverse))[:limit])
+
+        # NULLs in a nullable leading column follow every value going
+        # forward; once one side runs out, top up from the other.
+        name, _ = self.ordering[0]
+        if len(rows) < limit and self._field(name).null and (values[0] is None) == reverse:
+            other_side = Q(**{f"{name}__isnull": not reverse})
+            rows += queryset.filter(other_side)[:limit - len(rows)]
+        return rows
+
+    def encode(self, obj, reverse):
+        values = [getattr(obj, name) for name, _ in self.ordering]
+        raw = json.dumps({"v": values, "r": reverse}, cls=CursorEncoder)
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    def decode(self, cursor):
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            if len(data["v"]) != len(self.ordering):
+                raise InvalidCursor(cursor)
+            values = [
+                None if value is None else self._field(name).to_python(value)
+                for (name, _), value in zip(self.ordering, data["v"])
+            ]
+            return values, bool(data["r"])
+        except (ValueError, KeyError, TypeError, AttributeError, ValidationError) as exc:
+            raise InvalidCursor(cursor) from exc
+
+    def page(self, cursor=None):
+        values, reverse = None, False
+        if cursor:
+            values, reverse = self.decode(cursor)
+
+        rows = self._fetch(values, reverse)
+        has_more = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+        if reverse:
+            rows.reverse()
+
+        next_cursor = previous_cursor = None
+        if rows:
+            if has_more or reverse:
+                next_cursor = self.encode(rows[-1], reverse=False)
+            if (has_more and reverse) or (cursor and not reverse):
+                previous_cursor = self.encode(rows[0], reverse=True)
+        return CursorPage(rows, next_cursor, previous_cursor)
+
+def numbered_page(queryset, per_page, page_number):
+    """
+    Classic Paginator page plus a sliding window of ±3 page links.
+    """
+    paginator = Paginator(queryset, per_page)
+    try:
+        page_obj = paginator.page(page_number)
+    except PageNotAnInteger:
+        page_obj = paginator.page(1)
+    except EmptyPage:
+        page_obj = paginator.page(paginator.num_pages)
+
+    current = page_obj.number
+    total   = paginator.num_pages
+    start   = max(current - 3, 1)
+    end     = min(current + 3, total)
+    return page_obj, range(start, end + 1)
+
+def paginate(request, queryset, per_page, ordering):
+    """
+    Paginate `queryset` for a public list view and return the template
+    context: `page_obj`, `page_range` and `pagination_mode`.
+
+    `?cursor=` selects keyset mode and `?page=` the numbered mode, so old
+    links keep working; a bare URL uses settings.PAGINATION_MODE.
+    """
+    mode = getattr(settings, "PAGINATION_MODE", NUMBERED)
+    if "cursor" in request.GET:
+        mode = CURSOR
+    elif "page" in request.GET:
+        mode = NUMBERED
+
+    if mode == CURSOR:
+        paginator = CursorPaginator(queryset, per_page, ordering)
+        try:
+            page_obj = paginator.page(request.GET.get("cursor"))
+        except InvalidCursor:
+            page_obj = paginator.page()
+        return {"page_obj": page_obj, "page_range": range(0), "pagination_mode": CURSOR}
+
+    page_obj, page_range = numbered_page(
+        queryset.order_by(*ordering), per_page, request.GET.get("page", 1)
+    )
+    return {"page_obj": page_obj, "page_range": page_range, "pagination_mode": NUMBERED}
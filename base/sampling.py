@@ -0,0 +1,42 @@
+import random
+from base.models import Room
+from base.cache import get_or_build
+
+# How many rooms the home page payload keeps to draw its 4 cards from.
+ROOM_POOL_SIZE = 24
+
+def room_ids():
+    """
+    Every Room primary key, cached until a room is added or removed
+    (see base.signals).
+    """
+    return get_or_build(
+        "rooms", ("ids",),
+        lambda: list(Room.objects.order_by().values_list("id", flat=True)),
+    )
+
+def sample_ids(ids, k, exclude=None):
+    """
+    Pick up to k distinct ids at random, skipping `exclude`.
+    random.sample on a list is O(k), independent of the table size.
+    """
+    if exclude is not None:
+        picked = random.sample(ids, min(k + 1, len(ids)))
+        return [pk for pk in picked if pk != exclude][:k]
+    return random.sample(ids, min(k, len(ids)))
+
+def random_rooms(k, exclude=None, queryset=None):
+    """
+    Up to k random rooms, fetched by primary key instead of ORDER BY RANDOM().
+    Pass `queryset` to add select_related/prefetch_related to the lookup.
+    """
+    ids = sample_ids(room_ids(), k, exclude=exclude)
+    queryset = Room.objects.all() if queryset is None else queryset
+    found = queryset.in_bulk(ids)
+    return [found[pk] for pk in ids if pk in found]
+
+def pick(items, k):
+    """
+    Draw k items from an already-materialised pool, e.g. a cached payload.
+    """
+    return random.sample(items, min(k, len(items)))
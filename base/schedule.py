@@ -0,0 +1,35 @@
+import datetime
+from base.models import MassRule, MassSchedule
+
+# Stored rows are read this many days at a time while expanding
+WINDOW = 28
+
+def occurrences(start, end):
+    """
+    Yield every Mass from `start` up to, not including, `end` in date and
+    start time order, as MassSchedule instances: the rules' Masses, unsaved,
+    with stored rows moving or cancelling them and adding one-off Masses.
+
+    Rules are read once and stored rows a WINDOW of days at a time over the
+    (date, start_time) index, so the cost follows the dates asked for, not
+    the length of the rules or of the schedule's history.
+    """
+    rules = [rule for rule in MassRule.objects.all() if rule.weekdays()]
+    while start < end:
+        stop = min(start + datetime.timedelta(days=WINDOW), end)
+        stored = {}
+        for row in MassSchedule.objects.filter(date__gte=start, date__lt=stop):
+            stored.setdefault(row.date, []).append(row)
+
+        day = start
+        while day < stop:
+            rows = stored.get(day, [])
+            replaced = {row.rule_id for row in rows if row.rule_id is not None}
+            masses = [row for row in rows if not row.cancelled]
+            masses += [
+                rule.occurrence(day) for rule in rules
+                if rule.pk not in replaced and day.weekday() in rule.weekdays() and rule.applies_on(day)
+            ]
+            yield from sorted(masses, key=lambda mass: mass.start_time)
+            day += datetime.timedelta(days=1)
+        start = stop
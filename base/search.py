@@ -0,0 +1,215 @@
+import re
+import html
+from django.db import connection
+from django.db.models.expressions import RawSQL
+from django.utils.html import escape, strip_tags
+from django.utils.safestring import mark_safe
+from base.models import *
+
+TABLE = "base_search"
+
+# kind -> (model, title field, body field or None), indexed in every language
+SOURCES = {
+    "homily": (Homily, "title", "content"),
+    "event": (Event, "title", "description"),
+    "advert": (Advertisement, "title", "content"),
+    "healing_prayer": (HealingPrayer, "title", "content"),
+    "gallery": (Gallery, "caption", None),
+}
+
+# Every index row's rowid is derived from (kind, object_id, lang): the object
+# id, then the kind's code, then the language's position in LANGUAGE_CODES.
+# A row's documents are then one rowid range, found without scanning the
+# UNINDEXED columns, which FTS5 cannot look up.  Codes must never change.
+KIND_CODES = {"homily": 1, "event": 2, "advert": 3, "healing_prayer": 4, "gallery": 5}
+KIND_BITS, LANG_BITS = 5, 3
+
+# bm25() takes one weight per column: kind, object_id, lang, title, body.
+# A hit in the title counts as much as five in the body.
+WEIGHTS = (0.0, 0.0, 0.0, 5.0, 1.0)
+
+# SQLite ends an FTS5 string at a NUL byte and chokes on the rest
+CONTROL_CHARS = re.compile(r"[\x00-\x1f\x7f]")
+
+# snippet() markers, swapped for <mark> once the snippet has been escaped
+MARK_START, MARK_END = "\x02", "\x03"
+
+CREATE_TABLE = f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {TABLE} USING fts5(
+        kind UNINDEXED, object_id UNINDEXED, lang UNINDEXED, title, body,
+        tokenize = 'unicode61 remove_diacritics 2'
+    )
+"""
+
+def available(using=connection):
+    return using.vendor == "sqlite"
+
+def kind_of(model):
+    for kind, (source, _, _) in SOURCES.items():
+        if source is model:
+            return kind
+    return None
+
+def plain_text(rich_text):
+    return " ".join(html.unescape(strip_tags(rich_text or "")).split())
+
+def first_rowid(kind, pk):
+    return (pk << KIND_BITS | KIND_CODES[kind]) << LANG_BITS
+
+def rowid_range(kind, pk):
+    """
+    (first, last) rowid of the documents of `kind` row `pk`.
+    """
+    first = first_rowid(kind, pk)
+    return first, first + (1 << LANG_BITS) - 1
+
+def documents(kind, obj):
+    """
+    One (rowid, kind, object_id, lang, title, body) row per language.
+    """
+    _, title, body = SOURCES[kind]
+    first = first_rowid(kind, obj.pk)
+    for offset, code in enumerate(LANGUAGE_CODES):
+        yield (
+            first + offset, kind, obj.pk, code,
+            getattr(obj, f"{title}_{code}") or "",
+            plain_text(getattr(obj, f"{body}_{code}")) if body else "",
+        )
+
+INSERT = f"INSERT INTO {TABLE} (rowid, kind, object_id, lang, title, body) VALUES (%s, %s, %s, %s, %s, %s)"
+
+def index(obj):
+    """
+    (Re)index one row of a searchable model in all four languages.
+    """
+    kind = kind_of(type(obj))
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {TABLE} WHERE rowid BETWEEN %s AND %s", rowid_range(kind, obj.pk))
+        cursor.executemany(INSERT, list(documents(kind, obj)))
+
+def unindex(model, pk):
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {TABLE} WHERE rowid BETWEEN %s AND %s", rowid_range(kind_of(model), pk))
+
+def rebuild(batch_size=500, using=connection, get_model=None):
+    """
+    Refill the whole index from the source tables, e.g. after seeding with
+    bulk_create, which sends no signals.  Returns the rows indexed per kind.
+    Migrations pass their historical `get_model`.
+    """
+    counts = {}
+    with using.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {TABLE}")
+        for kind, (model, title, body) in SOURCES.items():
+            if get_model is not None:
+                model = get_model(model._meta.label)
+            fields = [f"{name}_{code}" for name in (title, body) if name for code in LANGUAGE_CODES]
+            rows, counts[kind] = [], 0
+            for obj in model.objects.only("pk", *fields).order_by("pk").iterator(chunk_size=batch_size):
+                rows.extend(documents(kind, obj))
+                counts[kind] += 1
+                if len(rows) >= batch_size:
+                    cursor.executemany(INSERT, rows)
+                    rows = []
+            if rows:
+                cursor.executemany(INSERT, rows)
+        cursor.execute(f"INSERT INTO {TABLE} ({TABLE}) VALUES ('optimize')")
+    return counts
+
+def match_expression(text):
+    """
+    Visitor input as an FTS5 query: every word must match, the last one as
+    a prefix so results show up while typing.  Words are quoted, so FTS5
+    operators and punctuation in the input are taken literally; control
+    characters separate words.
+    """
+    words = [word.replace('"', '""') for word in CONTROL_CHARS.sub(" ", text).split()]
+    if not words:
+        return None
+    terms = [f'"{word}"' for word in words]
+    terms[-1] += "*"
+    return " ".join(terms)
+
+def highlight(snippet):
+    return mark_safe(
+        escape(snippet).replace(MARK_START, "<mark>").replace(MARK_END, "</mark>")
+    )
+
+class SearchResults:
+    """
+    Ranked matches for `text` in one language, sliceable and countable so
+    django.core.paginator.Paginator can page through them.  Each slice is
+    one LIMIT/OFFSET query on the index plus one query per kind to load
+    the matched rows, which are returned in rank order as
+    (kind, object, snippet) tuples.
+    """
+
+    def __init__(self, text, lang, kinds=None):
+        self.expression = match_expression(text)
+        self.lang = lang
+        self.kinds = list(kinds or SOURCES)
+        self._count = None
+
+    def where(self):
+        placeholders = ", ".join(["%s"] * len(self.kinds))
+        sql = f"{TABLE} MATCH %s AND lang = %s AND kind IN ({placeholders})"
+        return sql, [self.expression, self.lang, *self.kinds]
+
+    def count(self):
+        if self._count is None:
+            self._count = 0
+            if self.expression:
+                where, params = self.where()
+                with connection.cursor() as cursor:
+                    cursor.execute(f"SELECT count(*) FROM {TABLE} WHERE {where}", params)
+                    self._count = cursor.fetchone()[0]
+        return self._count
+
+    def __len__(self):
+        return self.count()
+
+    def __getitem__(self, item):
+        if not isinstance(item, slice):
+            return self[item:item + 1][0]
+        start, stop = item.start or 0, item.stop
+        if not self.expression or stop is not None and stop <= start:
+            return []
+
+        where, params = self.where()
+        weights = ", ".join(str(weight) for weight in WEIGHTS)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT kind, object_id, snippet({TABLE}, -1, %s, %s, '…', 24) "
+                f"FROM {TABLE} WHERE {where} "
+                f"ORDER BY bm25({TABLE}, {weights}) LIMIT %s OFFSET %s",
+                [MARK_START, MARK_END, *params, -1 if stop is None else stop - start, start],
+            )
+            hits = cursor.fetchall()
+
+        objects = {}
+        for kind in {kind for kind, _, _ in hits}:
+            model = SOURCES[kind][0]
+            ids = [object_id for hit_kind, object_id, _ in hits if hit_kind == kind]
+            queryset = model.objects.filter(pk__in=ids)
+            if hasattr(queryset, "for_cards"):
+                queryset = queryset.for_cards(self.lang)
+            objects.update(((kind, obj.pk), obj) for obj in queryset)
+
+        return [
+            (kind, objects[kind, object_id], highlight(snippet))
+            for kind, object_id, snippet in hits
+            if (kind, object_id) in objects
+        ]
+
+def matching(queryset, text):
+    """
+    `queryset` narrowed to rows whose text matches `text` in any language,
+    as a subquery on the index rather than LIKE '%text%' on every column.
+    """
+    expression = match_expression(text)
+    if expression is None:
+        return queryset
+    return queryset.filter(pk__in=RawSQL(
+        f"SELECT object_id FROM {TABLE} WHERE {TABLE} MATCH %s AND kind = %s",
+        [expression, kind_of(queryset.model)],
+    ))
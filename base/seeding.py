@@ -0,0 +1,288 @@
+import os
+import random
+import itertools
+import collections
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+import django
+from faker import Faker
+from PIL import Image, ImageDraw
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Max
+from django.utils.text import slugify
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from base import api, search
+from base.cache import bump_version
+from base.changelist import filters_namespace
+from base.models import LANGUAGE_CODES, Amenity, Room, make_excerpt
+
+# Distinct values a Pool draws before it starts reusing them
+POOL_SIZE = 200
+
+# File every row points at under --no-images, one per media folder
+PLACEHOLDER_NAME = "placeholder.jpg"
+
+JPEG_QUALITY = 85
+
+# Images each worker may have queued before the seeder waits for them
+QUEUE_PER_WORKER = 32
+
+def batched(iterable, size):
+    """
+    Lists of up to `size` items from `iterable`, consumed lazily.
+    """
+    iterator = iter(iterable)
+    while batch := list(itertools.islice(iterator, size)):
+        yield batch
+
+@lru_cache(maxsize=POOL_SIZE * len(LANGUAGE_CODES))
+def cached_excerpt(text):
+    return make_excerpt(text)
+
+def set_excerpts(instance):
+    """
+    update_excerpts() for rows inserted with bulk_create, which skips
+    save().  Memoised, since pooled bodies come round again and again.
+    """
+    for code in LANGUAGE_CODES:
+        body = getattr(instance, f"{instance.EXCERPT_SOURCE}_{code}")
+        setattr(instance, f"excerpt_{code}", cached_excerpt(body))
+
+def quadrant_colours(rng=random):
+    return [tuple(rng.randint(0, 255) for _ in range(3)) for _ in range(4)]
+
+def mosaic(width, height, colours):
+    """
+    A width×height image split into four quadrants of the given colours.
+    """
+    img = Image.new("RGB", (width, height))
+    draw = ImageDraw.Draw(img)
+    w2, h2 = width // 2, height // 2
+    quads = [
+        (0, 0, w2, h2),
+        (w2, 0, width, h2),
+        (0, h2, w2, height),
+        (w2, h2, width, height),
+    ]
+    for quad, colour in zip(quads, colours):
+        draw.rectangle(quad, fill=colour)
+    return img
+
+def save_mosaic(path, width, height, colours, quality=JPEG_QUALITY):
+    """
+    Render and JPEG-encode one mosaic to `path`.  Runs in an ImageWriter
+    worker, so it takes only plain values and touches no models.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    mosaic(width, height, colours).save(path, format="JPEG", quality=quality)
+    return path
+
+class ImageWriter:
+    """
+    Draws mosaics on a pool of worker processes while the seeder carries
+    on inserting rows.  Colours are picked by the caller, so a --seed run
+    produces the same files whatever the number of workers.
+
+    At most QUEUE_PER_WORKER images per worker are in flight; past that
+    submit() waits for the oldest, which keeps memory flat on 100k-row
+    runs.  With one worker everything is drawn in-process.
+    """
+
+    def __init__(self, workers=None):
+        self.workers = workers or os.cpu_count() or 1
+        self.executor = None
+        self.pending = collections.deque()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        elif self.executor is not None:
+            self.executor.shutdown(cancel_futures=True)
+
+    def submit(self, path, width, height, colours):
+        if self.workers == 1:
+            save_mosaic(path, width, height, colours)
+            return
+        if self.executor is None:
+            # Workers set Django up themselves where processes are spawned
+            # rather than forked; under fork this is a no-op.
+            self.executor = ProcessPoolExecutor(self.workers, initializer=django.setup)
+        self.pending.append(self.executor.submit(save_mosaic, path, width, height, colours))
+        while len(self.pending) > self.workers * QUEUE_PER_WORKER:
+            self.pending.popleft().result()
+
+    def close(self):
+        """
+        Wait for every queued image; re-raises the first worker error.
+        """
+        try:
+            while self.pending:
+                self.pending.popleft().result()
+        finally:
+            if self.executor is not None:
+                self.executor.shutdown()
+                self.executor = None
+
+class Pool:
+    """
+    Call `factory` for the first `size` values, then hand those out again
+    at random.  Faker paragraphs cost far more than an insert, so large
+    runs reuse a few hundred bodies instead of writing 100k of them.
+    """
+
+    def __init__(self, factory, rng, size=POOL_SIZE):
+        self.factory = factory
+        self.rng = rng
+        self.size = size
+        self.values = []
+
+    def __call__(self):
+        if len(self.values) < self.size:
+            value = self.factory()
+            self.values.append(value)
+            return value
+        return self.rng.choice(self.values)
+
+class UniqueSlugs:
+    """
+    Slugs unique among `model`'s existing rows and every slug handed out
+    so far, so a whole batch can go through bulk_create without clashing.
+    """
+
+    def __init__(self, model, field="slug"):
+        self.used = set(model.objects.values_list(field, flat=True))
+
+    def __call__(self, text):
+        base = slugify(text) or "item"
+        slug, n = base, 2
+        while slug in self.used:
+            slug, n = f"{base}-{n}", n + 1
+        self.used.add(slug)
+        return slug
+
+class SeedCommand(BaseCommand):
+    """
+    Base class for the generate_* commands.
+
+    Adds --count, --seed, --batch-size, --no-images, --workers and
+    --no-index and runs seed() inside one transaction.  Subclasses set
+    `default_count` and implement seed(count), which inserts through
+    self.bulk_create() and returns the success message.  Images drawn
+    through self.image() are written by an ImageWriter and all on disk
+    before the commit.
+
+    bulk_create sends no post_save, so the full-text search index is
+    rebuilt afterwards when a searchable model was seeded.
+    """
+
+    default_count = 0
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--count", type=int, default=self.default_count,
+            help=f"How many rows to create (default: {self.default_count})",
+        )
+        parser.add_argument(
+            "--seed", type=int,
+            help="Seed Faker and random for a reproducible data set",
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=1000,
+            help="Rows per bulk_create (default: 1000)",
+        )
+        parser.add_argument(
+            "--no-images", action="store_true",
+            help="Point every row at one placeholder image instead of drawing one each",
+        )
+        parser.add_argument(
+            "--workers", type=int, default=os.cpu_count() or 1,
+            help="Processes drawing images (default: one per CPU)",
+        )
+        parser.add_argument(
+            "--no-index", action="store_false", dest="index",
+            help="Skip rebuilding the search index, e.g. when more seeding follows",
+        )
+
+    def handle(self, *args, **options):
+        self.batch_size = options["batch_size"]
+        self.with_images = not options["no_images"]
+        self.random = random.Random(options["seed"])
+        self.seeded = set()
+        if options["seed"] is not None:
+            Faker.seed(options["seed"])
+
+        with transaction.atomic(), ImageWriter(options["workers"]) as self.images:
+            message = self.seed(options["count"])
+        self.stdout.write(self.style.SUCCESS(message))
+        self.invalidate_caches()
+
+        searchable = {model for model, _, _ in search.SOURCES.values()}
+        if options["index"] and search.available() and self.seeded & searchable:
+            call_command("rebuild_search_index", stdout=self.stdout, stderr=self.stderr)
+
+    def invalidate_caches(self):
+        """
+        Bump the cache namespaces base.signals would have bumped for the
+        seeded rows: bulk_create sends no post_save.  The cache is shared
+        with the web server, so its pages show the new rows at once.
+        """
+        if not self.seeded:
+            return
+        namespaces = {"home", "pages"}
+        if Room in self.seeded:
+            namespaces.add("rooms")
+        for model in self.seeded:
+            namespaces.update(api.namespaces_for(model))
+            if model in (Room, Amenity):
+                namespaces.add(filters_namespace(model))
+        for namespace in namespaces:
+            bump_version(namespace)
+
+    def seed(self, count):
+        raise NotImplementedError("subclasses of SeedCommand must provide a seed() method")
+
+    def bulk_create(self, model, objects):
+        """
+        Insert an iterable of unsaved instances batch by batch and return
+        how many were created.  Instances get their primary keys back.
+        """
+        self.seeded.add(model)
+        created = 0
+        for batch in batched(objects, self.batch_size):
+            model.objects.bulk_create(batch)
+            created += len(batch)
+        return created
+
+    def next_id(self, model):
+        """
+        The primary key the next inserted row will most likely get, for
+        file names that used to be built from the id after a first save().
+        """
+        return (model.objects.aggregate(last=Max("pk"))["last"] or 0) + 1
+
+    def pool(self, factory):
+        return Pool(factory, self.random)
+
+    def image(self, folder, filename, width, height):
+        """
+        Draw a mosaic to MEDIA_ROOT/<folder>/<filename> and return its path
+        relative to MEDIA_ROOT.  Under --no-images every call returns one
+        placeholder per folder, drawn the first time it is needed.
+
+        The file is queued on the ImageWriter, not yet written, when this
+        returns.
+        """
+        if self.with_images:
+            path = os.path.join(settings.MEDIA_ROOT, folder, filename)
+            self.images.submit(path, width, height, quadrant_colours(self.random))
+            return f"{folder}/{filename}"
+
+        path = os.path.join(settings.MEDIA_ROOT, folder, PLACEHOLDER_NAME)
+        if not os.path.exists(path):
+            save_mosaic(path, width, height, quadrant_colours(self.random))
+        return f"{folder}/{PLACEHOLDER_NAME}"
@@ -0,0 +1,174 @@
+from django.core.exceptions import ValidationError
+from rest_framework import serializers
+from base.models import *
+from base.bookings import book
+
+class ContentSerializer(serializers.ModelSerializer):
+    """
+    Serializes rows in one language: every name in Meta.translated is read
+    from its `<name>_<lang>` column and written out without the suffix.
+    The API views pass `lang`, and the sparse fieldset as `fields`, in the
+    serializer context.
+    """
+
+    class Meta:
+        translated = ()
+
+    def build_field(self, field_name, info, model_class, nested_depth):
+        if field_name in self.Meta.translated:
+            lang = self.context.get("lang", LANGUAGE_CODES[0])
+            return serializers.CharField, {"source": f"{field_name}_{lang}", "read_only": True}
+        return super().build_field(field_name, info, model_class, nested_depth)
+
+    def get_fields(self):
+        fields = super().get_fields()
+        wanted = self.context.get("fields")
+        if wanted:
+            fields = {name: field for name, field in fields.items() if name in wanted}
+        return fields
+
+    def columns(self):
+        """
+        The model columns the selected fields read, for QuerySet.only().
+        """
+        concrete = {field.name for field in self.Meta.model._meta.concrete_fields}
+        columns = set()
+        for field in self.fields.values():
+            source = field.source.split(".")[0]
+            if source.startswith("get_") and source.endswith("_display"):
+                source = source[len("get_"):-len("_display")]
+            if source in concrete:
+                columns.add(source)
+        return columns
+
+class MassScheduleSerializer(ContentSerializer):
+    """
+    Stored rows, or the unsaved ones base.schedule expands from the
+    recurring rules; those have no id, only the rule they come from.
+    """
+    mass_type_display = serializers.CharField(source="get_mass_type_display", read_only=True)
+
+    class Meta:
+        model = MassSchedule
+        fields = (
+            "id", "date", "start_time", "end_time", "mass_type", "mass_type_display",
+            "rule", "cancelled", "updated_at",
+        )
+        translated = ()
+
+class HomilySerializer(ContentSerializer):
+
+    class Meta:
+        model = Homily
+        fields = ("id", "published_at", "title", "excerpt", "content", "image", "updated_at")
+        translated = Homily.TRANSLATED_FIELDS
+
+class EventSerializer(ContentSerializer):
+
+    class Meta:
+        model = Event
+        fields = (
+            "id", "slug", "event_date", "start_time", "end_time",
+            "title", "excerpt", "description", "image", "updated_at",
+        )
+        translated = Event.TRANSLATED_FIELDS
+
+class AdvertisementSerializer(ContentSerializer):
+
+    class Meta:
+        model = Advertisement
+        fields = ("id", "published_at", "title", "excerpt", "content", "image", "updated_at")
+        translated = Advertisement.TRANSLATED_FIELDS
+
+class RoomImageSerializer(serializers.ModelSerializer):
+
+    class Meta:
+        model = RoomImage
+        fields = ("id", "image", "alt_text")
+
+class RoomSerializer(ContentSerializer):
+    images = RoomImageSerializer(many=True, read_only=True)
+    amenities = serializers.SlugRelatedField(many=True, read_only=True, slug_field="name")
+
+    class Meta:
+        model = Room
+        fields = (
+            "id", "slug", "title", "location", "description", "price_per_night",
+            "amenities", "images", "updated_at",
+        )
+        translated = ()
+
+class AvailabilitySerializer(serializers.Serializer):
+    """
+    The query of the room availability search.
+    """
+    check_in = serializers.DateField()
+    check_out = serializers.DateField()
+    amenities = serializers.CharField(required=False, help_text="Comma-separated amenity names, all required.")
+    max_price = serializers.DecimalField(max_digits=8, decimal_places=2, required=False, min_value=0)
+
+    def validate_amenities(self, value):
+        names = {name.strip() for name in value.split(",") if name.strip()}
+        ids = dict(Amenity.objects.filter(name__in=names).values_list("name", "id"))
+        unknown = names - set(ids)
+        if unknown:
+            raise serializers.ValidationError(f"Unknown amenities: {', '.join(sorted(unknown))}.")
+        return sorted(ids.values())
+
+    def validate(self, attrs):
+        stay = Booking(check_in=attrs["check_in"], check_out=attrs["check_out"])
+        try:
+            stay.clean()
+        except ValidationError as error:
+            raise serializers.ValidationError(error.message_dict if hasattr(error, "error_dict") else error.messages)
+        return attrs
+
+class BookingSerializer(serializers.ModelSerializer):
+    """
+    A booking request from a guest; base.bookings.book() checks and
+    stores it.
+    """
+
+    class Meta:
+        model = Booking
+        fields = (
+            "id", "room", "check_in", "check_out", "nights",
+            "guest_name", "guest_email", "guest_phone",
+            "status", "total_price", "created_at",
+        )
+        read_only_fields = ("status", "total_price", "created_at")
+
+    def create(self, validated_data):
+        return book(**validated_data)
+
+class GallerySerializer(ContentSerializer):
+
+    class Meta:
+        model = Gallery
+        fields = ("id", "caption", "image", "created_at")
+        translated = ("caption",)
+
+class MemberSerializer(ContentSerializer):
+    role_display = serializers.CharField(source="get_role_display", read_only=True)
+
+    class Meta:
+        model = Member
+        fields = ("id", "name", "role", "role_display", "image", "updated_at")
+        translated = ()
+
+class HealingPrayerSerializer(ContentSerializer):
+
+    class Meta:
+        model = HealingPrayer
+        fields = ("id", "title", "excerpt", "content", "image", "created_at", "updated_at")
+        translated = HealingPrayer.TRANSLATED_FIELDS
+
+class TestimonySerializer(ContentSerializer):
+    """
+    Published testimonies, without the author's email address.
+    """
+
+    class Meta:
+        model = Testimony
+        fields = ("id", "name", "testimony_type", "content_text", "content_file", "created_at")
+        translated = ()
@@ -0,0 +1,114 @@
+from base.models import *
+from base.cache import bump_version
+from base.changelist import filters_namespace
+from base import api
+from base import search
+from base.jobs import enqueue
+from base.fields import is_pending
+from base.imagespecs import SPECS, image_fields, spec_for
+from django.utils import timezone
+from django.db.models.signals import post_save, post_delete, m2m_changed
+
+# Every model whose rows appear on the landing page (and so, on some page).
+# RoomImage and Amenity are listed because room cards render both.
+HOME_MODELS = (
+    MassSchedule, MassRule, Homily, Event, Advertisement, Room, RoomImage,
+    Amenity, Testimony, Gallery, Member, HealingPrayer,
+)
+
+def invalidate_home(sender, **kwargs):
+    """
+    Drop every cached language variant of the home page payload, and every
+    full page cached by LanguagePrefixMiddleware.
+    """
+    bump_version("home")
+    bump_version("pages")
+
+def invalidate_room_ids(sender, **kwargs):
+    """
+    Rebuild the cached Room id list used for random sampling.
+    """
+    bump_version("rooms")
+
+def invalidate_admin_filters(sender, **kwargs):
+    """
+    Drop the admin filter choices cached from `sender`'s rows.
+    """
+    bump_version(filters_namespace(sender))
+
+def invalidate_api(sender, **kwargs):
+    """
+    Drop the cached responses of every API endpoint that renders `sender`.
+    """
+    for namespace in api.namespaces_for(sender):
+        bump_version(namespace)
+
+def touch_rooms(room_ids):
+    """
+    Room pages render their cover image and amenities, so changes to either
+    move Room.updated_at on; the page ETag/Last-Modified then follow.
+    """
+    Room.objects.filter(pk__in=room_ids).update(updated_at=timezone.now())
+
+def touch_room_for_image(sender, instance, **kwargs):
+    touch_rooms([instance.room_id])
+
+def touch_rooms_for_amenities(sender, instance, action, reverse, pk_set, **kwargs):
+    if not reverse:
+        if action in ("post_add", "post_remove", "post_clear"):
+            touch_rooms([instance.pk])
+    elif action in ("post_add", "post_remove"):
+        touch_rooms(pk_set)
+    elif action == "pre_clear":
+        # amenity.rooms.clear(): collect the rooms before the links go
+        touch_rooms(list(instance.rooms.values_list("pk", flat=True)))
+
+def queue_images(sender, instance, **kwargs):
+    """
+    Queue an ImageJob for a new upload, or for an image whose responsive
+    widths are missing; the process_images worker does the work outside
+    the request.  Unchanged images are skipped on imagekit's cached
+    existence check.
+    """
+    for name in image_fields(sender):
+        image = getattr(instance, name)
+        if image and (is_pending(image) or not spec_for(image).ready(image)):
+            enqueue(instance, name)
+
+def index_for_search(sender, instance, **kwargs):
+    search.index(instance)
+
+def unindex_for_search(sender, instance, **kwargs):
+    search.unindex(sender, instance.pk)
+
+for model in HOME_MODELS:
+    post_save.connect(invalidate_home, sender=model, dispatch_uid=f"home_save_{model.__name__}")
+    post_delete.connect(invalidate_home, sender=model, dispatch_uid=f"home_delete_{model.__name__}")
+
+m2m_changed.connect(invalidate_home, sender=Room.amenities.through, dispatch_uid="home_room_amenities")
+
+post_save.connect(invalidate_room_ids, sender=Room, dispatch_uid="rooms_save")
+post_delete.connect(invalidate_room_ids, sender=Room, dispatch_uid="rooms_delete")
+
+for model in (Room, Amenity):
+    post_save.connect(invalidate_admin_filters, sender=model, dispatch_uid=f"admin_filters_save_{model.__name__}")
+    post_delete.connect(invalidate_admin_filters, sender=model, dispatch_uid=f"admin_filters_delete_{model.__name__}")
+
+post_save.connect(touch_room_for_image, sender=RoomImage, dispatch_uid="room_touch_image_save")
+post_delete.connect(touch_room_for_image, sender=RoomImage, dispatch_uid="room_touch_image_delete")
+m2m_changed.connect(touch_rooms_for_amenities, sender=Room.amenities.through, dispatch_uid="room_touch_amenities")
+
+for model in {model for _, viewset, _ in api.router.registry for model in viewset.cache_sources}:
+    if model._meta.auto_created:
+        m2m_changed.connect(invalidate_api, sender=model, dispatch_uid=f"api_{model.__name__}")
+    else:
+        post_save.connect(invalidate_api, sender=model, dispatch_uid=f"api_save_{model.__name__}")
+        post_delete.connect(invalidate_api, sender=model, dispatch_uid=f"api_delete_{model.__name__}")
+
+for label in {label for label, _ in SPECS}:
+    post_save.connect(queue_images, sender=label, dispatch_uid=f"queue_images_{label}")
+
+if search.available():
+    for model, _, _ in search.SOURCES.values():
+        post_save.connect(index_for_search, sender=model, dispatch_uid=f"search_save_{model.__name__}")
+        post_delete.connect(unindex_for_search, sender=model, dispatch_uid=f"search_delete_{model.__name__}")
@@ -0,0 +1,29 @@
+from whitenoise.storage import CompressedManifestStaticFilesStorage
+
+class StaticFilesStorage(CompressedManifestStaticFilesStorage):
+    """
+    WhiteNoise's build storage: every file is copied under a content-hashed
+    name listed in staticfiles.json, and compressed next to it as .gz (and
+    .br when Brotli is installed), so the server only ever reads files that
+    were prepared ahead of time and can cache them forever.
+
+    Vendored stylesheets may point at files that were never shipped
+    (vendors.css lists an icomoon.svg font); such a url() is left as it
+    is and recorded in `missing_references` instead of failing the build.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.missing_references = set()
+
+    def url_converter(self, name, hashed_files, template=None):
+        converter = super().url_converter(name, hashed_files, template)
+
+        def tolerant(matchobj):
+            try:
+                return converter(matchobj)
+            except ValueError:
+                self.missing_references.add((name, matchobj["url"]))
+                return matchobj["matched"]
+
+        return tolerant
@@ -0,0 +1,42 @@
+from django import template
+from django.forms.utils import flatatt
+from django.templatetags.static import static
+from django.utils.html import format_html, format_html_join
+from base.fields import is_pending
+from base.imagespecs import FORMATS, PLACEHOLDER, spec_for
+
+register = template.Library()
+
+@register.simple_tag
+def responsive_image(image, sizes=None, **attrs):
+    """
+    {% responsive_image homily.image class="rounded-4 col-12" alt="Homily image" %}
+
+    A <picture> with a srcset per format of the image's ResponsiveSpec, so
+    the browser downloads the smallest WebP (or JPEG) wide enough for its
+    slot.  `sizes` defaults to the spec's; other keyword arguments become
+    attributes of the <img>.  Until the derivatives have been generated,
+    and for fields without a spec, this is a plain <img> of the original;
+    while an upload is still waiting for process_images, a placeholder.
+    """
+    if not image:
+        return ""
+
+    attrs.setdefault("loading", "lazy")
+    attrs.setdefault("decoding", "async")
+    if is_pending(image):
+        return format_html('<img src="{}"{}>', static(PLACEHOLDER), flatatt(attrs))
+    spec = spec_for(image)
+    if spec is None or not spec.ready(image):
+        return format_html('<img src="{}"{}>', image.url, flatatt(attrs))
+
+    sizes = sizes or spec.sizes
+    *sources, (fallback, _, _) = FORMATS
+    return format_html(
+        '<picture>{}<img src="{}" srcset="{}" sizes="{}"{}></picture>',
+        format_html_join(
+            "", '<source type="{}" srcset="{}" sizes="{}">',
+            ((mime, spec.srcset(image, fmt), sizes) for fmt, _, mime in sources),
+        ),
+        image.url, spec.srcset(image, fallback), sizes, flatatt(attrs),
+    )
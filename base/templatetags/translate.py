@@ -0,0 +1,46 @@
+from django import template
+from django.template.base import FilterExpression
+from django.utils.html import conditional_escape
+from base.translations import CATALOG, LANGUAGES, get_active_lang
+
+register = template.Library()
+
+@register.filter
+def tr(obj, field):
+    """
+    {{ homily|tr:"title" }} -> homily.title_fr when French is active.
+    """
+    return getattr(obj, f"{field}_{get_active_lang()}", "")
+
+class TranslateNode(template.Node):
+    """
+    A literal key is looked up in every language while the template is
+    compiled, so rendering is a single dict access on the active language.
+    Anything else is resolved as a variable and looked up at render time.
+    """
+
+    def __init__(self, key):
+        self.key = key
+        self.texts = None
+        if isinstance(key, str):
+            self.texts = {lang: CATALOG[lang].get(key, key) for lang in LANGUAGES}
+
+    def render(self, context):
+        lang = get_active_lang()
+        if self.texts is not None:
+            return self.texts.get(lang, self.key)
+        value = self.key.resolve(context)
+        return CATALOG.get(lang, {}).get(value, conditional_escape(value))
+
+@register.tag(name="t")
+def do_translate(parser, token):
+    """
+    {% t "View More" %} or {% t schedule.get_mass_type_display %}
+    """
+    bits = token.split_contents()
+    if len(bits) != 2:
+        raise template.TemplateSyntaxError(f"'{bits[0]}' takes exactly one argument")
+    key = bits[1]
+    if len(key) >= 2 and key[0] == key[-1] and key[0] in ('"', "'"):
+        return TranslateNode(" ".join(key[1:-1].split()))
+    return TranslateNode(FilterExpression(key, parser))
@@ -1,3 +1,1371 @@
-from django.test import TestCase
+import io
+import time
+import random
+import datetime
+import tempfile
+from unittest import mock
+from PIL import Image
+from django.contrib import admin
+from django.test import TestCase, override_settings
+from django.template import Context, Template
+from django.core.management import call_command
+from django.core.exceptions import ValidationError
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage, default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.db.models import F
+from django.test.utils import CaptureQueriesContext
+from django.core.cache import cache
+from django.core.paginator import EmptyPage
+from django.utils import timezone
+from django.utils.http import http_date
+from base.models import *
+from base.pagination import CursorPaginator
+from base.sampling import random_rooms, room_ids
+from base.cache import get_version
+from base.search import SearchResults, rowid_range
+from base.schedule import occurrences
+from base.imagespecs import admin_thumbnail, admin_thumbnail_url, spec_for
+from base.admin import MemberAdmin
+from base.changelist import LargeTablePaginator
+from base import urls as base_urls
+from base.bookings import book
+from base.management.commands.bench_views import Command as BenchViewsCommand, percentile
+from base.serializers import BookingSerializer
+from base.storage import StaticFilesStorage
+from base.translations import active_lang
 
-# Create your tests here.
+# Every save bumps a cache version and most views read the cache, so the
+# tests get a cache of their own rather than the site's shared one.
+TEST_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+@override_settings(STATICFILES_STORAGE="django.contrib.staticfiles.storage.StaticFilesStorage",
+                   CACHES=TEST_CACHES)
+class ListViewIndexTests(TestCase):
+    """
+    Every listing query should be answered from an index, walked in the
+    order the view asks for, without a full table scan or a temp B-tree
+    sort.  Runs EXPLAIN QUERY PLAN on what each view actually executes.
+    """
+
+    # url -> tables whose queries must be index-backed
+    VIEWS = {
+        "/": ["base_massschedule", "base_event", "base_advertisement", "base_testimony",
+              "base_gallery", "base_member", "base_healingprayer"],
+        "/mass-schedule/": ["base_massschedule"],
+        "/homilies/": ["base_homily"],
+        "/homilies/?page=1": ["base_homily"],
+        "/events/": ["base_event"],
+        "/events/?page=1": ["base_event"],
+        "/healing-prayers/": ["base_healingprayer"],
+        "/rooms/": ["base_room"],
+        "/testimonies/": ["base_testimony"],
+        "/gallery/": ["base_gallery"],
+        "/members/": ["base_member"],
+        "/api/v1/rooms/available/?check_in=2025-06-01&check_out=2025-06-04&max_price=200": ["base_room"],
+    }
+
+    @classmethod
+    def setUpTestData(cls):
+        today = datetime.date.today()
+        now = timezone.now()
+        Homily.objects.bulk_create(
+            Homily(title_en=f"Homily {i}", published_at=today if i % 3 else None,
+                   created_at=now, updated_at=now)
+            for i in range(20)
+        )
+        Event.objects.bulk_create(
+            Event(title_en=f"Event {i}", slug=f"event-{i}", event_date=today,
+                  created_at=now, updated_at=now)
+            for i in range(20)
+        )
+        Testimony.objects.bulk_create(
+            Testimony(name=f"Name {i}", status="published" if i % 2 else "draft",
+                      created_at=now, updated_at=now)
+            for i in range(20)
+        )
+        Member.objects.bulk_create(
+            Member(name=f"Member {i}", role="Priest", created_at=now, updated_at=now)
+            for i in range(20)
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def explain(self, sql, params):
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+            return [row[-1] for row in cursor.fetchall()]
+
+    def capture(self, run):
+        """
+        Run `run()` and return (sql, params) for every SELECT it issued.
+        """
+        statements = []
+
+        def record(execute, sql, params, many, context):
+            if sql.startswith("SELECT"):
+                statements.append((sql, params))
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(record):
+            run()
+        return statements
+
+    def table(self, sql):
+        return sql.split(" FROM ", 1)[1].split()[0].strip('"')
+
+    def assertIndexed(self, sql, params, tables):
+        table = self.table(sql)
+        if table not in tables:
+            return
+        plan = self.explain(sql, params)
+        for step in plan:
+            self.assertNotIn("TEMP B-TREE", step, f"{sql}\n{plan}")
+            if step.startswith(f"SCAN {table}"):
+                self.assertIn("INDEX", step, f"{sql}\n{plan}")
+
+    def test_list_views_use_indexes(self):
+        for url, tables in self.VIEWS.items():
+            with self.subTest(url=url):
+                statements = self.capture(lambda: self.client.get(url))
+                checked = [sql for sql, _ in statements if self.table(sql) in tables]
+                self.assertTrue(checked, f"no queries against {tables} for {url}")
+                for sql, params in statements:
+                    self.assertIndexed(sql, params, tables)
+
+    def test_cursor_pages_use_indexes(self):
+        """
+        Following next/previous cursors, including across the NULL run of
+        Homily.published_at, stays on the index.
+        """
+        paginators = [
+            (CursorPaginator(Homily.objects.all(), 4, ("-published_at", "-created_at")), "base_homily"),
+            (CursorPaginator(Event.objects.all(), 4, ("-event_date", "-created_at")), "base_event"),
+            (CursorPaginator(Testimony.objects.filter(status="published"), 4, ("-created_at",)), "base_testimony"),
+        ]
+        for paginator, table in paginators:
+            with self.subTest(table=table):
+                cursors = []
+                page = paginator.page()
+                while page.has_next():
+                    cursors.append(page.next_cursor)
+                    page = paginator.page(page.next_cursor)
+                if page.has_previous():
+                    cursors.append(page.previous_cursor)
+
+                for cursor in cursors:
+                    statements = self.capture(lambda: paginator.page(cursor))
+                    for sql, params in statements:
+                        self.assertIndexed(sql, params, [table])
+
+@override_settings(STATICFILES_STORAGE="django.contrib.staticfiles.storage.StaticFilesStorage",
+                   CACHES=TEST_CACHES)
+class ImageProcessingTests(TestCase):
+    """
+    An upload is stored as sent and shown as a placeholder; the worker
+    crops it, writes its derivatives, and the tag then offers a srcset.
+    """
+
+    def setUp(self):
+        media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(media_root.cleanup)
+        self.enterContext(override_settings(MEDIA_ROOT=media_root.name))
+        cache.clear()
+
+    def upload(self):
+        buffer = io.BytesIO()
+        Image.new("RGB", (900, 500), "navy").save(buffer, format="PNG")
+        return SimpleUploadedFile("portrait.png", buffer.getvalue(), content_type="image/png")
+
+    def render(self, member):
+        return Template(
+            '{% load responsive %}{% responsive_image member.image alt=member.name class="rounded-circle" %}'
+        ).render(Context({"member": member}))
+
+    def process_images(self):
+        call_command("process_images", once=True, stdout=io.StringIO(), stderr=io.StringIO())
+
+    def test_upload_is_processed_by_the_worker(self):
+        member = Member.objects.create(name="Jean", role="priest", image=self.upload())
+        original = member.image.name
+        self.assertTrue(original.startswith("originals/members/"))
+        self.assertEqual(ImageJob.objects.count(), 1)
+        self.assertIn('src="/static/img/placeholder.png"', self.render(member))
+
+        self.process_images()
+        self.assertFalse(ImageJob.objects.exists())
+        self.assertFalse(default_storage.exists(original))
+        member.refresh_from_db()
+        self.assertEqual(member.image.name, f"members/jean_{member.pk}.jpg")
+        with member.image.open() as fh:
+            self.assertEqual(Image.open(fh).size, (400, 400))
+
+        spec = spec_for(member.image)
+        for file in spec.files(member.image):
+            self.assertTrue(file.storage.exists(file.name), file.name)
+        html = self.render(member)
+        self.assertIn('<source type="image/webp"', html)
+        for width in spec.widths:
+            self.assertIn(f".webp {width}w", html)
+            self.assertIn(f".jpg {width}w", html)
+        self.assertIn(f'src="{member.image.url}"', html)
+        self.assertIn('alt="Jean"', html)
+
+    def test_admin_thumbnail(self):
+        member = Member.objects.create(name="Jean", role="priest", image=self.upload())
+        # Nothing is generated for a pending upload during the request
+        self.assertEqual(admin_thumbnail_url(member.image), "/static/img/placeholder.png")
+        self.assertFalse(default_storage.exists("CACHE"))
+        self.process_images()
+        member.refresh_from_db()
+
+        thumbnail = admin_thumbnail(member.image)
+        self.assertTrue(thumbnail.storage.exists(thumbnail.name))
+        with thumbnail.storage.open(thumbnail.name) as fh:
+            self.assertEqual(Image.open(fh).size, (300, 300))
+        html = MemberAdmin(Member, admin.site).thumbnail(member)
+        self.assertIn(f'src="{thumbnail.url}"', html)
+        self.assertNotIn(member.image.url, html)
+
+        # Images without a thumbnail yet, e.g. seeded ones or missing files,
+        # are shown themselves until generate_derivatives has run
+        name = default_storage.save("members/seeded.jpg", self.upload())
+        Member.objects.filter(pk=member.pk).update(image=name)
+        member.refresh_from_db()
+        self.assertEqual(admin_thumbnail_url(member.image), member.image.url)
+        self.assertFalse(admin_thumbnail(member.image).storage.exists(admin_thumbnail(member.image).name))
+        call_command("generate_derivatives", model=["base.Member"], stdout=io.StringIO())
+        self.assertEqual(admin_thumbnail_url(member.image), admin_thumbnail(member.image).url)
+
+        Member.objects.filter(pk=member.pk).update(image="members/missing.jpg")
+        member.refresh_from_db()
+        self.assertEqual(admin_thumbnail_url(member.image), member.image.url)
+
+    def test_plain_img_until_derivatives_exist(self):
+        # Saved the way the seeders do it: no post_save, so no job
+        name = default_storage.save("members/jean.jpg", self.upload())
+        Member.objects.bulk_create([Member(name="Jean", role="priest", image=name)])
+        member = Member.objects.get()
+
+        html = self.render(member)
+        self.assertNotIn("<picture>", html)
+        self.assertIn(f'<img src="{member.image.url}"', html)
+
+    def test_failed_job_is_retried_later(self):
+        member = Member.objects.create(name="Jean", role="priest", image=self.upload())
+        default_storage.delete(member.image.name)
+
+        self.process_images()
+        job = ImageJob.objects.get()
+        self.assertEqual((job.status, job.attempts), (ImageJob.PENDING, 1))
+        self.assertGreater(job.run_after, timezone.now())
+        self.assertIn("Error", job.last_error)
+
+@override_settings(CACHES=TEST_CACHES)
+class MediaServingTests(TestCase):
+    """
+    Media files are served with cache headers and single byte ranges.
+    """
+
+    def setUp(self):
+        media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(media_root.cleanup)
+        self.enterContext(override_settings(MEDIA_ROOT=media_root.name))
+        self.body = bytes(range(256)) * 4
+        default_storage.save("testimonies/talk.mp3", io.BytesIO(self.body))
+        self.url = "/media/testimonies/talk.mp3"
+
+    def content(self, response):
+        return b"".join(response.streaming_content)
+
+    def test_whole_file(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.content(response), self.body)
+        self.assertEqual(response["Content-Type"], "audio/mpeg")
+        self.assertEqual(response["Accept-Ranges"], "bytes")
+        self.assertIn("max-age=2592000", response["Cache-Control"])
+        self.assertNotIn("Cookie", response.get("Vary", ""))
+
+        cached = self.client.get(self.url, HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(cached.status_code, 304)
+
+    def test_ranges(self):
+        for header, start, end in [("bytes=10-19", 10, 19), ("bytes=1000-", 1000, 1023),
+                                   ("bytes=-24", 1000, 1023), ("bytes=1000-5000", 1000, 1023)]:
+            with self.subTest(header=header):
+                response = self.client.get(self.url, HTTP_RANGE=header)
+                self.assertEqual(response.status_code, 206)
+                self.assertEqual(response["Content-Range"], f"bytes {start}-{end}/1024")
+                self.assertEqual(response["Content-Length"], str(end - start + 1))
+                self.assertEqual(self.content(response), self.body[start:end + 1])
+
+    def test_unsatisfiable_and_ignored_ranges(self):
+        response = self.client.get(self.url, HTTP_RANGE="bytes=2048-")
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response["Content-Range"], "bytes */1024")
+
+        for headers in [{"HTTP_RANGE": "bytes=0-1,5-6"},
+                        {"HTTP_RANGE": "bytes=0-1", "HTTP_IF_RANGE": '"stale"'}]:
+            with self.subTest(headers=headers):
+                self.assertEqual(self.client.get(self.url, **headers).status_code, 200)
+
+    def test_missing_and_outside_files(self):
+        self.assertEqual(self.client.get("/media/testimonies/nope.mp3").status_code, 404)
+        self.assertEqual(self.client.get("/media/testimonies/").status_code, 404)
+        self.assertEqual(self.client.get("/media/../smr/settings.py").status_code, 404)
+
+    @override_settings(MEDIA_SENDFILE="x-accel-redirect")
+    def test_x_accel_redirect(self):
+        response = self.client.get(self.url, HTTP_RANGE="bytes=10-19")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["X-Accel-Redirect"], "/protected-media/testimonies/talk.mp3")
+        self.assertEqual(response.content, b"")
+
+@override_settings(STATICFILES_STORAGE="django.contrib.staticfiles.storage.StaticFilesStorage",
+                   CACHES=TEST_CACHES)
+class SearchTests(TestCase):
+    """
+    The FTS5 index follows saves and deletes, ranks title hits first and
+    backs both the public search page and the admin changelist search.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.in_title = Homily.objects.create(
+            title_en="Pilgrimage to Ruhango", title_fr="Pèlerinage à Ruhango",
+            content_en="<p>A walk of faith.</p>", content_fr="<p>Une marche de foi.</p>",
+        )
+        cls.in_body = Homily.objects.create(
+            title_en="Sunday homily", title_fr="Homélie du dimanche",
+            content_en="<p>We spoke about the <b>pilgrimage</b> &amp; the road.</p>",
+            content_fr="<p>Nous avons parlé du pèlerinage.</p>",
+        )
+        cls.event = Event.objects.create(
+            title_en="Youth pilgrimage", title_fr="Pèlerinage des jeunes",
+            slug="youth-pilgrimage", event_date=datetime.date.today(),
+        )
+        Gallery.objects.create(caption_en="Choir rehearsal", caption_fr="Répétition de la chorale", image="gallery/x.jpg")
+
+    def results(self, query, lang="en"):
+        return list(SearchResults(query, lang)[:10])
+
+    def test_ranked_results_per_language(self):
+        hits = self.results("pilgrimage")
+        self.assertEqual([obj for _, obj, _ in hits][-1], self.in_body)
+        self.assertEqual({obj for _, obj, _ in hits}, {self.in_title, self.in_body, self.event})
+        self.assertIn("<mark>pilgrimage</mark>", "".join(snippet for _, _, snippet in hits))
+        self.assertNotIn("<b>", "".join(snippet for _, _, snippet in hits))
+
+        # Accents are folded, the last word matches as a prefix
+        self.assertEqual(len(self.results("pelerin", "fr")), 3)
+        self.assertEqual(self.results("pelerin", "en"), [])
+        self.assertEqual([kind for kind, _, _ in self.results("chorale", "fr")], ["gallery"])
+
+    def test_index_follows_saves_and_deletes(self):
+        self.event.title_en = "Youth retreat"
+        self.event.save()
+        self.assertEqual(len(self.results("pilgrimage")), 2)
+        self.assertEqual(len(self.results("retreat")), 1)
+
+        self.in_title.delete()
+        self.assertEqual([obj for _, obj, _ in self.results("pilgrimage")], [self.in_body])
+
+    def test_rows_are_found_by_rowid(self):
+        statements = []
+
+        def record(execute, sql, params, many, context):
+            statements.append(sql)
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(record):
+            self.in_body.save()
+            self.event.delete()
+        writes = [sql for sql in statements if "base_search" in sql]
+        self.assertTrue(writes)
+        self.assertFalse([sql for sql in writes if "object_id =" in sql or "kind =" in sql])
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT rowid, kind, object_id, lang FROM base_search WHERE object_id = %s", [self.in_body.pk])
+            rows = [row for row in cursor.fetchall() if row[1] == "homily"]
+        self.assertEqual([row[3] for row in rows], list(LANGUAGE_CODES))
+        first, last = rowid_range("homily", self.in_body.pk)
+        self.assertTrue(all(first <= row[0] <= last for row in rows))
+
+    def test_seeded_rows_are_indexed(self):
+        with tempfile.TemporaryDirectory() as media_root, override_settings(MEDIA_ROOT=media_root):
+            call_command("generate_gallery", count=2, seed=1, no_images=True, index=False, stdout=io.StringIO())
+            caption = Gallery.objects.order_by("-pk").first().caption_en
+            self.assertEqual(self.results(caption), [])
+            call_command("generate_gallery", count=2, seed=1, no_images=True, stdout=io.StringIO())
+        self.assertEqual(len(self.results(caption)), 2)
+
+    def test_search_page(self):
+        response = self.client.get("/fr/search/", {"q": "pèlerinage"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["page_obj"].paginator.count, 3)
+        self.assertContains(response, "Pèlerinage des jeunes")
+        self.assertContains(response, '<mark>pèlerinage</mark>', html=False)
+
+        response = self.client.get("/search/", {"q": '"unbalanced (AND'})
+        self.assertEqual(response.status_code, 200)
+
+    def test_control_characters(self):
+        self.assertEqual(self.results("\x00"), [])
+        self.assertEqual({obj for _, obj, _ in self.results("Ruhango\x00pilgrim")}, {self.in_title})
+        self.assertEqual(self.client.get("/search/?q=%00").status_code, 200)
+
+        from django.contrib.auth.models import User
+        self.client.force_login(User.objects.create_superuser("admin", "admin@example.com", "pw"))
+        self.assertEqual(self.client.get("/admin/base/homily/?q=%00").status_code, 200)
+
+    def test_admin_search_uses_index(self):
+        from django.contrib.auth.models import User
+        self.client.force_login(User.objects.create_superuser("admin", "admin@example.com", "pw"))
+        statements = []
+
+        def record(execute, sql, params, many, context):
+            statements.append(sql)
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(record):
+            response = self.client.get("/admin/base/homily/", {"q": "pelerinage"})
+        self.assertEqual(
+            {obj.pk for obj in response.context["cl"].result_list},
+            {self.in_title.pk, self.in_body.pk},
+        )
+        self.assertTrue(any("base_search MATCH" in sql for sql in statements))
+        self.assertFalse(any("LIKE" in sql for sql in statements))
+
+@override_settings(
+    STATICFILES_STORAGE="django.contrib.staticfiles.storage.StaticFilesStorage",
+    ADMIN_COUNT_THRESHOLD=5,
+    CACHES=TEST_CACHES,
+)
+class AdminChangelistTests(TestCase):
+    """
+    Changelists cost a fixed number of queries however many rows they
+    show, and stop counting exactly past ADMIN_COUNT_THRESHOLD.
+    """
+
+    def setUp(self):
+        from django.contrib.auth.models import User
+        cache.clear()
+        self.client.force_login(User.objects.create_superuser("admin", "admin@example.com", "pw"))
+
+    def add_rooms(self, start, count):
+        rooms = Room.objects.bulk_create(
+            Room(title=f"Room {i}", slug=f"room-{i}", location=f"Wing {i % 3}",
+                 description="", price_per_night=50)
+            for i in range(start, start + count)
+        )
+        RoomImage.objects.bulk_create(RoomImage(room=room, image=f"rooms/{room.slug}.jpg") for room in rooms)
+
+    def get(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response, len(queries)
+
+    def test_room_changelist(self):
+        Amenity.objects.create(name="WiFi")
+        self.add_rooms(0, 3)
+        _, cold = self.get("/admin/base/room/")
+        _, warm = self.get("/admin/base/room/")
+        # The location and amenity choices come from the cache the second time
+        self.assertEqual(warm, cold - 2)
+
+        # Past the threshold: planner statistics, or a cached total
+        self.add_rooms(3, 10)
+        self.get("/admin/base/room/")
+        _, before = self.get("/admin/base/room/")
+        self.add_rooms(13, 5)
+        self.get("/admin/base/room/")
+        response, after = self.get("/admin/base/room/")
+        self.assertEqual(after, before)
+        self.assertContains(response, "/media/rooms/room-17.jpg")
+
+        Room.objects.create(title="Annex room", location="Annex", description="", price_per_night=80)
+        self.assertContains(self.client.get("/admin/base/room/"), 'value="Annex"')
+
+    def test_counts_past_the_threshold(self):
+        def count(queryset):
+            return LargeTablePaginator(queryset, 20).count
+
+        MassSchedule.objects.bulk_create(
+            MassSchedule(date=datetime.date(2024, 1, day), start_time="06:30",
+                         end_time="07:30", mass_type=MassSchedule.MORNING)
+            for day in range(1, 9)
+        )
+        self.assertEqual(count(MassSchedule.objects.filter(date__day__lte=3)), 3)
+        self.assertEqual(count(MassSchedule.objects.all()), 8)
+
+        # Past the threshold the total is cached; SQLite's planner statistics
+        # are only as fresh as the last ANALYZE, so they are not used
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+        for day in (9, 10):
+            MassSchedule.objects.create(date=datetime.date(2024, 1, day), start_time="06:30",
+                                        end_time="07:30", mass_type=MassSchedule.MORNING)
+        self.assertEqual(count(MassSchedule.objects.all()), 8)
+        self.assertEqual(count(MassSchedule.objects.filter(date__day__lte=3)), 3)
+
+        # A page past the end of a stale total is counted again, not refused
+        paginator = LargeTablePaginator(MassSchedule.objects.order_by("date"), 2)
+        self.assertEqual(paginator.num_pages, 4)
+        self.assertEqual([mass.date.day for mass in paginator.page(5)], [9, 10])
+        self.assertEqual(paginator.num_pages, 5)
+        self.assertRaises(EmptyPage, paginator.page, 6)
+        self.assertEqual(count(MassSchedule.objects.all()), 10)
+
+        response = self.client.get("/admin/base/massschedule/")
+        self.assertEqual(response.context["cl"].result_count, 10)
+        self.assertIsNone(response.context["cl"].full_result_count)
+
+@override_settings(CACHES=TEST_CACHES)
+class ApiTests(TestCase):
+    """
+    The public content endpoints serve one language and a sparse fieldset,
+    walk keyset pages, and serve cached pages until the content changes.
+    """
+
+    def setUp(self):
+        cache.clear()
+
+    def test_language_and_sparse_fieldset(self):
+        Homily.objects.create(
+            title_en="Pilgrimage", title_fr="Pèlerinage",
+            content_en="<p>A walk of faith.</p>", content_fr="<p>Une marche de foi.</p>",
+        )
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/api/v1/homilies/", {"lang": "fr", "fields": "id,title"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([set(row) for row in response.json()["results"]], [{"id", "title"}])
+        self.assertEqual(response.json()["results"][0]["title"], "Pèlerinage")
+        self.assertNotIn("title_en", queries[-1]["sql"])
+        self.assertNotIn("content_fr", queries[-1]["sql"])
+        self.assertNotIn("Cookie", response.get("Vary", ""))
+
+        response = self.client.get("/api/v1/homilies/", {"lang": "de"})
+        self.assertEqual(response.status_code, 400)
+        response = self.client.get("/api/v1/homilies/", {"fields": "id,email"})
+        self.assertEqual(response.status_code, 400)
+
+    def test_cursor_pages(self):
+        today = datetime.date.today()
+        events = [
+            Event.objects.create(title_en=f"Event {i}", slug=f"event-{i}",
+                                 event_date=today - datetime.timedelta(days=i))
+            for i in range(5)
+        ]
+        seen, url = [], "/api/v1/events/?page_size=2&fields=id"
+        while url:
+            page = self.client.get(url).json()
+            seen += [row["id"] for row in page["results"]]
+            url = page["next"]
+        self.assertEqual(seen, [event.pk for event in events])
+        self.assertEqual(self.client.get("/api/v1/events/", {"cursor": "nonsense"}).status_code, 404)
+
+    def test_cached_until_content_changes(self):
+        room = Room.objects.create(title="Deluxe", location="Annex", description="", price_per_night=80)
+        Testimony.objects.create(name="Draft", email="a@example.com", status="draft")
+        Testimony.objects.create(name="Grace", email="b@example.com", status=Testimony.PUBLISHED)
+
+        self.client.get("/api/v1/rooms/")
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/api/v1/rooms/")
+        self.assertEqual(len(queries), 0)
+        self.assertEqual(response.json()["results"][0]["amenities"], [])
+
+        room.amenities.add(Amenity.objects.create(name="WiFi"))
+        RoomImage.objects.bulk_create([RoomImage(room=room, image="rooms/deluxe.jpg")])
+        self.assertEqual(self.client.get("/api/v1/rooms/").json()["results"][0]["amenities"], ["WiFi"])
+        RoomImage.objects.create(room=room, image="rooms/deluxe-2.jpg", alt_text="Bed")
+        detail = self.client.get(f"/api/v1/rooms/{room.pk}/").json()
+        self.assertEqual(len(detail["images"]), 2)
+
+        testimonies = self.client.get("/api/v1/testimonies/").json()["results"]
+        self.assertEqual([row["name"] for row in testimonies], ["Grace"])
+        self.assertNotIn("email", testimonies[0])
+
+@override_settings(STATICFILES_STORAGE="django.contrib.staticfiles.storage.StaticFilesStorage",
+                   CACHES=TEST_CACHES)
+class MassScheduleTests(TestCase):
+    """
+    Recurring Masses are expanded for the dates asked for, with stored rows
+    moving, cancelling or adding Masses, at a cost that does not grow with
+    the schedule's history.
+    """
+
+    def setUp(self):
+        cache.clear()
+        # Monday 2025-06-02
+        self.monday = datetime.date(2025, 6, 2)
+        self.weekdays = MassRule.objects.create(
+            start_time="06:30", end_time="07:30", starts_on=self.monday,
+            monday=True, tuesday=True, wednesday=True, thursday=True, friday=True,
+        )
+        self.sunday = MassRule.objects.create(
+            start_time="10:00", end_time="11:30", starts_on=self.monday,
+            ends_on=self.monday + datetime.timedelta(days=13), sunday=True,
+        )
+
+    def masses(self, start, days):
+        return [
+            (mass.date.day, mass.start_time.strftime("%H:%M"), mass.rule_id)
+            for mass in occurrences(start, start + datetime.timedelta(days=days))
+        ]
+
+    def test_rules_expand_with_changes(self):
+        tuesday = self.monday + datetime.timedelta(days=1)
+        MassSchedule.objects.create(date=self.monday, start_time="06:30", end_time="07:30",
+                                    rule=self.weekdays, cancelled=True)
+        MassSchedule.objects.create(date=tuesday, start_time="07:00", end_time="08:00",
+                                    rule=self.weekdays)
+        MassSchedule.objects.create(date=tuesday, start_time="18:00", end_time="19:00",
+                                    mass_type=MassSchedule.EVENING)
+
+        self.assertEqual(self.masses(self.monday - datetime.timedelta(days=1), 3), [
+            (3, "07:00", self.weekdays.pk), (3, "18:00", None),
+        ])
+        sundays = [day for day, _, rule in self.masses(self.monday, 28) if rule == self.sunday.pk]
+        self.assertEqual(sundays, [8, 15])
+
+        self.assertRaises(ValidationError, MassSchedule(
+            date=tuesday, start_time="07:00", end_time="08:00", cancelled=True,
+        ).clean)
+        self.assertRaises(ValidationError, MassRule(start_time="07:00", end_time="08:00").clean)
+
+    def test_schedule_page_cost_is_constant(self):
+        def queries(url):
+            with CaptureQueriesContext(connection) as captured:
+                response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            return len(captured), response
+
+        today = timezone.localdate()
+        history = [
+            MassSchedule(date=today - datetime.timedelta(days=day), start_time="20:00",
+                         end_time="21:00", mass_type=MassSchedule.EVENING)
+            for day in range(1, 51)
+        ]
+        MassSchedule.objects.bulk_create(history[:5])
+        before, response = queries("/mass-schedule/")
+        self.assertFalse(response.context["page_obj"].has_previous())
+        MassSchedule.objects.bulk_create(history[5:])
+        after, response = queries("/mass-schedule/")
+        self.assertEqual(before, after)
+
+        later = today + datetime.timedelta(weeks=52)
+        count, response = queries(f"/mass-schedule/?cursor={later.isoformat()}")
+        self.assertEqual(count, before)
+        self.assertEqual(response.context["page_obj"].next_cursor,
+                         (later + datetime.timedelta(weeks=2)).isoformat())
+        self.assertEqual(queries("/mass-schedule/?cursor=nonsense")[0], before)
+
+        response = self.client.get("/mass-schedule/", HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(response.status_code, 200)
+        etag = self.client.get("/mass-schedule/")["ETag"]
+        self.assertEqual(self.client.get("/mass-schedule/", HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+    def test_upcoming_api(self):
+        url = "/api/v1/mass-schedules/upcoming/"
+        masses = self.client.get(url, {"from": self.monday.isoformat(), "weeks": 1}).json()
+        self.assertEqual([(mass["date"], mass["rule"]) for mass in masses][-2:], [
+            ("2025-06-06", self.weekdays.pk), ("2025-06-08", self.sunday.pk),
+        ])
+        self.assertIsNone(masses[0]["id"])
+
+        self.sunday.delete()
+        masses = self.client.get(url, {"from": self.monday.isoformat(), "weeks": 1}).json()
+        self.assertEqual(len(masses), 5)
+        self.assertEqual(self.client.get(url, {"weeks": 99}).status_code, 400)
+        self.assertEqual(self.client.get(url, {"from": "june"}).status_code, 400)
+
+@override_settings(CACHES=TEST_CACHES)
+class CalendarFeedTests(TestCase):
+    """
+    The .ics feeds stream valid calendars per language and answer polling
+    clients with a 304 until a row in the feed changes or goes away.
+    """
+
+    def setUp(self):
+        today = timezone.localdate()
+        MassRule.objects.create(start_time="06:30", end_time="07:30", starts_on=today, sunday=True)
+        self.event = Event.objects.create(
+            title_en="Pilgrimage", title_fr="Pèlerinage, à pied", event_date=today,
+            description_fr="<p>" + "Une marche de foi. " * 10 + "</p>",
+        )
+
+    def fetch(self, url, **headers):
+        response = self.client.get(url, **headers)
+        body = b"".join(response.streaming_content).decode() if response.streaming else ""
+        return response, body
+
+    def test_feeds(self):
+        response, body = self.fetch("/calendar/fr/events.ics")
+        self.assertEqual(response["Content-Type"], "text/calendar; charset=utf-8")
+        self.assertTrue(body.startswith("BEGIN:VCALENDAR\r\n") and body.endswith("END:VCALENDAR\r\n"))
+        self.assertIn("SUMMARY:Pèlerinage\\, à pied", body)
+        self.assertIn(f"/fr/events/{self.event.pk}/", body)
+        self.assertTrue(all(len(line.encode()) <= 75 for line in body.split("\r\n")))
+        self.assertNotIn("Cookie", response.get("Vary", ""))
+
+        response, body = self.fetch("/calendar/rw/mass-schedule.ics")
+        self.assertIn("SUMMARY:Misa ya mu gitondo", body)
+        self.assertGreaterEqual(body.count("BEGIN:VEVENT"), 52)
+        self.assertEqual(self.client.get("/calendar/de/events.ics").status_code, 404)
+
+    def test_not_modified_until_rows_change(self):
+        url = "/calendar/en/events.ics"
+        etag = self.client.get(url)["ETag"]
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(len(queries), 1)
+
+        Event.objects.create(title_en="Retreat", event_date=timezone.localdate())
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        etag = response["ETag"]
+        Event.objects.filter(title_en="Retreat").delete()
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+@override_settings(CACHES=TEST_CACHES)
+class BookingTests(TestCase):
+    """
+    Availability follows the booked nights, amenities and price, and a
+    night can only be booked once.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.wifi = Amenity.objects.create(name="WiFi")
+        self.parking = Amenity.objects.create(name="Parking")
+        self.cheap = Room.objects.create(title="Cell", location="Annex", description="", price_per_night=40)
+        self.suite = Room.objects.create(title="Suite", location="Main", description="", price_per_night=120)
+        self.suite.amenities.add(self.wifi, self.parking)
+        self.cheap.amenities.add(self.wifi)
+        self.june = datetime.date(2025, 6, 1)
+
+    def days(self, n):
+        return self.june + datetime.timedelta(days=n)
+
+    def available(self, check_in, check_out, **filters):
+        return list(Room.objects.available(check_in, check_out, **filters).order_by("price_per_night"))
+
+    def test_availability(self):
+        guest = {"guest_name": "Grace", "guest_email": "grace@example.com"}
+        book(self.suite, self.days(2), self.days(5), **guest)
+        Booking.objects.create(room=self.cheap, check_in=self.days(0), check_out=self.days(9),
+                               status=Booking.CANCELLED, **guest)
+
+        self.assertEqual(self.available(self.days(0), self.days(2)), [self.cheap, self.suite])
+        self.assertEqual(self.available(self.days(4), self.days(6)), [self.cheap])
+        self.assertEqual(self.available(self.days(5), self.days(7)), [self.cheap, self.suite])
+        self.assertEqual(self.available(self.days(5), self.days(7), amenities=[self.wifi.pk, self.parking.pk]), [self.suite])
+        self.assertEqual(self.available(self.days(5), self.days(7), max_price=100), [self.cheap])
+
+        url = "/api/v1/rooms/available/"
+        rooms = self.client.get(url, {
+            "check_in": self.days(3).isoformat(), "check_out": self.days(4).isoformat(),
+            "amenities": "WiFi", "fields": "id,price_per_night",
+        }).json()["results"]
+        self.assertEqual(rooms, [{"id": self.cheap.pk, "price_per_night": "40.00"}])
+        stay = {"check_in": self.days(3).isoformat(), "check_out": self.days(3).isoformat()}
+        self.assertEqual(self.client.get(url, stay).status_code, 400)
+        stay["check_out"], stay["amenities"] = self.days(4).isoformat(), "Sauna"
+        self.assertEqual(self.client.get(url, stay).status_code, 400)
+
+    def test_nights_are_booked_once(self):
+        stay = {
+            "room": self.suite.pk, "check_in": self.days(0).isoformat(), "check_out": self.days(3).isoformat(),
+            "guest_name": "Grace", "guest_email": "grace@example.com",
+        }
+        response = self.client.post("/api/v1/bookings/", stay)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()["total_price"], "360.00")
+        self.assertEqual(self.client.post("/api/v1/bookings/", {**stay, "check_in": self.days(2).isoformat(),
+                                                                "check_out": self.days(4).isoformat()}).status_code, 409)
+        self.assertEqual(self.client.post("/api/v1/bookings/", {**stay, "check_out": self.days(90).isoformat()}).status_code, 400)
+
+        with self.assertRaises(RoomUnavailable):
+            book(self.suite, self.days(1), self.days(2), guest_name="Joy", guest_email="joy@example.com")
+        book(self.suite, self.days(3), self.days(4), guest_name="Joy", guest_email="joy@example.com")
+        # Refused attempts roll their lock back with the rest
+        self.suite.refresh_from_db()
+        self.assertEqual(self.suite.booking_version, 2)
+
+    def test_failed_requests_are_client_errors(self):
+        stay = {
+            "room": self.suite.pk, "check_in": self.days(0).isoformat(), "check_out": self.days(3).isoformat(),
+            "guest_name": "Grace", "guest_email": "grace@example.com",
+        }
+
+        def validate_then_delete(serializer, attrs):
+            attrs["room"].delete()
+            return attrs
+
+        # The room goes away after the request was validated
+        with mock.patch.object(BookingSerializer, "validate", validate_then_delete):
+            response = self.client.post("/api/v1/bookings/", stay)
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("room", response.json())
+
+        stay["room"] = self.cheap.pk
+        with mock.patch.object(Booking, "clean", side_effect=ValidationError("Closed for the season.")):
+            response = self.client.post("/api/v1/bookings/", stay)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), ["Closed for the season."])
+
+@override_settings(CACHES=TEST_CACHES)
+class StaticBuildTests(TestCase):
+    """
+    The static build fingerprints and precompresses files, survives dead
+    references in vendored CSS, and the layout preloads the hashed names.
+    """
+
+    def test_fingerprinted_and_compressed(self):
+        css = "body { background: url(../img/dot.png) }\n" + ".icon { src: url(../fonts/gone.svg#x) }\n" * 50
+        with tempfile.TemporaryDirectory() as source, tempfile.TemporaryDirectory() as root:
+            files = FileSystemStorage(location=source)
+            files.save("css/site.css", ContentFile(css.encode()))
+            files.save("img/dot.png", ContentFile(b"\x89PNG"))
+
+            storage = StaticFilesStorage(location=root, base_url="/static/")
+            paths = {name: (files, name) for name in ("css/site.css", "img/dot.png")}
+            for name in paths:
+                storage.save(name, files.open(name))
+            errors = [error for _, _, error in storage.post_process(paths) if isinstance(error, Exception)]
+            self.assertEqual(errors, [])
+
+            hashed = storage.hashed_files["css/site.css"]
+            self.assertRegex(hashed, r"^css/site\.[0-9a-f]{12}\.css$")
+            with storage.open(hashed) as fh:
+                built = fh.read().decode()
+            self.assertIn(storage.hashed_files["img/dot.png"].split("/")[-1], built)
+            self.assertIn("url(../fonts/gone.svg#x)", built)
+            self.assertEqual(storage.missing_references, {("css/site.css", "../fonts/gone.svg#x")})
+            self.assertTrue(storage.exists(f"{hashed}.gz"))
+            self.assertTrue(storage.exists(storage.manifest_name))
+
+    @override_settings(STATICFILES_STORAGE="django.contrib.staticfiles.storage.StaticFilesStorage")
+    def test_preload_hints(self):
+        html = Template("{% load assets %}{% preload_static %}").render(Context())
+        self.assertIn('<link rel="preload" href="/static/js/vendors.js" as="script">', html)
+        self.assertIn('<link rel="preload" href="/static/js/main.js" as="script">', html)
+        # The stylesheets are linked in the head anyway
+        self.assertNotIn('as="style"', html)
+
+@override_settings(STATICFILES_STORAGE="django.contrib.staticfiles.storage.StaticFilesStorage",
+                   CACHES=TEST_CACHES)
+class HomeCacheTests(TestCase):
+    """
+    The home page context is cached per language and rebuilt only once
+    one of the models it shows changes.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.homily = Homily.objects.create(title_en="Advent", title_fr="Avent")
+        room = Room.objects.create(title="Cell", location="Annex", description="", price_per_night=40)
+        RoomImage.objects.create(room=room, image="rooms/cell.jpg")
+
+    def get(self, url="/"):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response, len(queries)
+
+    def test_cached_until_content_changes(self):
+        _, cold = self.get()
+        self.assertGreater(cold, 0)
+        response, warm = self.get()
+        self.assertEqual(warm, 0)
+        self.assertContains(response, "Advent")
+        self.assertContains(response, "/media/rooms/cell.jpg")
+
+        # Every language has its own payload
+        self.assertGreater(self.get("/fr/")[1], 0)
+
+        self.homily.title_en = "Lent"
+        self.homily.save()
+        response, rebuilt = self.get()
+        self.assertGreater(rebuilt, 0)
+        self.assertContains(response, "Lent")
+        self.assertNotContains(response, "Advent")
+        self.assertEqual(self.get()[1], 0)
+
+@override_settings(CACHES=TEST_CACHES)
+class RoomSamplingTests(TestCase):
+    """
+    Random rooms are drawn from a cached id list, never by sorting the
+    table at random, and the list follows rooms being added or removed.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.rooms = [
+            Room.objects.create(title=f"Room {i}", location="Annex", description="", price_per_night=40)
+            for i in range(6)
+        ]
+
+    def test_random_rooms(self):
+        with CaptureQueriesContext(connection) as queries:
+            picked = random_rooms(4, exclude=self.rooms[0].pk)
+        self.assertEqual(len(picked), 4)
+        self.assertEqual(len(set(picked)), 4)
+        self.assertNotIn(self.rooms[0], picked)
+        self.assertFalse(any("RANDOM()" in query["sql"] for query in queries))
+
+        # The ids come from the cache: one query for the rooms themselves
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(len(random_rooms(10)), 6)
+        self.assertEqual(len(queries), 1)
+
+    def test_id_list_follows_rooms(self):
+        random_rooms(1)
+        self.rooms[0].delete()
+        added = Room.objects.create(title="Annex", location="Annex", description="", price_per_night=40)
+        self.assertEqual(set(random_rooms(10)), set(self.rooms[1:]) | {added})
+
+@override_settings(STATICFILES_STORAGE="django.contrib.staticfiles.storage.StaticFilesStorage",
+                   CACHES=TEST_CACHES)
+class RoomListingQueryTests(TestCase):
+    """
+    Room cards load their cover image and amenities in bulk, so the rooms
+    pages cost the same number of queries however many rooms they show.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.wifi = Amenity.objects.create(name="WiFi")
+        self.parking = Amenity.objects.create(name="Parking")
+
+    def add_rooms(self, count, images=2):
+        rooms = []
+        for _ in range(count):
+            room = Room.objects.create(title=f"Room {Room.objects.count()}", location="Annex",
+                                       description="", price_per_night=40)
+            room.amenities.add(self.wifi, self.parking)
+            for n in range(images):
+                RoomImage.objects.create(room=room, image=f"rooms/{room.pk}-{n}.jpg")
+            rooms.append(room)
+        return rooms
+
+    def queries(self, url):
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(captured), response
+
+    def test_rooms_list(self):
+        self.add_rooms(2)
+        before, _ = self.queries("/rooms/")
+        rooms = self.add_rooms(8)
+        after, response = self.queries("/rooms/")
+        self.assertEqual(after, before)
+        # The newest image is the cover
+        self.assertContains(response, f"/media/rooms/{rooms[-1].pk}-1.jpg")
+        self.assertNotContains(response, f"/media/rooms/{rooms[-1].pk}-0.jpg")
+
+    def test_room_details(self):
+        small, = self.add_rooms(1, images=1)
+        large, = self.add_rooms(1, images=6)
+        self.add_rooms(4)
+        # Fills the cached room id list the related rooms are drawn from
+        self.queries(f"/room/{small.pk}/")
+        before, _ = self.queries(f"/room/{small.pk}/")
+        after, response = self.queries(f"/room/{large.pk}/")
+        self.assertEqual(after, before)
+        self.assertContains(response, "Parking")
+
+@override_settings(STATICFILES_STORAGE="django.contrib.staticfiles.storage.StaticFilesStorage",
+                   PAGINATION_MODE="cursor", CACHES=TEST_CACHES)
+class CursorPaginationTests(TestCase):
+    """
+    Walking next and previous cursors visits every row once, in the same
+    order as the numbered pages, and the list pages link the cursors.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        today = datetime.date.today()
+        # Ties on published_at and a run of unpublished (NULL) homilies
+        for i in range(11):
+            Homily.objects.create(
+                title_en=f"Homily {i}",
+                published_at=None if i % 4 == 0 else today - datetime.timedelta(days=i // 3),
+            )
+        cls.ordering = ("-published_at", "-created_at")
+        cls.expected = list(
+            Homily.objects.order_by(F("published_at").desc(nulls_last=True), "-created_at", "-pk")
+        )
+
+    def test_walk_forward_and_back(self):
+        paginator = CursorPaginator(Homily.objects.all(), 3, self.ordering)
+        pages = [paginator.page()]
+        self.assertFalse(pages[0].has_previous())
+        while pages[-1].has_next():
+            pages.append(paginator.page(pages[-1].next_cursor))
+        self.assertEqual([row for page in pages for row in page], self.expected)
+        self.assertEqual([len(page) for page in pages], [3, 3, 3, 2])
+
+        back = [pages[-1]]
+        while back[-1].has_previous():
+            back.append(paginator.page(back[-1].previous_cursor))
+        self.assertEqual([list(page) for page in reversed(back)], [list(page) for page in pages])
+
+    def test_list_page_links(self):
+        response = self.client.get("/homilies/")
+        page_obj = response.context["page_obj"]
+        self.assertEqual(list(page_obj), self.expected[:6])
+        self.assertContains(response, f'href="?cursor={page_obj.next_cursor}"')
+        self.assertNotContains(response, "?page=")
+
+        response = self.client.get("/homilies/", {"cursor": page_obj.next_cursor})
+        self.assertEqual(list(response.context["page_obj"]), self.expected[6:])
+        self.assertContains(response, f'href="?cursor={response.context["page_obj"].previous_cursor}"')
+        self.assertFalse(response.context["page_obj"].has_next())
+
+        # A tampered cursor starts over; ?page= still serves numbered pages
+        self.assertEqual(list(self.client.get("/homilies/", {"cursor": "bogus"}).context["page_obj"]),
+                         self.expected[:6])
+        self.assertEqual(list(self.client.get("/homilies/", {"page": 2}).context["page_obj"]),
+                         self.expected[6:])
+
+@override_settings(STATICFILES_STORAGE="django.contrib.staticfiles.storage.StaticFilesStorage",
+                   CACHES=TEST_CACHES)
+class LanguageColumnTests(TestCase):
+    """
+    Translated list and detail views read only the active language's
+    columns, and rendering never loads a deferred one row by row.
+    """
+
+    def setUp(self):
+        cache.clear()
+        for i in range(3):
+            Event.objects.create(
+                title_en=f"Retreat {i}", title_fr=f"Retraite {i}", slug=f"retreat-{i}",
+                event_date=datetime.date.today(),
+                description_en="<p>Bring a bible.</p>", description_fr="<p>Apportez une bible.</p>",
+            )
+
+    def event_queries(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response, [query["sql"] for query in queries if '"base_event"' in query["sql"]]
+
+    def test_list_reads_one_language(self):
+        response, queries = self.event_queries("/fr/events/")
+        self.assertContains(response, "Retraite 2")
+        self.assertContains(response, "Apportez une bible.")
+        self.assertEqual(len(queries), 1)
+        self.assertIn('"excerpt_fr"', queries[0])
+        for column in ("title_en", "excerpt_en", "description_fr", "description_en", "title_sw"):
+            self.assertNotIn(f'"{column}"', queries[0])
+
+    def test_detail_reads_one_language(self):
+        event = Event.objects.get(slug="retreat-1")
+        response, queries = self.event_queries(f"/fr/events/{event.pk}/")
+        self.assertContains(response, "Apportez une bible.")
+        self.assertEqual(len(queries), 1)
+        self.assertIn('"description_fr"', queries[0])
+        self.assertNotIn('"description_en"', queries[0])
+
+@override_settings(CACHES=TEST_CACHES)
+class ExcerptTests(TestCase):
+    """
+    Cards show a plain-text excerpt per language, kept in step with the
+    rich-text body on save and rebuilt in bulk by backfill_excerpts.
+    """
+
+    def test_excerpts_follow_the_body(self):
+        homily = Homily.objects.create(
+            title_en="Advent",
+            content_en="<p>Stay <b>awake</b> &amp;\n  watch.</p>\n" + "<p>word</p>\n" * 200,
+            content_fr="<p>Veillez &eacute;veill&eacute;s.</p>",
+        )
+        self.assertTrue(homily.excerpt_en.startswith("Stay awake & watch. word word"))
+        self.assertEqual(len(homily.excerpt_en.split()), EXCERPT_WORDS)
+        self.assertTrue(homily.excerpt_en.endswith("…"))
+        self.assertEqual(homily.excerpt_fr, "Veillez éveillés.")
+        self.assertEqual(homily.excerpt_sw, "")
+
+        homily.content_fr = "<h2>Nouveau</h2>"
+        homily.save()
+        self.assertEqual(Homily.objects.get().excerpt_fr, "Nouveau")
+
+    def test_backfill(self):
+        Event.objects.bulk_create([Event(
+            title_en="Retreat", slug="retreat", event_date=datetime.date.today(),
+            description_en="<ul><li>Bring a bible</li></ul>",
+        )])
+        self.assertEqual(Event.objects.get().excerpt_en, "")
+        call_command("backfill_excerpts", stdout=io.StringIO())
+        self.assertEqual(Event.objects.get().excerpt_en, "Bring a bible")
+
+@override_settings(STATICFILES_STORAGE="django.contrib.staticfiles.storage.StaticFilesStorage",
+                   CACHES=TEST_CACHES)
+class ConditionalGetTests(TestCase):
+    """
+    List and detail views send an ETag (detail views a Last-Modified too),
+    answer a matching If-None-Match with a bodyless 304, and change
+    validators with the rows.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.event = Event.objects.create(title_en="Retreat", slug="retreat", event_date=datetime.date.today())
+
+    def test_not_modified(self):
+        for url in ("/events/", f"/events/{self.event.pk}/"):
+            with self.subTest(url=url):
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+
+                cached = self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+                self.assertEqual(cached.status_code, 304)
+                self.assertEqual(cached.content, b"")
+                self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH='"stale"').status_code, 200)
+
+    def test_last_modified_never_goes_backwards(self):
+        response = self.client.get(f"/events/{self.event.pk}/")
+        self.assertIn("Last-Modified", response)
+        self.assertEqual(self.client.get(
+            f"/events/{self.event.pk}/", HTTP_IF_MODIFIED_SINCE=response["Last-Modified"],
+        ).status_code, 304)
+
+        # Deleting the newest row would move a list's newest timestamp back
+        Event.objects.create(title_en="Vigil", slug="vigil", event_date=datetime.date.today())
+        response = self.client.get("/events/")
+        self.assertNotIn("Last-Modified", response)
+        Event.objects.filter(title_en="Vigil").delete()
+        self.assertEqual(self.client.get(
+            "/events/", HTTP_IF_MODIFIED_SINCE=http_date(time.time() + 60),
+        ).status_code, 200)
+
+    def test_validators_follow_the_rows(self):
+        etags = {url: self.client.get(url)["ETag"] for url in ("/events/", f"/events/{self.event.pk}/")}
+        # Every language is a different representation
+        self.assertNotEqual(self.client.get("/fr/events/")["ETag"], etags["/events/"])
+
+        self.event.title_en = "Silent retreat"
+        self.event.save()
+        for url, etag in etags.items():
+            with self.subTest(url=url):
+                self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+        etag = self.client.get("/events/")["ETag"]
+        Event.objects.create(title_en="Vigil", slug="vigil", event_date=datetime.date.today())
+        self.assertEqual(self.client.get("/events/", HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+@override_settings(STATICFILES_STORAGE="django.contrib.staticfiles.storage.StaticFilesStorage",
+                   CACHES=TEST_CACHES)
+class PageCacheTests(TestCase):
+    """
+    Pages under a language prefix are cached whole for anonymous visitors
+    until content changes; visitors with a session always get a fresh page.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.homily = Homily.objects.create(title_en="Advent", title_fr="Avent")
+
+    def get(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response, len(queries)
+
+    def test_cached_until_content_changes(self):
+        response, cold = self.get("/fr/homilies/")
+        self.assertGreater(cold, 0)
+        self.assertContains(response, 'href="/fr/homilies/"')
+        self.assertIn("public", response["Cache-Control"])
+        self.assertNotIn("Cookie", response.get("Vary", ""))
+
+        response, warm = self.get("/fr/homilies/")
+        self.assertEqual(warm, 0)
+        self.assertContains(response, "Avent")
+        self.assertEqual(self.client.get("/fr/homilies/", HTTP_IF_NONE_MATCH=response["ETag"]).status_code, 304)
+        # Each language, and each query string, is its own page
+        self.assertContains(self.get("/en/homilies/")[0], "Advent")
+        self.assertGreater(self.get("/fr/homilies/?page=1")[1], 0)
+
+        self.homily.title_fr = "Carême"
+        self.homily.save()
+        response, rebuilt = self.get("/fr/homilies/")
+        self.assertGreater(rebuilt, 0)
+        self.assertContains(response, "Carême")
+
+    def test_key_ignores_host_and_other_parameters(self):
+        self.get("/fr/homilies/?page=1")
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get("/fr/homilies/?page=1", HTTP_HOST="evil.example")
+        self.assertEqual(len(queries), 0)
+
+        # Unknown parameters are served, but never stored
+        self.get("/fr/homilies/?utm=1")
+        self.assertGreater(self.get("/fr/homilies/?utm=1")[1], 0)
+        self.assertContains(self.get("/fr/search/?q=Avent")[0], "Avent")
+        self.assertGreater(self.get("/fr/search/?q=Avent")[1], 0)
+
+    def test_not_cached_with_a_session(self):
+        self.get("/fr/homilies/")
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = "anything"
+        self.assertGreater(self.get("/fr/homilies/")[1], 0)
+
+@override_settings(STATICFILES_STORAGE="django.contrib.staticfiles.storage.StaticFilesStorage",
+                   CACHES=TEST_CACHES)
+class LanguageResolutionTests(TestCase):
+    """
+    The language comes from the URL, a signed cookie or Accept-Language,
+    and anonymous visitors never get a session.
+    """
+
+    def setUp(self):
+        cache.clear()
+        Homily.objects.create(title_en="Advent", title_fr="Avent", title_sw="Majilio")
+
+    def test_no_session_for_anonymous_visitors(self):
+        from django.contrib.sessions.models import Session
+        response = self.client.get("/homilies/", HTTP_ACCEPT_LANGUAGE="fr-CA,fr;q=0.9")
+        self.assertContains(response, "Avent")
+        self.assertIn("Accept-Language", response["Vary"])
+
+        response = self.client.get("/change-language/sw/", HTTP_REFERER="/homilies/")
+        self.assertRedirects(response, "/homilies/", fetch_redirect_response=False)
+        self.assertContains(self.client.get("/homilies/", HTTP_ACCEPT_LANGUAGE="fr"), "Majilio")
+        self.assertNotIn(settings.SESSION_COOKIE_NAME, self.client.cookies)
+        self.assertFalse(Session.objects.exists())
+
+    def test_tampered_cookie_is_ignored(self):
+        self.client.cookies["lang"] = "sw"
+        self.assertContains(self.client.get("/homilies/"), "Advent")
+
+@override_settings(CACHES=TEST_CACHES)
+class TranslateTagTests(TestCase):
+    """
+    {% t %} looks UI strings up in the active language's catalog and
+    |tr reads the active language's column of a translated model.
+    """
+
+    def render(self, source, lang, **context):
+        token = active_lang.set(lang)
+        try:
+            return Template("{% load translate %}" + source).render(Context(context))
+        finally:
+            active_lang.reset(token)
+
+    def test_t(self):
+        self.assertEqual(self.render('{% t "View More" %}', "fr"), "Voir plus")
+        self.assertEqual(self.render('{% t "View More" %}', "rw"), "Reba byinshi")
+        self.assertEqual(self.render('{% t "View More" %}', "en"), "View More")
+        # Unknown keys fall back to themselves; variables are escaped
+        self.assertEqual(self.render('{% t "Not in the catalog" %}', "sw"), "Not in the catalog")
+        self.assertEqual(self.render("{% t label %}", "fr", label="Events"), "Événements")
+        self.assertEqual(self.render("{% t label %}", "fr", label="<b>"), "&lt;b&gt;")
+
+    def test_tr(self):
+        homily = Homily(title_en="Advent", title_fr="Avent", title_rw="Adventi")
+        self.assertEqual(self.render('{{ homily|tr:"title" }}', "fr", homily=homily), "Avent")
+        self.assertEqual(self.render('{{ homily|tr:"title" }}', "rw", homily=homily), "Adventi")
+        self.assertEqual(self.render('{{ homily|tr:"title" }}', "sw", homily=homily), "")
+
+@override_settings(STATICFILES_STORAGE="django.contrib.staticfiles.storage.StaticFilesStorage",
+                   CACHES=TEST_CACHES)
+class BenchViewsTests(TestCase):
+    """
+    bench_views requests a working URL for every page in base.urls.
+    """
+
+    def test_percentile(self):
+        self.assertEqual(percentile([5, 1, 4, 2, 3], 50), 3)
+        self.assertEqual(percentile([5, 1, 4, 2, 3], 95), 5)
+        self.assertEqual(percentile([7], 50), 7)
+
+    def test_views(self):
+        Event.objects.create(title_en="Retreat", event_date=datetime.date.today())
+        Room.objects.create(title="Cell", location="Annex", description="", price_per_night=40)
+        stderr = io.StringIO()
+        views = dict(BenchViewsCommand(stderr=stderr).views(random.Random(0)))
+        self.assertEqual(stderr.getvalue(), "")
+        named = {pattern.name for pattern in base_urls.urlpatterns if getattr(pattern, "name", None)}
+        self.assertEqual(set(views), named - {"change_language"})
+        self.assertEqual(views["eventsFeed"]("fr"), "/calendar/fr/events.ics")
+        for name, next_url in views.items():
+            with self.subTest(view=name):
+                self.assertEqual(self.client.get(next_url("en")).status_code, 200)
+
+@override_settings(CACHES=TEST_CACHES)
+class SeedCommandTests(TestCase):
+    """
+    The generate_* commands insert in batches, fill the excerpts bulk
+    inserts skip, and reproduce the same rows for the same --seed.
+    """
+
+    def setUp(self):
+        media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(media_root.cleanup)
+        self.enterContext(override_settings(MEDIA_ROOT=media_root.name))
+
+    def generate(self, **options):
+        with CaptureQueriesContext(connection) as queries:
+            call_command("generate_homilies", count=25, batch_size=10, no_images=True,
+                         stdout=io.StringIO(), **options)
+        return [query["sql"] for query in queries if query["sql"].startswith('INSERT INTO "base_homily"')]
+
+    def test_batches_and_excerpts(self):
+        self.assertEqual(len(self.generate()), 3)
+        self.assertEqual(Homily.objects.count(), 25)
+        self.assertFalse(Homily.objects.filter(excerpt_en="").exists())
+        self.assertEqual(set(Homily.objects.values_list("image", flat=True)), {"homilies/placeholder.jpg"})
+
+    def test_seed_is_reproducible(self):
+        def rows():
+            return list(Homily.objects.order_by("pk").values_list("title_en", "title_fr", "published_at"))
+
+        self.generate(seed=7)
+        first = rows()
+        Homily.objects.all().delete()
+        self.generate(seed=7)
+        self.assertEqual(rows(), first)
+
+    def test_invalidates_the_cache(self):
+        # bulk_create sends no post_save; the seeder bumps the versions itself
+        cache.clear()
+        self.assertEqual(room_ids(), [])
+        home = get_version("home")
+        call_command("generate_rooms", count=3, no_images=True, stdout=io.StringIO())
+        self.assertEqual(sorted(room_ids()), sorted(Room.objects.values_list("id", flat=True)))
+        self.assertEqual(len(room_ids()), 3)
+        self.assertNotEqual(get_version("home"), home)
+
+@override_settings(CACHES=TEST_CACHES)
+class ImageWriterTests(TestCase):
+    """
+    Seed images drawn on worker processes are all written before the
+    command returns, and identical to the ones drawn in-process.
+    """
+
+    def generate(self, workers):
+        media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(media_root.cleanup)
+        with override_settings(MEDIA_ROOT=media_root.name):
+            call_command("generate_gallery", count=6, seed=5, workers=workers, stdout=io.StringIO())
+            files = {}
+            for gallery in Gallery.objects.order_by("pk"):
+                with gallery.image.open() as fh:
+                    files[gallery.image.name] = fh.read()
+        Gallery.objects.all().delete()
+        return files
+
+    def test_workers_draw_the_same_images(self):
+        in_process = self.generate(workers=1)
+        self.assertEqual(len(in_process), 6)
+        with Image.open(io.BytesIO(next(iter(in_process.values())))) as img:
+            self.assertEqual(img.size, (1200, 800))
+        self.assertEqual(list(self.generate(workers=3).values()), list(in_process.values()))
@@ -0,0 +1,333 @@
+"""
+Site copy for the four supported languages.
+
+UI_STRINGS maps the English text used as the key in templates
+({% t "View More" %}) to its French, Kinyarwanda and Swahili versions.
+CATALOG is the same data flattened once at import into one dict per
+language, which is what the `translate` template library reads.
+"""
+from contextvars import ContextVar
+from django.utils.safestring import mark_safe
+
+LANGUAGES = ("en", "fr", "rw", "sw")
+DEFAULT_LANGUAGE = "en"
+
+# Language of the request being handled; set by DefaultLanguageMiddleware
+active_lang = ContextVar("active_lang", default=DEFAULT_LANGUAGE)
+
+def get_active_lang():
+    return active_lang.get()
+
+UI_STRINGS = {
+    'Contact Us': {
+        'fr': 'Contactez-nous',
+        'rw': 'Hamagara',
+        'sw': 'Wasiliana nasi',
+    },
+    'Toll Free Customer Care': {
+        'fr': 'Service client gratuit',
+        'rw': "Serivisi y'abakiriya Ubuntu",
+        'sw': 'Huduma kwa Wateja bila malipo',
+    },
+    'Need live support?': {
+        'fr': "Besoin d'assistance en direct&nbsp;?",
+        'rw': "Ukeneye ubufasha bw'ako kanya?",
+        'sw': 'Unahitaji msaada wa moja kwa moja?',
+    },
+    'Who We Are': {
+        'fr': 'Qui sommes-nous',
+        'rw': 'Turi bande',
+        'sw': 'Sisi ni nani',
+    },
+    'About Us': {
+        'fr': 'À propos de nous',
+        'rw': 'Ibyerekeye Twebwe',
+        'sw': 'Kuhusu Sisi',
+    },
+    'Support': {
+        'fr': 'Support',
+        'rw': 'Inkunga',
+        'sw': 'Msaada',
+    },
+    'Contact': {
+        'fr': 'Contact',
+        'rw': 'Tuvugishe',
+        'sw': 'Wasiliana',
+    },
+    'Other Services': {
+        'fr': 'Autres services',
+        'rw': 'Serivisi zindi',
+        'sw': 'Huduma Nyingine',
+    },
+    'Room Booking': {
+        'fr': 'Réservation de chambre',
+        'rw': 'Rezervasiyo y’icyumba',
+        'sw': 'Uhifadhi wa Chumba',
+    },
+    'Terms': {
+        'fr': 'Conditions',
+        'rw': 'Amategeko',
+        'sw': 'Masharti',
+    },
+    'Site Map': {
+        'fr': 'Plan du site',
+        'rw': 'Mapa y’urubuga',
+        'sw': 'Ramani ya Tovuti',
+    },
+    'How do you want to pay?': {
+        'fr': 'Comment souhaitez-vous payer ?',
+        'rw': 'Ni gute wifuza kwishyura?',
+        'sw': 'Ungependa kulipa vipi?',
+    },
+    'Credit/Debit Card': {
+        'fr': 'Carte de Crédit/Débit',
+        'rw': 'Ikadi ya Kredit / Debiti',
+        'sw': 'Kadi ya Mikopo / Debit',
+    },
+    'Digital Payment': {
+        'fr': 'Paiement numérique',
+        'rw': 'Kwishyura Hifashishijwe Ikoranabuhanga',
+        'sw': 'Malipo ya Kidijitali',
+    },
+    'Select payment method *': {
+        'fr': 'Sélectionnez le mode de paiement *',
+        'rw': 'Hitamo uburyo bwo kwishyura *',
+        'sw': 'Chagua njia ya malipo *',
+    },
+    'Card holder name *': {
+        'fr': 'Nom du titulaire de la carte *',
+        'rw': 'Izina ry’umukiriya wa karita *',
+        'sw': 'Jina la mmiliki wa kadi *',
+    },
+    'Credit/debit card number *': {
+        'fr': 'Numéro de carte de crédit/débit *',
+        'rw': 'Nimero ya karita ya Kredit / Debiti *',
+        'sw': 'Nambari ya kadi ya mikopo / debit *',
+    },
+    'Expiry date *': {
+        'fr': 'Date d’expiration *',
+        'rw': 'Itariki isoza *',
+        'sw': 'Tarehe ya kumalizika *',
+    },
+    'Events': {
+        'fr': 'Événements',
+        'rw': 'Ibikorwa',
+        'sw': 'Matukio',
+    },
+    'No events available.': {
+        'fr': 'Aucun événement disponible.',
+        'rw': 'Nta bikorwa biboneka.',
+        'sw': 'Hakuna matukio yanayopatikana.',
+    },
+    'Back to Events': {
+        'fr': 'Retour aux événements',
+        'rw': 'Subira ku bikorwa',
+        'sw': 'Rudia kwa matukio',
+    },
+    'Gallery': {
+        'fr': 'Galerie',
+        'rw': 'Amafoto',
+        'sw': 'Galeria',
+    },
+    'No images available.': {
+        'fr': 'Aucune image disponible.',
+        'rw': 'Nta shusho ziboneka.',
+        'sw': 'Hakuna picha zinazopatikana.',
+    },
+    'Healing Prayers': {
+        'fr': 'Prières de guérison',
+        'rw': 'Isengesho ryo gukira',
+        'sw': 'Maombi ya uponyaji',
+    },
+    'View More': {
+        'fr': 'Voir plus',
+        'rw': 'Reba byinshi',
+        'sw': 'Tazama Zaidi',
+    },
+    'No healing prayers available.': {
+        'fr': 'Aucune prière de guérison disponible.',
+        'rw': 'Nta isengesho ryo gukira riboneka.',
+        'sw': 'Hakuna maombi ya uponyaji yanayopatikana.',
+    },
+    'Homilies': {
+        'fr': 'Homélies',
+        'rw': 'Inyigisho',
+        'sw': 'Mahubiri',
+    },
+    'View Detail': {
+        'fr': 'Voir Détails',
+        'rw': 'Reba ibisobanuro',
+        'sw': 'Angalia Maelezo',
+    },
+    'No homilies available.': {
+        'fr': 'Aucune homélie disponible.',
+        'rw': 'Nta nyigisho ziboneka.',
+        'sw': 'Hakuna mahubiri zinapatikana.',
+    },
+    'Mass Schedule': {
+        'fr': 'Horaire des messes',
+        'rw': 'Igihe cya Misa',
+        'sw': 'Ratiba ya&nbsp;Misa',
+    },
+    'No schedules available.': {
+        'fr': 'Pas d’horaires disponibles.',
+        'rw': 'Nta gahunda ziboneka.',
+        'sw': 'Hakuna ratiba zinapatikana.',
+    },
+    'Advertisements': {
+        'fr': 'Publicités',
+        'rw': 'Amatangazo',
+        'sw': 'Matangazo',
+    },
+    'No advertisements available.': {
+        'fr': 'Aucune publicité disponible.',
+        'rw': 'Nta matangazo aboneka.',
+        'sw': 'Hakuna matangazo yanayopatikana.',
+    },
+    'Rooms': {
+        'fr': 'Chambres',
+        'rw': 'Ibyumba',
+        'sw': 'Vyumba',
+    },
+    'No rooms available.': {
+        'fr': 'Aucune chambre disponible.',
+        'rw': 'Nta byumba biboneka.',
+        'sw': 'Hakuna vyumba vinapatikana.',
+    },
+    'What our customers are<br> saying about us?': {
+        'fr': 'Que disent nos clients ?',
+        'rw': 'Abakiriya bacu bati iki?',
+        'sw': 'Wanasisema nini wateja wetu?',
+    },
+    'Our customers appreciate the quality and warm hospitality they receive at our sanctuary.': {
+        'fr': 'Nos clients apprécient la qualité et l’accueil chaleureux qu’ils reçoivent dans notre sanctuaire.',
+        'rw': 'Abakiriya bacu bishimira ubuziranenge n’akanyamuneza bahabwa muri rusengero rwacu.',
+        'sw': 'Wateja wetu wanathamini ubora na ukarimu wanopata katika sanatorium yetu.',
+    },
+    'Happy People': {
+        'fr': 'Personnes Heureuses',
+        'rw': 'Abantu Bishimye',
+        'sw': 'Watu Wafarajika',
+    },
+    'Overall rating': {
+        'fr': 'Note Globale',
+        'rw': 'Amanota Rusange',
+        'sw': 'Alama Za Jumla',
+    },
+    'Testimony': {
+        'fr': 'Témoignage',
+        'rw': 'Ubuhamya',
+        'sw': 'Ushuhuda',
+    },
+    'No testimonies available.': {
+        'fr': 'Aucun témoignage disponible.',
+        'rw': 'Nta buhamya buboneka.',
+        'sw': 'Hakuna ushuhuda unaopatikana.',
+    },
+    'Trusted by the world’s best': {
+        'fr': 'Approuvé par les meilleurs du monde',
+        'rw': 'Byemejwe n’ababigize umwuga ku isi',
+        'sw': 'Imekubaliwa na bora duniani',
+    },
+    'Our Priests': {
+        'fr': 'Nos Prêtres',
+        'rw': 'Abasaseridoti bacu',
+        'sw': 'Mapadri wetu',
+    },
+    'No priests available.': {
+        'fr': 'Aucun prêtre disponible.',
+        'rw': 'Nta basaseridoti baboneka.',
+        'sw': 'Hakuna mapadri wanaopatikana.',
+    },
+    'Our Members': {
+        'fr': 'Nos Membres',
+        'rw': 'Abagize Umuryango',
+        'sw': 'Wanachama wetu',
+    },
+    'No members available.': {
+        'fr': 'Aucun membre disponible.',
+        'rw': 'Nta membre waboneka.',
+        'sw': 'Hakuna wanachama wanaopatikana.',
+    },
+    'Room Details': {
+        'fr': 'Détails de la chambre',
+        'rw': 'Ibisobanuro by’icyumba',
+        'sw': 'Maelezo ya chumba',
+    },
+    'Related Rooms': {
+        'fr': 'Chambres similaires',
+        'rw': 'Ibyumba bisa',
+        'sw': 'Vyumba vinavyofanana',
+    },
+    'No related rooms available.': {
+        'fr': 'Aucune chambre similaire disponible.',
+        'rw': 'Nta byumba bisa biboneka.',
+        'sw': 'Hakuna vyumba vinavyofanana vinavyopatikana.',
+    },
+    'Testimonies': {
+        'fr': 'Témoignages',
+        'rw': 'Ubuhamya',
+        'sw': 'Ushuhuda',
+    },
+    'Donate': {
+        'fr': 'Faire un don',
+        'rw': 'Tanga Inkunga',
+        'sw': 'Toa Mchango',
+    },
+    'Morning Mass': {
+        'fr': 'Messe du matin',
+        'rw': 'Misa ya mu gitondo',
+        'sw': 'Misa ya asubuhi',
+    },
+    'Evening Mass': {
+        'fr': 'Messe du soir',
+        'rw': 'Misa ya nimugoroba',
+        'sw': 'Misa ya jioni',
+    },
+    'Add to calendar': {
+        'fr': "Ajouter à l'agenda",
+        'rw': "Shyira kuri kalendari",
+        'sw': 'Ongeza kwenye kalenda',
+    },
+    'Ruhango Divine Mercy Sanctuary': {
+        'fr': 'Sanctuaire de la Divine Miséricorde de Ruhango',
+        'rw': "Icyicaro cy'Ubuntu bw’Imana cya Ruhango",
+        'sw': 'Makao ya Rehema ya Mungu Ruhango',
+    },
+    'Ruhango Divine Mercy Sanctuary has a rich history rooted in faith and community. Established in the early 20th century, it has served as a beacon of hope and healing for countless individuals. The sanctuary is dedicated to promoting divine mercy and fostering a sense of unity among its members.': {
+        'fr': "Le Sanctuaire de la Divine Miséricorde de Ruhango possède une riche histoire ancrée dans la foi et la communauté. Établi au début du XXe siècle, il a servi de phare d'espoir et de guérison pour d'innombrables personnes. Le sanctuaire est dédié à promouvoir la divine miséricorde et à favoriser un sentiment d'unité parmi ses membres.",
+        'rw': 'Icyicaro cy’Ubuntu bw’Imana cya Ruhango gifite amateka akomeye ashingiye ku kwemera no ku muryango. Cyashinzwe mu ntangiriro z’ikinyejana cya 20, cyabaye icyitegererezo cy’icyizere n’ubuvugizi ku bantu benshi. Icyicaro cyiyemeje kwamamaza ubuntu bw’Imana no guteza imbere ubwuzuzanye mu bagize umuryango wacyo.',
+        'sw': 'Makao ya Rehema ya Mungu Ruhango yana historia tajiri iliyozingatia imani na jamii. Ilianzishwa mwanzoni mwa karne ya 20, imekuwa taa ya matumaini na uponyaji kwa watu wengi. Makao hayo yamejikita kukuza rehema ya Mungu na kuunda hisia ya umoja miongoni mwa wanachama wake.',
+    },
+    'Search': {
+        'fr': 'Rechercher',
+        'rw': 'Shakisha',
+        'sw': 'Tafuta',
+    },
+    'Search homilies, events, prayers…': {
+        'fr': 'Rechercher homélies, événements, prières…',
+        'rw': 'Shakisha inyigisho, ibikorwa, amasengesho…',
+        'sw': 'Tafuta mahubiri, matukio, sala…',
+    },
+    'No results found.': {
+        'fr': 'Aucun résultat trouvé.',
+        'rw': 'Nta bisubizo byabonetse.',
+        'sw': 'Hakuna matokeo yaliyopatikana.',
+    },
+}
+
+def compile_catalog(strings):
+    """
+    {english: {lang: text}} -> {lang: {english: text}}, English included.
+    Strings are trusted site copy (some carry &nbsp; or <br>), so they
+    are marked safe once here rather than on every render.
+    """
+    catalog = {lang: {} for lang in LANGUAGES}
+    for key, texts in strings.items():
+        catalog[DEFAULT_LANGUAGE][key] = mark_safe(key)
+        for lang in LANGUAGES:
+            if lang != DEFAULT_LANGUAGE:
+                catalog[lang][key] = mark_safe(texts.get(lang, key))
+    return catalog
+
+CATALOG = compile_catalog(UI_STRINGS)
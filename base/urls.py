@@ -14,10 +14,13 @@ urlpatterns = [
     path('healing-prayers/', healingPrayers, name='healingPrayers'),
     path('events/', events, name='events'),
     path('events/<int:id>/', eventDetails, name='eventDetails'),
+    path('calendar/<str:lang>/mass-schedule.ics', massScheduleFeed, name='massScheduleFeed'),
+    path('calendar/<str:lang>/events.ics', eventsFeed, name='eventsFeed'),
     path('rooms/', rooms, name='rooms'),
     path('room/<int:id>/', roomDetails, name='roomDetails'),
     path('testimonies/', testimonies, name='testimonies'),
     path('members/', members, name='members'),
     path('gallery/', gallery, name='gallery'),
+    path('search/', search, name='search'),
     path('donate/', donate, name='donate'),
-]  + static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)+ static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
\ No newline at end of file
+]  + static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
\ No newline at end of file
@@ -1,7 +1,21 @@
+import datetime
+from itertools import islice
 from base.models import *
-from django.http import HttpRequest, HttpResponse
+from urllib.parse import urlsplit
+from django.conf import settings
+from django.utils import timezone
+from base.cache import get_or_build
+from base.search import SearchResults
+from urllib.parse import urlencode
+from base.pagination import CURSOR, NUMBERED, CursorPage, numbered_page, paginate
+from base.schedule import occurrences
+from base.conditional import render_conditional, render_page
+from base.sampling import ROOM_POOL_SIZE, random_rooms, pick
+from django.http import Http404, HttpRequest, HttpResponse
+from django.urls import reverse
+from base.ical import calendar_response, vevent
+from base.translations import CATALOG
 from django.shortcuts import render, redirect, get_object_or_404
-from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
 
 SUPPORTED_LANGS = {
     "en": "English",
@@ -10,202 +24,236 @@ SUPPORTED_LANGS = {
     "sw": "Kiswahili",
 }
 
+# Signed cookie holding the chosen language (see DefaultLanguageMiddleware)
+LANG_COOKIE_NAME = "lang"
+LANG_COOKIE_SALT = "base.lang"
+LANG_COOKIE_MAX_AGE = 60 * 60 * 24 * 365
+
 def change_language(request: HttpRequest, lang_code: str) -> HttpResponse:
     """
-    Store the chosen language in the session and bounce the user back
-    to where they came from.  Defaults to English on funny business.
+    Remember the chosen language in a signed cookie and bounce the user
+    back to where they came from.  Defaults to English on funny business.
+
+    Under a language-prefixed URL (/fr/change-language/en/) the user is
+    sent to the same page under the new prefix instead.
     """
     lang_code = lang_code.lower()
     if lang_code not in SUPPORTED_LANGS:
         lang_code = "en"
 
-    request.session["lang"] = lang_code
-    return redirect(request.META.get("HTTP_REFERER", "/"))
+    referer = request.META.get("HTTP_REFERER", "/")
+    url_lang = getattr(request, "url_lang", None)
+    if url_lang:
+        path = urlsplit(referer).path
+        if not path.startswith(f"/{url_lang}/"):
+            return redirect(f"/{lang_code}/")
+        return redirect(f"/{lang_code}/" + path[len(url_lang) + 2:])
+
+    response = redirect(referer)
+    response.set_signed_cookie(
+        LANG_COOKIE_NAME, lang_code, salt=LANG_COOKIE_SALT,
+        max_age=LANG_COOKIE_MAX_AGE, samesite="Lax",
+    )
+    return response
+
+def get_lang(request: HttpRequest) -> str:
+    """
+    The visitor's active language code, as resolved by
+    DefaultLanguageMiddleware (URL prefix, cookie, session, Accept-Language).
+    """
+    lang = getattr(request, "lang", None) or getattr(request, "url_lang", None)
+    if lang is None and hasattr(request, "session"):
+        lang = request.session.get("lang")
+    return lang if lang in SUPPORTED_LANGS else "en"
+
+def build_home_context(lang: str, today: datetime.date) -> dict:
+    """
+    Evaluate every home page section into plain lists so the result can be
+    pickled into the cache and rendered later without touching the DB.
+    Translated models only load `lang`'s title and excerpt columns.
+    """
+    window = datetime.timedelta(weeks=settings.MASS_SCHEDULE_WEEKS)
+    return {
+        "schedules":   list(islice(occurrences(today, today + window), 4)),
+        "homilies":    list(Homily.objects.for_cards(lang).order_by("-id")[:4]),
+        "events":      list(Event.objects.for_cards(lang).order_by("-event_date", "-created_at")[:4]),
+        "adverts":     list(Advertisement.objects.for_cards(lang).order_by("-published_at", "-created_at")[:4]),
+        "room_pool":   random_rooms(ROOM_POOL_SIZE, queryset=Room.objects.with_listing_data()),
+        "testimonies": list(Testimony.objects.filter(status='published').order_by("-created_at")[:4]),
+        "gallery":     list(Gallery.objects.all().order_by("-created_at")[:6]),
+        "priests":     list(Member.objects.filter(role='Priest')[:4]),
+        "healing_prayers": list(HealingPrayer.objects.for_cards(lang).order_by("-created_at")[:4]),
+    }
 
 def home(request):
     """
-    Home page: latest 4 MassSchedules, Homilies, Events, Advertisements,
+    Home page: next 4 Masses, latest 4 Homilies, Events, Advertisements,
     4 random Rooms, 4 latest Testimonies, Gallery, and Priests.
-    """
-    schedules = MassSchedule.objects.all().order_by("-id")[:4]
-    homilies  = Homily.objects.all().order_by("-id")[:4]
-    events    = Event.objects.all().order_by("-event_date", "-created_at")[:4]
-    adverts   = Advertisement.objects.all().order_by("-published_at", "-created_at")[:4]
-    rooms     = Room.objects.order_by("?")[:4]
-    testimonies = Testimony.objects.filter(status='published').order_by("-created_at")[:4]
-    gallery   = Gallery.objects.all().order_by("-created_at")[:6]
-    priests   = Member.objects.filter(role='Priest')[:4]
-    healing_prayers = HealingPrayer.objects.all().order_by("-created_at")[:4]
 
-    context = {
-        "schedules":   schedules,
-        "homilies":    homilies,
-        "events":      events,
-        "adverts":     adverts,
-        "rooms":       rooms,
-        "testimonies": testimonies,
-        "gallery":     gallery,
-        "priests":     priests,
-        "healing_prayers": healing_prayers,
-    }
+    The context is cached per language and day and rebuilt only after one of
+    the models above changes (see base.signals), so a cache hit costs no
+    queries.
+    The 4 rooms are drawn per request from a cached pool of random rooms.
+    """
+    lang = get_lang(request)
+    today = timezone.localdate()
+    context = dict(get_or_build(
+        "home", (lang, today.isoformat()),
+        lambda: build_home_context(lang, today),
+        timeout=settings.HOME_CACHE_TIMEOUT,
+    ))
+    context["rooms"] = pick(context.pop("room_pool"), 4)
 
     return render(request, "pages/index.html", context)
 
 
 def massSchedule(request):
     """
-    Fetch MassSchedule entries in reverse insertion order,
-    paginate at 12 per page, and render the schedule page
-    with a sliding window of ±3 page links.
+    The Masses of MASS_SCHEDULE_WEEKS weeks from ?cursor=<date> (today by
+    default), expanded from the recurring rules by base.schedule.  The
+    cursor is a plain date, so every page costs the same few queries however
+    long the schedule's history grows.
     """
-    schedule_list = MassSchedule.objects.all().order_by('-id')
-    paginator     = Paginator(schedule_list, 12)
-    page_number   = request.GET.get('page', 1)
-
+    today = timezone.localdate()
+    window = datetime.timedelta(weeks=settings.MASS_SCHEDULE_WEEKS)
+    try:
+        start = max(datetime.date.fromisoformat(request.GET.get('cursor', '')), today)
+    except (ValueError, OverflowError):
+        start = today
     try:
-        schedules = paginator.page(page_number)
-    except PageNotAnInteger:
-        schedules = paginator.page(1)
-    except EmptyPage:
-        schedules = paginator.page(paginator.num_pages)
-
-    current   = schedules.number
-    total     = paginator.num_pages
-    start     = max(current - 3, 1)
-    end       = min(current + 3, total)
-    page_range = range(start, end + 1)
-    
+        end = start + window
+    except OverflowError:
+        start, end = today, today + window
+
+    schedules = CursorPage(
+        list(occurrences(start, end)),
+        next_cursor=end.isoformat(),
+        previous_cursor=max(start - window, today).isoformat() if start > today else None,
+    )
     context = {
-        'schedules':  schedules,
-        'page_range': page_range,
+        'schedules': schedules,
+        'page_obj': schedules,
+        'pagination_mode': CURSOR,
     }
-
-    return render(request, 'pages/mass-schedule.html', context)
+    return render_conditional(
+        request, 'pages/mass-schedule.html', context, list(schedules),
+        get_lang(request), start.isoformat(),
+    )
 
 def homilies(request):
     """
-    List homilies, newest first, paginated at 8 per page.
-    Only show page links within ±3 of the current page.
+    List homilies, newest first, paginated at 6 per page.
+    Only the active language's title and excerpt columns are loaded.
     """
-    homily_list = Homily.objects.all().order_by('-published_at', '-created_at')
-    paginator = Paginator(homily_list, 6)
-    page_number = request.GET.get('page', 1)
+    homily_list = Homily.objects.for_cards(get_lang(request))
+    context = paginate(request, homily_list, 6, ('-published_at', '-created_at'))
 
-    try:
-        page_obj = paginator.page(page_number)
-    except PageNotAnInteger:
-        page_obj = paginator.page(1)
-    except EmptyPage:
-        page_obj = paginator.page(paginator.num_pages)
-
-    current = page_obj.number
-    total   = paginator.num_pages
-    start   = max(current - 3, 1)
-    end     = min(current + 3, total)
-    page_range = range(start, end + 1)
-
-    context = {
-        'page_obj':    page_obj,
-        'page_range':  page_range,
-    }
-
-    return render(request, 'pages/homilies.html', context)
+    return render_page(request, 'pages/homilies.html', context, get_lang(request))
 
 def healingPrayers(request):
     """
     Fetch Healing Prayers with pagination, ordering by the latest.
     """
-    prayer_list = HealingPrayer.objects.all().order_by('-created_at')  # Ordering by creation date, latest first
-    paginator = Paginator(prayer_list, 12)  # 12 prayers per page
-    page_number = request.GET.get('page', 1)
-
-    try:
-        page_obj = paginator.page(page_number)
-    except PageNotAnInteger:
-        page_obj = paginator.page(1)
-    except EmptyPage:
-        page_obj = paginator.page(paginator.num_pages)
-
-    current = page_obj.number
-    total = paginator.num_pages
-    start = max(current - 3, 1)
-    end = min(current + 3, total)
-    page_range = range(start, end + 1)
-
-    context = {
-        'page_obj': page_obj,
-        'page_range': page_range,
-    }
+    prayer_list = HealingPrayer.objects.for_cards(get_lang(request))
+    context = paginate(request, prayer_list, 12, ('-created_at',))  # 12 prayers per page, latest first
 
-    return render(request, 'pages/healing-prayers.html', context)
+    return render_page(request, 'pages/healing-prayers.html', context, get_lang(request))
 
 def events(request):
     """
     Paginated Events listing.
     """
-    event_list = Event.objects.all().order_by('-event_date', '-created_at')
-    paginator  = Paginator(event_list, 12)
-    page       = request.GET.get('page', 1)
-
-    try:
-        page_obj = paginator.page(page)
-    except PageNotAnInteger:
-        page_obj = paginator.page(1)
-    except EmptyPage:
-        page_obj = paginator.page(paginator.num_pages)
-
-    current    = page_obj.number
-    total      = paginator.num_pages
-    start      = max(current - 3, 1)
-    end        = min(current + 3, total)
-    page_range = range(start, end + 1)
-
-    context = {
-        'page_obj':   page_obj,
-        'page_range': page_range,
-    }
+    event_list = Event.objects.for_cards(get_lang(request))
+    context = paginate(request, event_list, 12, ('-event_date', '-created_at'))
 
-    return render(request, 'pages/events/index.html', context)
+    return render_page(request, 'pages/events/index.html', context, get_lang(request))
 
 def eventDetails(request, id):
     """
     Show a single Event’s full details.
     """
-    event = get_object_or_404(Event, pk=id)
+    event = get_object_or_404(Event.objects.for_lang(get_lang(request)), pk=id)
 
     context = {
         'event': event,
     }
 
-    return render(request, 'pages/events/show.html', context)
+    return render_conditional(request, 'pages/events/show.html', context, [event], get_lang(request))
+
+def calendar_window(lang):
+    if lang not in SUPPORTED_LANGS:
+        raise Http404("No calendar in that language.")
+    today = timezone.localdate()
+    return (
+        today - datetime.timedelta(days=settings.CALENDAR_PAST_DAYS),
+        today + datetime.timedelta(days=settings.CALENDAR_FUTURE_DAYS),
+    )
+
+def massScheduleFeed(request, lang):
+    """
+    The Masses from CALENDAR_PAST_DAYS ago to CALENDAR_FUTURE_DAYS ahead
+    as an iCalendar feed in `lang`.  A rule's Mass keeps its UID when it is
+    moved, so calendar apps update it in place.
+    """
+    start, end = calendar_window(lang)
+    host = request.get_host().split(":")[0]
+
+    def events():
+        for mass in occurrences(start, end):
+            if mass.rule_id is not None:
+                uid = f"mass-{mass.rule_id}-{mass.date:%Y%m%d}@{host}"
+            else:
+                uid = f"mass-once-{mass.pk}@{host}"
+            label = mass.get_mass_type_display()
+            yield vevent(
+                uid, mass.updated_at, mass.date, mass.start_time, mass.end_time,
+                summary=CATALOG[lang].get(label, label),
+            )
+
+    return calendar_response(
+        request, f"mass-schedule-{lang}.ics", CATALOG[lang].get("Mass Schedule", "Mass Schedule"),
+        lang, start, events(),
+        MassSchedule.objects.filter(date__gte=start, date__lt=end), MassRule.objects.all(),
+    )
+
+def eventsFeed(request, lang):
+    """
+    The Events from CALENDAR_PAST_DAYS ago to CALENDAR_FUTURE_DAYS ahead
+    as an iCalendar feed in `lang`, read over the event_date index in
+    chunks while the response streams.
+    """
+    start, end = calendar_window(lang)
+    host = request.get_host().split(":")[0]
+    queryset = Event.objects.filter(event_date__gte=start, event_date__lt=end)
+
+    def events():
+        rows = (
+            queryset.order_by("event_date", "created_at")
+            .only("id", "event_date", "start_time", "end_time", f"title_{lang}", f"excerpt_{lang}", "updated_at")
+            .iterator(chunk_size=500)
+        )
+        for event in rows:
+            yield vevent(
+                f"event-{event.pk}@{host}", event.updated_at, event.event_date,
+                event.start_time, event.end_time,
+                summary=getattr(event, f"title_{lang}"),
+                description=getattr(event, f"excerpt_{lang}"),
+                url=request.build_absolute_uri(f"/{lang}{reverse('base:eventDetails', args=[event.pk])}"),
+            )
+
+    return calendar_response(
+        request, f"events-{lang}.ics", CATALOG[lang].get("Events", "Events"),
+        lang, start, events(), queryset,
+    )
 
 def rooms(request):
     """
     Fetch Rooms with pagination, ordering by the latest.
     """
-    room_list = Room.objects.all().order_by('-created_at')  # Ordering by creation date, latest first
-    paginator = Paginator(room_list, 12)  # 12 rooms per page
-    page_number = request.GET.get('page', 1)
+    room_list = Room.objects.with_listing_data()
+    context = paginate(request, room_list, 12, ('-created_at',))  # 12 rooms per page, latest first
 
-    try:
-        page_obj = paginator.page(page_number)
-    except PageNotAnInteger:
-        page_obj = paginator.page(1)
-    except EmptyPage:
-        page_obj = paginator.page(paginator.num_pages)
-
-    current = page_obj.number
-    total = paginator.num_pages
-    start = max(current - 3, 1)
-    end = min(current + 3, total)
-    page_range = range(start, end + 1)
-
-    context = {
-        'page_obj': page_obj,
-        'page_range': page_range,
-    }
-
-    return render(request, 'pages/rooms/index.html', context)
+    return render_page(request, 'pages/rooms/index.html', context, get_lang(request))
 
 def roomDetails(request, id):
     """
@@ -213,10 +261,10 @@ def roomDetails(request, id):
     Add pagination for related or nearby rooms if needed.
     """
     # Retrieve the room details by id
-    room = get_object_or_404(Room, id=id)
+    room = get_object_or_404(Room.objects.with_listing_data(), id=id)
 
     # Optionally: Fetch other rooms for related content, limit to 3 (excluding current room)
-    related_rooms = Room.objects.exclude(id=id).order_by("?")[:3]  # Random related rooms
+    related_rooms = random_rooms(3, exclude=room.id, queryset=Room.objects.with_listing_data())  # Random related rooms, sampled from cached IDs
 
     # Pagination can be added for a specific list of related rooms if required, for now, showing just 3 related rooms.
 
@@ -225,91 +273,54 @@ def roomDetails(request, id):
         "related_rooms": related_rooms,  # Rooms similar to the selected room
     }
 
-    return render(request, 'pages/rooms/show.html', context)
+    # Validators cover the room itself; the random related rooms may differ
+    return render_conditional(request, 'pages/rooms/show.html', context, [room], get_lang(request))
 
 def testimonies(request):
     """
-    Fetch testimonies and paginate them at 12 per page.
+    Fetch published testimonies and paginate them at 12 per page.
     """
-    testimony_list = Testimony.objects.filter(status="published").order_by('-created_at')
-    paginator = Paginator(testimony_list, 12)  # Paginate testimonies at 12 per page
-    page_number = request.GET.get('page', 1)
-
-    try:
-        page_obj = paginator.page(page_number)
-    except PageNotAnInteger:
-        page_obj = paginator.page(1)
-    except EmptyPage:
-        page_obj = paginator.page(paginator.num_pages)
-
-    current = page_obj.number
-    total   = paginator.num_pages
-    start   = max(current - 3, 1)
-    end     = min(current + 3, total)
-    page_range = range(start, end + 1)
-
-    context = {
-        'page_obj':    page_obj,
-        'page_range':  page_range,
-    }
+    testimony_list = Testimony.objects.filter(status="published")
+    context = paginate(request, testimony_list, 12, ('-created_at',))
 
-    return render(request, 'pages/testimonies.html', context)
+    return render_page(request, 'pages/testimonies.html', context, get_lang(request))
 
 def members(request):
     """
     Fetch members who have the role of 'Priest' and paginate them at 12 per page.
     """
-    member_list = Member.objects.filter(role='Priest').order_by('-id')  # Adjust the role as needed
-    paginator = Paginator(member_list, 12)  # Paginate at 12 per page
-    page_number = request.GET.get('page', 1)
-
-    try:
-        page_obj = paginator.page(page_number)
-    except PageNotAnInteger:
-        page_obj = paginator.page(1)
-    except EmptyPage:
-        page_obj = paginator.page(paginator.num_pages)
-
-    current = page_obj.number
-    total   = paginator.num_pages
-    start   = max(current - 3, 1)
-    end     = min(current + 3, total)
-    page_range = range(start, end + 1)
-
-    context = {
-        'page_obj':    page_obj,
-        'page_range':  page_range,
-    }
+    member_list = Member.objects.filter(role='Priest')  # Adjust the role as needed
+    context = paginate(request, member_list, 12, ('-id',))
 
-    return render(request, 'pages/members.html', context)
+    return render_page(request, 'pages/members.html', context, get_lang(request))
 
 def gallery(request):
     """
     Fetch gallery images and paginate them at 12 per page.
     """
-    gallery_list = Gallery.objects.all().order_by('-created_at')  # Order images by created date
-    paginator = Paginator(gallery_list, 12)  # Paginate images at 12 per page
-    page_number = request.GET.get('page', 1)
+    gallery_list = Gallery.objects.all()
+    context = paginate(request, gallery_list, 12, ('-created_at',))  # Newest images first
 
-    try:
-        page_obj = paginator.page(page_number)
-    except PageNotAnInteger:
-        page_obj = paginator.page(1)
-    except EmptyPage:
-        page_obj = paginator.page(paginator.num_pages)
-
-    current = page_obj.number
-    total   = paginator.num_pages
-    start   = max(current - 3, 1)
-    end     = min(current + 3, total)
-    page_range = range(start, end + 1)
+    return render_page(request, 'pages/gallery.html', context, get_lang(request))
+
+def search(request):
+    """
+    Full-text search over homilies, events, adverts, healing prayers and
+    gallery captions in the visitor's language, best matches first, 10
+    per page.
+    """
+    query = request.GET.get("q", "").strip()[:200]
+    results = SearchResults(query, get_lang(request))
+    page_obj, page_range = numbered_page(results, 10, request.GET.get("page", 1))
 
     context = {
-        'page_obj':   page_obj,
-        'page_range': page_range,
+        "query": query,
+        "page_obj": page_obj,
+        "page_range": page_range,
+        "pagination_mode": NUMBERED,
+        "page_query": urlencode({"q": query}) + "&",
     }
-
-    return render(request, 'pages/gallery.html', context)
+    return render(request, 'pages/search.html', context)
 
 def donate(request):
     return render(request, 'pages/donate.html')
\ No newline at end of file
@@ -39,6 +39,7 @@ INSTALLED_APPS = [
     # Third party
     'corsheaders',
     "whitenoise.runserver_nostatic",
+    'rest_framework',
     'drf_yasg',
     'django.contrib.humanize',
     'ckeditor',
@@ -52,7 +53,9 @@ MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
+    'base.middleware.LanguagePrefixMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
+    'base.middleware.DefaultLanguageMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
@@ -73,6 +76,7 @@ TEMPLATES = [
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
+                'base.context_processors.language',
             ],
         },
     },
@@ -114,6 +118,106 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+
+# The cache MUST be shared by every process that serves or changes content:
+# all gunicorn workers, the process_images worker and the management
+# commands.  Content changes invalidate cached pages, API responses and the
+# home payload by bumping a version key (base.cache.bump_version); in a
+# per-process cache such as LocMemCache only the process that made the
+# change would see the bump, and the other workers would serve stale pages
+# until their entries expire.
+#
+# Set CACHE_URL (e.g. redis://127.0.0.1:6379/0) to use Redis, which every
+# host can reach.  Without it the cache lives in files under CACHE_DIR,
+# which is shared by all the processes of a single host.
+CACHE_URL = os.getenv('CACHE_URL')
+
+if CACHE_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': CACHE_URL,
+            'KEY_PREFIX': 'smr',
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': os.getenv('CACHE_DIR') or os.path.join(BASE_DIR, 'cache'),
+            'OPTIONS': {
+                # Cached pages, API responses and home payloads per language
+                'MAX_ENTRIES': 10000,
+            },
+        }
+    }
+
+# Seconds a cached home page payload lives before it is rebuilt even without
+# a model change; keeps the random room selection rotating.
+HOME_CACHE_TIMEOUT = 60 * 15
+
+# Public list views: 'cursor' (keyset, no COUNT/OFFSET) or 'numbered'.
+# Either mode is still reachable through ?cursor= or ?page= links.
+PAGINATION_MODE = 'cursor'
+
+# Weeks of Masses per page of the mass schedule, expanded from the
+# recurring rules (base.schedule); the home page shows the first four.
+MASS_SCHEDULE_WEEKS = 2
+
+# Seconds a full page served under a language prefix (/fr/...) is cached
+# for anonymous visitors; content changes invalidate it sooner.
+PAGE_CACHE_TIMEOUT = 60 * 5
+
+# Admin changelists for large tables (base.changelist): past the threshold,
+# totals come from planner statistics (Postgres, MySQL) or a cached
+# COUNT(*), recounted when a page lies past their end, and the
+# location/amenity filter choices are cached for ADMIN_CACHE_TIMEOUT seconds
+# (at most ADMIN_FILTER_MAX_CHOICES of them, the most common).
+ADMIN_PERFORMANCE_MODE = True
+ADMIN_COUNT_THRESHOLD = 10000
+ADMIN_CACHE_TIMEOUT = 60 * 5
+ADMIN_FILTER_MAX_CHOICES = 100
+
+# JSON API (base.api), mounted under API_URL + version: read-only public
+# content, plus anonymous booking requests (POST bookings/, throttled to
+# BOOKING_RATE).  The language comes from ?lang=, so no session or cookie
+# is read.
+API_URL = '/api/'
+API_CACHE_TIMEOUT = 60 * 15
+
+# iCalendar feeds (base.ical) of the Masses and Events from CALENDAR_PAST_DAYS
+# ago to CALENDAR_FUTURE_DAYS ahead.  The language is in the URL, so like
+# the API they never read the session.  Calendar apps are asked to poll
+# every CALENDAR_MAX_AGE seconds and mostly get a 304.
+CALENDAR_URL = '/calendar/'
+CALENDAR_PAST_DAYS = 30
+CALENDAR_FUTURE_DAYS = 365
+CALENDAR_MAX_AGE = 60 * 60
+
+# Room bookings (base.bookings).  The availability search relies on no stay
+# being longer than BOOKING_MAX_NIGHTS, so lowering it needs existing longer
+# stays shortened first.  Anonymous visitors may request BOOKING_RATE of them.
+BOOKING_MAX_NIGHTS = 30
+BOOKING_RATE = '20/hour'
+
+REST_FRAMEWORK = {
+    'DEFAULT_VERSIONING_CLASS': 'rest_framework.versioning.NamespaceVersioning',
+    'ALLOWED_VERSIONS': ('v1',),
+    'DEFAULT_AUTHENTICATION_CLASSES': [],
+    'DEFAULT_PERMISSION_CLASSES': ['rest_framework.permissions.AllowAny'],
+    'UNAUTHENTICATED_USER': None,
+    'DEFAULT_THROTTLE_RATES': {
+        'bookings': BOOKING_RATE,
+    },
+    'DEFAULT_RENDERER_CLASSES': [
+        'rest_framework.renderers.JSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
@@ -156,8 +260,36 @@ STATICFILES_DIRS = (
 
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, "media")
-STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
-WHITENOISE_AUTOREFRESH = True
+
+# Media responses (base.media.serve_media) may be cached this long; they
+# are revalidated with ETag/Last-Modified afterwards.
+MEDIA_CACHE_MAX_AGE = 60 * 60 * 24 * 30
+
+# Let the front proxy send media files: None (Django streams them),
+# 'x-accel-redirect' (nginx) or 'x-sendfile' (Apache, lighttpd).
+MEDIA_SENDFILE = os.getenv('MEDIA_SENDFILE') or None
+
+# nginx `internal` location aliased to MEDIA_ROOT, for X-Accel-Redirect
+MEDIA_ACCEL_PREFIX = '/protected-media/'
+
+# `manage.py build_assets` runs collectstatic through base.storage: files
+# get content-hashed names listed in staticfiles.json plus .br/.gz copies.
+# WhiteNoise serves the hashed names with a far-future immutable
+# Cache-Control, picking the precompressed copy the client accepts.
+STATICFILES_STORAGE = 'base.storage.StaticFilesStorage'
+
+# Read the static files once at startup instead of checking the disk on
+# every request.  DEBUG is still on here, and WhiteNoise would otherwise
+# follow it; files added while runserver runs need a restart.
+WHITENOISE_AUTOREFRESH = False
+
+# Scripts every page loads at the end of <body>; layouts/app.html preloads
+# them from the head.  The stylesheets are linked in the head already, so
+# preloading them would gain nothing.
+STATIC_PRELOAD = (
+    ('js/vendors.js', 'script'),
+    ('js/main.js', 'script'),
+)
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/4.2/ref/settings/#default-auto-field
@@ -1,10 +1,27 @@
 from django.contrib import admin
 from django.conf import settings
-from django.urls import path, include
+from django.urls import path, re_path, include
 from django.conf.urls.static import static
+from base.media import serve_media
+from base.api import router
+from drf_yasg import openapi
+from drf_yasg.views import get_schema_view
+
+api_url = settings.API_URL.lstrip('/')
+
+schema_view = get_schema_view(
+    openapi.Info(title="SMR API", default_version="v1", description="Read-only public content, and booking requests for rooms."),
+    public=True,
+)
+
+api_urls = router.urls + [
+    path('docs/', schema_view.with_ui('swagger', cache_timeout=0), name='docs'),
+]
 
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('', include('base.urls')),
     path('ckeditor/', include('ckeditor_uploader.urls')),
-] + static(settings.STATIC_URL, document_root=settings.STATIC_ROOT) + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+    path(f'{api_url}v1/', include((api_urls, 'api'), namespace='v1')),
+    re_path(rf"^{settings.MEDIA_URL.lstrip('/')}(?P<path>.+)$", serve_media, name='media'),
+] + static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)